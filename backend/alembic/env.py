@@ -9,6 +9,8 @@ from db.session import Base
 from models.user import User
 from models.collection import Collection
 from models.project import Project
+from models.organization import Organization
+from models.vto_job import VtoJob
 
 config = context.config
 settings = get_settings()
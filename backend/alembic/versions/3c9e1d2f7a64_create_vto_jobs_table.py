@@ -0,0 +1,56 @@
+"""create vto jobs table
+
+Revision ID: 3c9e1d2f7a64
+Revises: 1f0b3a0b4c4e
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = '3c9e1d2f7a64'
+down_revision: Union[str, None] = '1f0b3a0b4c4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('vto_jobs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('project_id', sa.UUID(), nullable=True),
+    sa.Column('status', sa.String(length=16), server_default='PENDING', nullable=False),
+    sa.Column('worker', sa.Text(), nullable=True),
+    sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('prompt', sa.Text(), nullable=False),
+    sa.Column('input_images', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('image_count', sa.Integer(), nullable=False),
+    sa.Column('temperature', sa.Float(), nullable=False),
+    sa.Column('top_p', sa.Float(), nullable=False),
+    sa.Column('aspect_ratio', sa.String(length=16), nullable=False),
+    sa.Column('completed_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('success_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('result_images', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('usage', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('fail_reason', sa.Text(), nullable=True),
+    sa.Column('queued_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('started_at', sa.TIMESTAMP(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.TIMESTAMP(timezone=True), nullable=True),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # 워커의 SKIP LOCKED 대기열 조회 / 사용자별 상태 조회
+    op.create_index('ix_vto_jobs_status_queued_at', 'vto_jobs', ['status', 'queued_at'], unique=False)
+    op.create_index('ix_vto_jobs_user_id_status', 'vto_jobs', ['user_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_vto_jobs_user_id_status', table_name='vto_jobs')
+    op.drop_index('ix_vto_jobs_status_queued_at', table_name='vto_jobs')
+    op.drop_table('vto_jobs')
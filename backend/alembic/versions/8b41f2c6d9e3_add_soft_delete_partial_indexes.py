@@ -0,0 +1,51 @@
+"""add soft delete partial indexes
+
+Revision ID: 8b41f2c6d9e3
+Revises: 3c9e1d2f7a64
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '8b41f2c6d9e3'
+down_revision: Union[str, None] = '3c9e1d2f7a64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# api/v1/* 조회는 모두 deleted_at IS NULL 조건을 포함하므로 삭제되지 않은 행만 인덱싱
+# (이름, 테이블, 컬럼) - 목록은 (created_at DESC, id DESC) 키셋 정렬과 같은 순서
+PARTIAL_INDEXES = [
+    ('ix_collections_user_id_created_at', 'collections', ['user_id', sa.text('created_at DESC'), sa.text('id DESC')]),
+    ('ix_collections_user_id_name', 'collections', ['user_id', 'name']),
+    ('ix_projects_user_id_created_at', 'projects', ['user_id', sa.text('created_at DESC'), sa.text('id DESC')]),
+    ('ix_projects_collection_id_created_at', 'projects', ['collection_id', sa.text('created_at DESC'), sa.text('id DESC')]),
+    ('ix_projects_user_id_name', 'projects', ['user_id', 'name']),
+    ('ix_organizations_created_at', 'organizations', [sa.text('created_at DESC'), sa.text('id DESC')]),
+    ('ix_organizations_name', 'organizations', ['name']),
+]
+
+
+def upgrade() -> None:
+    # 운영 테이블 쓰기 잠금을 피하기 위해 트랜잭션 밖에서 CONCURRENTLY로 생성
+    with op.get_context().autocommit_block():
+        # 기존 전체 인덱스(ix_organizations_name)를 부분 인덱스로 교체
+        op.drop_index('ix_organizations_name', table_name='organizations', postgresql_concurrently=True)
+        for name, table, columns in PARTIAL_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_where=sa.text('deleted_at IS NULL'),
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(PARTIAL_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+        op.create_index('ix_organizations_name', 'organizations', ['name'], unique=False, postgresql_concurrently=True)
@@ -0,0 +1,100 @@
+"""add unique partial name indexes
+
+Revision ID: c4e7a19b2d05
+Revises: 8b41f2c6d9e3
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+import logging
+
+from alembic import context, op
+import sqlalchemy as sa
+
+revision: str = 'c4e7a19b2d05'
+down_revision: Union[str, None] = '8b41f2c6d9e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+# 생성 API의 INSERT ... ON CONFLICT 대상 (삭제되지 않은 행만 유니크)
+# (기존 인덱스, 새 유니크 인덱스, 테이블, 컬럼, 중복 판단 그룹, 중복 행 처리)
+# - rename: 사용자별 이름이라 가장 먼저 만든 행만 이름을 유지하고 나머지는 이름 뒤에 id 앞 8자리를 붙여 구분
+# - soft_delete: 조직은 이름으로 조회(get_or_create_organization)되므로 이름을 바꾸지 않고 가장 먼저 만든 행만 남김
+UNIQUE_INDEXES = [
+    ('ix_collections_user_id_name', 'uq_collections_user_id_name', 'collections', ['user_id', 'name'], 'user_id, name', 'rename'),
+    ('ix_projects_user_id_name', 'uq_projects_user_id_name', 'projects', ['user_id', 'name'], 'user_id, name', 'rename'),
+    ('ix_organizations_name', 'uq_organizations_name', 'organizations', ['name'], 'name', 'soft_delete'),
+]
+
+RESOLVE_SQL = {
+    'rename': "name = t.name || ' (' || left(t.id::text, 8) || ')'",
+    'soft_delete': 'deleted_at = now()',
+}
+
+
+def _duplicates_sql(table: str, partition: str) -> str:
+    """가장 먼저 만든 행을 제외한 중복 행"""
+    return f"""
+        SELECT id, name FROM (
+            SELECT id, name, row_number() OVER (PARTITION BY {partition} ORDER BY created_at, id) AS rn
+            FROM {table}
+            WHERE deleted_at IS NULL AND name IS NOT NULL
+        ) AS ranked
+        WHERE ranked.rn > 1
+    """
+
+
+def _report_duplicates(table: str, partition: str, action: str) -> None:
+    """정리 대상 중복 행을 변경 전에 로그로 남김 (오프라인 --sql 모드는 조회 불가라 생략)"""
+    if context.is_offline_mode():
+        return
+    rows = op.get_bind().execute(sa.text(_duplicates_sql(table, partition) + ' ORDER BY name, id')).all()
+    if rows:
+        logger.warning(f"{table}: 중복 이름 {len(rows)}개 행 {action} 처리")
+    for row in rows:
+        logger.warning(f"{table}: {action} id={row.id} name={row.name!r}")
+
+
+def upgrade() -> None:
+    # 배포 순서: 이 마이그레이션 적용 후 ON CONFLICT를 쓰는 새 앱 배포 (alembic/README.md 참고)
+    for _, _, table, _, partition, action in UNIQUE_INDEXES:
+        _report_duplicates(table, partition, action)
+        op.execute(
+            f"""
+            UPDATE {table} AS t
+            SET {RESOLVE_SQL[action]}
+            FROM ({_duplicates_sql(table, partition)}) AS d
+            WHERE t.id = d.id
+            """
+        )
+
+    with op.get_context().autocommit_block():
+        for old_name, new_name, table, columns, _, _ in UNIQUE_INDEXES:
+            # CREATE UNIQUE INDEX CONCURRENTLY가 실패하면 INVALID 인덱스가 남으므로 재실행 시 먼저 제거
+            op.drop_index(new_name, table_name=table, postgresql_concurrently=True, if_exists=True)
+            op.create_index(
+                new_name,
+                table,
+                columns,
+                unique=True,
+                postgresql_where=sa.text('deleted_at IS NULL'),
+                postgresql_concurrently=True,
+            )
+            op.drop_index(old_name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    # 이름 변경/삭제 처리된 중복 행은 되돌리지 않음
+    with op.get_context().autocommit_block():
+        for old_name, new_name, table, columns, _, _ in reversed(UNIQUE_INDEXES):
+            op.create_index(
+                old_name,
+                table,
+                columns,
+                unique=False,
+                postgresql_where=sa.text('deleted_at IS NULL'),
+                postgresql_concurrently=True,
+            )
+            op.drop_index(new_name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Depends
+from db.pool_metrics import DbPoolStats
+from db.session import get_pool_stats
+from models.user import User
+from core.deps import get_current_admin_user
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/db-pool", response_model=DbPoolStats)
+async def get_db_pool_stats(
+    _: User = Depends(get_current_admin_user),
+):
+    # 워커 수 / DB_POOL_SIZE / DB_MAX_OVERFLOW 산정용 커넥션 풀 지표
+    return get_pool_stats()
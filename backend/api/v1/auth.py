@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from db.session import get_db
 from models.user import User
 from models.collection import Collection
 from schemas.auth import SignupRequest, LoginRequest, OAuthRequest, TokenResponse, UserResponse
-from core.security import create_access_token, get_password_hash, verify_password
+from core.security import create_access_token, get_password_hash, verify_password, user_token_claims
+from core.user_cache import invalidate_user
 from core.exceptions import UnauthorizedException, BadRequestException
 import httpx
 from configs import settings
@@ -19,29 +21,28 @@ async def signup(
     request: SignupRequest,
     db: AsyncSession = Depends(get_db)
 ):
+    # 이메일 중복은 users.email 유니크 제약 충돌로 판단 (INSERT 1회)
     result = await db.execute(
-        select(User).where(User.email == request.email, User.deleted_at.is_(None))
+        insert(User)
+        .values(
+            email=request.email,
+            name=request.name,
+            last_name=request.last_name,
+            language=request.language,
+            phone_number=request.phone_number,
+            organization_name=request.organization_name,
+            terms_agreed=request.terms_agreed,
+            privacy_agreed=request.privacy_agreed,
+            marketing_agreed=request.marketing_agreed,
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User)
     )
-    existing_user = result.scalar_one_or_none()
+    new_user = result.scalar_one_or_none()
     
-    if existing_user:
+    if new_user is None:
         raise BadRequestException("Email already registered")
     
-    new_user = User(
-        email=request.email,
-        name=request.name,
-        last_name=request.last_name,
-        language=request.language,
-        phone_number=request.phone_number,
-        organization_name=request.organization_name,
-        terms_agreed=request.terms_agreed,
-        privacy_agreed=request.privacy_agreed,
-        marketing_agreed=request.marketing_agreed,
-    )
-    
-    db.add(new_user)
-    await db.flush()
-    
     # 기본 Collection 자동 생성
     default_collection = Collection(
         user_id=new_user.id,
@@ -50,9 +51,8 @@ async def signup(
     db.add(default_collection)
     
     await db.commit()
-    await db.refresh(new_user)
     
-    access_token = create_access_token(data={"sub": str(new_user.id)})
+    access_token = create_access_token(data=user_token_claims(new_user))
     
     return TokenResponse(
         access_token=access_token,
@@ -73,7 +73,7 @@ async def login(
     if not user:
         raise UnauthorizedException("Invalid email or password")
     
-    access_token = create_access_token(data={"sub": str(user.id)})
+    access_token = create_access_token(data=user_token_claims(user))
     
     return TokenResponse(
         access_token=access_token,
@@ -129,8 +129,9 @@ async def oauth_login(
             user.kakao_social = user_info
         user.updated_at = datetime.utcnow()
         await db.commit()
+        invalidate_user(user.id)
     
-    access_token = create_access_token(data={"sub": str(user.id)})
+    access_token = create_access_token(data=user_token_claims(user))
     
     return TokenResponse(
         access_token=access_token,
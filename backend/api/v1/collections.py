@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from typing import List
 from db.session import get_db
 from models.collection import Collection
@@ -10,7 +12,9 @@ from schemas.collection import (
     CollectionUpdateRequest,
     CollectionResponse,
 )
-from core.deps import get_current_user
+from schemas.auth import TokenClaims
+from core.deps import get_current_claims, get_current_user
+from core.pagination import ListPageParams, get_list_page_params, list_page_response
 from core.exceptions import NotFoundException, BadRequestException
 from datetime import datetime
 
@@ -23,40 +27,39 @@ async def create_collection(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    # 중복 이름 체크 (같은 사용자 내에서)
+    # 같은 사용자 내 중복 이름은 uq_collections_user_id_name(부분 유니크 인덱스) 충돌로 판단 (INSERT 1회)
     result = await db.execute(
-        select(Collection).where(
-            Collection.user_id == current_user.id,
-            Collection.name == request.name,
-            Collection.deleted_at.is_(None),
+        insert(Collection)
+        .values(user_id=current_user.id, name=request.name)
+        .on_conflict_do_nothing(
+            index_elements=[Collection.user_id, Collection.name],
+            index_where=Collection.deleted_at.is_(None),
         )
+        .returning(Collection)
     )
-    existing = result.scalar_one_or_none()
+    new_collection = result.scalar_one_or_none()
 
-    if existing:
+    if new_collection is None:
         raise BadRequestException("Collection with this name already exists")
 
-    new_collection = Collection(user_id=current_user.id, name=request.name)
-
-    db.add(new_collection)
     await db.commit()
-    await db.refresh(new_collection)
 
     return new_collection
 
 
 @router.get("", response_model=List[CollectionResponse])
 async def get_collections(
-    current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
-):
-    result = await db.execute(
-        select(Collection)
-        .where(Collection.user_id == current_user.id, Collection.deleted_at.is_(None))
-        .order_by(Collection.created_at.desc())
+    page: ListPageParams = Depends(get_list_page_params),
+    claims: TokenClaims = Depends(get_current_claims),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    return await list_page_response(
+        db,
+        Collection,
+        CollectionResponse,
+        [Collection.user_id == claims.user_id, Collection.deleted_at.is_(None)],
+        page,
     )
-    collections = result.scalars().all()
-
-    return collections
 
 
 @router.patch("/{collection_id}", response_model=CollectionResponse)
@@ -83,7 +86,12 @@ async def update_collection(
 
     collection.updated_at = datetime.utcnow()
 
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 이름 변경이 uq_collections_user_id_name과 충돌
+        await db.rollback()
+        raise BadRequestException("Collection with this name already exists")
     await db.refresh(collection)
 
     return collection
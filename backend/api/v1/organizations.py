@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from typing import List
 from datetime import datetime
 from uuid import UUID
@@ -12,7 +14,9 @@ from schemas.organization import (
     OrganizationUpdateRequest,
     OrganizationResponse,
 )
-from core.deps import get_current_user
+from schemas.auth import TokenClaims
+from core.deps import get_current_claims, get_current_user
+from core.pagination import ListPageParams, get_list_page_params, list_page_response
 from core.exceptions import NotFoundException, BadRequestException
 
 router = APIRouter(prefix="/organizations", tags=["organizations"])
@@ -24,42 +28,44 @@ async def create_organization(
     _: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    # 중복 이름 체크
+    # 중복 이름은 uq_organizations_name(부분 유니크 인덱스) 충돌로 판단 (INSERT 1회)
     result = await db.execute(
-        select(Organization).where(
-            Organization.name == request.name,
-            Organization.deleted_at.is_(None),
+        insert(Organization)
+        .values(name=request.name)
+        .on_conflict_do_nothing(
+            index_elements=[Organization.name],
+            index_where=Organization.deleted_at.is_(None),
         )
+        .returning(Organization)
     )
-    existing = result.scalar_one_or_none()
+    organization = result.scalar_one_or_none()
 
-    if existing:
+    if organization is None:
         raise BadRequestException("Organization with this name already exists")
 
-    organization = Organization(name=request.name)
-    db.add(organization)
     await db.commit()
-    await db.refresh(organization)
     return organization
 
 
 @router.get("", response_model=List[OrganizationResponse])
 async def list_organizations(
-    _: User = Depends(get_current_user),
+    page: ListPageParams = Depends(get_list_page_params),
+    _: TokenClaims = Depends(get_current_claims),
     db: AsyncSession = Depends(get_db),
-):
-    result = await db.execute(
-        select(Organization)
-        .where(Organization.deleted_at.is_(None))
-        .order_by(Organization.created_at.desc())
+) -> Response:
+    return await list_page_response(
+        db,
+        Organization,
+        OrganizationResponse,
+        [Organization.deleted_at.is_(None)],
+        page,
     )
-    return result.scalars().all()
 
 
 @router.get("/{organization_id}", response_model=OrganizationResponse)
 async def get_organization(
     organization_id: str,
-    _: User = Depends(get_current_user),
+    _: TokenClaims = Depends(get_current_claims),
     db: AsyncSession = Depends(get_db),
 ):
     organization = await _get_organization_or_404(db, organization_id)
@@ -79,7 +85,12 @@ async def update_organization(
         organization.name = request.name
 
     organization.updated_at = datetime.utcnow()
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 이름 변경이 uq_organizations_name과 충돌
+        await db.rollback()
+        raise BadRequestException("Organization with this name already exists")
     await db.refresh(organization)
     return organization
 
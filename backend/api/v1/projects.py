@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from typing import Optional
 from db.session import get_db
 from models.project import Project
 from models.user import User
 from schemas.project import ProjectCreateRequest, ProjectResponse
-from core.deps import get_current_user
+from schemas.auth import TokenClaims
+from core.deps import get_current_claims, get_current_user
+from core.pagination import ListPageParams, get_list_page_params, list_page_response
 from core.exceptions import NotFoundException, BadRequestException
 
 router = APIRouter(prefix="/projects", tags=["projects"])
@@ -18,29 +21,27 @@ async def create_project(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    # 중복 이름 체크 (같은 사용자 내에서)
+    # 같은 사용자 내 중복 이름은 uq_projects_user_id_name(부분 유니크 인덱스) 충돌로 판단 (INSERT 1회)
     result = await db.execute(
-        select(Project).where(
-            Project.user_id == current_user.id,
-            Project.name == request.name,
-            Project.deleted_at.is_(None),
+        insert(Project)
+        .values(
+            collection_id=request.collection_id,
+            user_id=current_user.id,
+            name=request.name,
+            shard_user_list=request.shard_user_list
+        )
+        .on_conflict_do_nothing(
+            index_elements=[Project.user_id, Project.name],
+            index_where=Project.deleted_at.is_(None),
         )
+        .returning(Project)
     )
-    existing = result.scalar_one_or_none()
+    new_project = result.scalar_one_or_none()
 
-    if existing:
+    if new_project is None:
         raise BadRequestException("Project with this name already exists")
-
-    new_project = Project(
-        collection_id=request.collection_id,
-        user_id=current_user.id,
-        name=request.name,
-        shard_user_list=request.shard_user_list
-    )
     
-    db.add(new_project)
     await db.commit()
-    await db.refresh(new_project)
     
     return new_project
 
@@ -48,13 +49,13 @@ async def create_project(
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
     project_id: str,
-    current_user: User = Depends(get_current_user),
+    claims: TokenClaims = Depends(get_current_claims),
     db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(
         select(Project).where(
             Project.id == project_id,
-            Project.user_id == current_user.id,
+            Project.user_id == claims.user_id,
             Project.deleted_at.is_(None)
         )
     )
@@ -69,20 +70,16 @@ async def get_project(
 @router.get("", response_model=list[ProjectResponse])
 async def get_projects(
     collection_id: Optional[str] = Query(None),
-    current_user: User = Depends(get_current_user),
+    page: ListPageParams = Depends(get_list_page_params),
+    claims: TokenClaims = Depends(get_current_claims),
     db: AsyncSession = Depends(get_db)
-):
-    query = select(Project).where(
-        Project.user_id == current_user.id,
+) -> Response:
+    conditions = [
+        Project.user_id == claims.user_id,
         Project.deleted_at.is_(None)
-    )
+    ]
     
     if collection_id:
-        query = query.where(Project.collection_id == collection_id)
-    
-    query = query.order_by(Project.created_at.desc())
-    
-    result = await db.execute(query)
-    projects = result.scalars().all()
+        conditions.append(Project.collection_id == collection_id)
     
-    return projects
+    return await list_page_response(db, Project, ProjectResponse, conditions, page)
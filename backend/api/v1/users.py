@@ -5,6 +5,7 @@ from db.session import get_db
 from models.user import User
 from schemas.user import UserResponse, UserUpdateRequest
 from core.deps import get_current_user
+from core.user_cache import invalidate_user
 from datetime import datetime
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -45,6 +46,7 @@ async def update_me(
     current_user.updated_at = datetime.utcnow()
     
     await db.commit()
+    invalidate_user(current_user.id)
     await db.refresh(current_user)
     
     return current_user
@@ -63,5 +65,6 @@ async def delete_me(
         delete(User).where(User.id == current_user.id)
     )
     await db.commit()
+    invalidate_user(current_user.id, deleted=True)
     
     return {"message": "User deleted successfully"}
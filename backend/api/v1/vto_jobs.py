@@ -0,0 +1,149 @@
+import base64
+import binascii
+import json
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from typing import Optional
+from db.session import get_db
+from models.vto_job import VtoJob
+from models.project import Project
+from models.user import User
+from schemas.vto_job import VtoJobCreateRequest, VtoJobResponse, VtoJobResultResponse
+from services.vto_job_service import JOB_STATUS_PENDING, FINISHED_JOB_STATUSES, watch_job
+from configs import settings
+from core.deps import get_current_user
+from core.exceptions import NotFoundException, BadRequestException
+
+router = APIRouter(prefix="/vto-jobs", tags=["vto-jobs"])
+
+
+async def _get_user_job(db: AsyncSession, job_id: str, current_user: User) -> VtoJob:
+    result = await db.execute(
+        select(VtoJob).where(
+            VtoJob.id == job_id,
+            VtoJob.user_id == current_user.id,
+        )
+    )
+    job = result.scalar_one_or_none()
+
+    if not job:
+        raise NotFoundException("Job not found")
+
+    return job
+
+
+@router.post("", response_model=VtoJobResponse)
+async def create_vto_job(
+    request: VtoJobCreateRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    # 입력 이미지 base64 검증
+    for image in request.images:
+        try:
+            base64.b64decode(image, validate=True)
+        except (binascii.Error, ValueError):
+            raise BadRequestException("Invalid base64 image")
+
+    if request.project_id:
+        result = await db.execute(
+            select(Project).where(
+                Project.id == request.project_id,
+                Project.user_id == current_user.id,
+                Project.deleted_at.is_(None)
+            )
+        )
+        if not result.scalar_one_or_none():
+            raise NotFoundException("Project not found")
+
+    new_job = VtoJob(
+        user_id=current_user.id,
+        project_id=request.project_id,
+        status=JOB_STATUS_PENDING,
+        prompt=request.prompt,
+        input_images=request.images,
+        image_count=request.image_count,
+        temperature=request.temperature,
+        top_p=request.top_p,
+        aspect_ratio=request.aspect_ratio,
+        completed_count=0,
+        success_count=0,
+    )
+
+    db.add(new_job)
+    await db.commit()
+    await db.refresh(new_job)
+
+    return new_job
+
+
+@router.get("/{job_id}", response_model=VtoJobResponse)
+async def get_vto_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    return await _get_user_job(db, job_id, current_user)
+
+
+@router.get("/{job_id}/result", response_model=VtoJobResultResponse)
+async def get_vto_job_result(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    job = await _get_user_job(db, job_id, current_user)
+
+    if job.status not in FINISHED_JOB_STATUSES:
+        raise BadRequestException("Job is not finished yet")
+
+    return VtoJobResultResponse(
+        id=job.id,
+        status=job.status,
+        images=job.result_images or [],
+        usage=job.usage,
+    )
+
+
+@router.get("/{job_id}/events")
+async def stream_vto_job_events(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Server-Sent Events로 완료된 이미지를 순서와 무관하게 바로 전달
+    (event: image / progress / done)
+    """
+    job = await _get_user_job(db, job_id, current_user)
+
+    async def event_stream():
+        async for event, data in watch_job(job, poll_interval=settings.vto_job_poll_interval):
+            yield f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("", response_model=list[VtoJobResponse])
+async def get_vto_jobs(
+    project_id: Optional[str] = Query(None),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    query = select(VtoJob).where(VtoJob.user_id == current_user.id)
+
+    if project_id:
+        query = query.where(VtoJob.project_id == project_id)
+
+    query = query.order_by(VtoJob.queued_at.desc())
+
+    result = await db.execute(query)
+    jobs = result.scalars().all()
+
+    return jobs
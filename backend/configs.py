@@ -19,6 +19,16 @@ class Settings(BaseSettings):
     db_user: str = os.getenv("DB_USER", "vto_user")
     db_password: str = os.getenv("DB_PASSWORD", "vto_password")
     db_name: str = os.getenv("DB_NAME", "vto_db")
+
+    # Database Engine Profile (db/session.py, local 프로필은 LocalSettings에서 기본값 변경)
+    db_echo: bool = os.getenv("DB_ECHO", "false").lower() == "true"  # SQL 로그 출력
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    db_pool_timeout: float = float(os.getenv("DB_POOL_TIMEOUT", "10"))  # 체크아웃 최대 대기 시간(초)
+    db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # 커넥션 재생성 주기(초), -1: 사용 안 함
+    db_pool_pre_ping: bool = os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"  # 체크아웃마다 왕복 1회 추가
+    db_statement_timeout_ms: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))  # 0: 무제한
+    db_prepared_statement_cache_size: int = int(os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE", "100"))  # 0: pgbouncer(transaction 모드)
     
             
 
@@ -29,6 +39,60 @@ class Settings(BaseSettings):
     gemini_api_key: str = os.getenv("GEMINI_API_KEY", "")
     openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
 
+    # Gemini Client Pool Configuration
+    gemini_client_pool_size: int = int(os.getenv("GEMINI_CLIENT_POOL_SIZE", "2"))
+    gemini_max_connections: int = int(os.getenv("GEMINI_MAX_CONNECTIONS", "20"))
+    gemini_max_keepalive_connections: int = int(os.getenv("GEMINI_MAX_KEEPALIVE_CONNECTIONS", "10"))
+    gemini_keepalive_expiry: float = float(os.getenv("GEMINI_KEEPALIVE_EXPIRY", "60"))
+
+    # Gemini Admission Configuration (프로세스 전역)
+    gemini_max_in_flight_requests: int = int(os.getenv("GEMINI_MAX_IN_FLIGHT_REQUESTS", "10"))
+    gemini_min_in_flight_requests: int = int(os.getenv("GEMINI_MIN_IN_FLIGHT_REQUESTS", "1"))  # 429/503 시 축소 하한
+    gemini_requests_per_minute: int = int(os.getenv("GEMINI_REQUESTS_PER_MINUTE", "0"))  # 0: 무제한
+
+    # Gemini Timeout / Hedging Configuration
+    gemini_attempt_timeout: float = float(os.getenv("GEMINI_ATTEMPT_TIMEOUT", "120"))  # 시도당 제한 시간(초), 0: 무제한
+    gemini_request_timeout: float = float(os.getenv("GEMINI_REQUEST_TIMEOUT", "0"))  # 재시도 포함 전체 제한 시간(초), 0: 무제한
+    gemini_hedge_enabled: bool = os.getenv("GEMINI_HEDGE_ENABLED", "false").lower() == "true"
+    gemini_hedge_percentile: float = float(os.getenv("GEMINI_HEDGE_PERCENTILE", "0.95"))  # 이 백분위 지연 후 중복 요청
+    gemini_hedge_min_samples: int = int(os.getenv("GEMINI_HEDGE_MIN_SAMPLES", "20"))
+
+    # Gemini Files API Upload Cache Configuration (반복 사용되는 입력 이미지를 한 번만 업로드)
+    gemini_file_upload_enabled: bool = os.getenv("GEMINI_FILE_UPLOAD_ENABLED", "false").lower() == "true"
+    gemini_file_upload_backend: str = os.getenv("GEMINI_FILE_UPLOAD_BACKEND", "gemini")  # gemini / stub
+    gemini_file_upload_min_bytes: int = int(os.getenv("GEMINI_FILE_UPLOAD_MIN_BYTES", str(256 * 1024)))  # 256KB
+
+    # VTO Input Image Normalization Configuration
+    vto_image_max_edge: int = int(os.getenv("VTO_IMAGE_MAX_EDGE", "1536"))  # 긴 변 최대 길이(px), 0: 축소 안 함
+    vto_image_format: str = os.getenv("VTO_IMAGE_FORMAT", "jpeg")  # jpeg / webp / lossless(PNG)
+    vto_image_quality: int = int(os.getenv("VTO_IMAGE_QUALITY", "90"))  # jpeg/webp 품질
+    vto_image_cache_max_bytes: int = int(os.getenv("VTO_IMAGE_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))  # 256MB
+
+    # Image Ops Executor Configuration (디코딩/리사이즈/인코딩 전용 풀)
+    vto_image_executor_kind: str = os.getenv("VTO_IMAGE_EXECUTOR_KIND", "thread")  # thread / process
+    vto_image_executor_workers: int = int(os.getenv("VTO_IMAGE_EXECUTOR_WORKERS", "0"))  # 0: CPU 코어 수
+    vto_image_executor_max_pending: int = int(os.getenv("VTO_IMAGE_EXECUTOR_MAX_PENDING", "64"))
+
+    # VTO Result Cache Configuration (image_inference_with_prompt(use_cache=True)에서 사용)
+    vto_result_cache_dir: str = os.getenv("VTO_RESULT_CACHE_DIR", ".cache/vto_results")
+    vto_result_cache_max_bytes: int = int(os.getenv("VTO_RESULT_CACHE_MAX_BYTES", str(1024 * 1024 * 1024)))  # 1GB
+    vto_result_cache_ttl_seconds: int = int(os.getenv("VTO_RESULT_CACHE_TTL_SECONDS", str(60 * 60 * 24 * 7)))  # 7 days
+
+    # Clothes Analysis Cache Configuration
+    clothes_analysis_cache_path: str = os.getenv("CLOTHES_ANALYSIS_CACHE_PATH", ".cache/clothes_analysis.sqlite3")
+    clothes_analysis_cache_max_distance: int = int(os.getenv("CLOTHES_ANALYSIS_CACHE_MAX_DISTANCE", "4"))  # dHash 해밍 거리 (0~7)
+    clothes_analysis_cache_max_color_distance: int = int(os.getenv("CLOTHES_ANALYSIS_CACHE_MAX_COLOR_DISTANCE", "16"))  # 격자 평균 RGB 채널 차이 (0~255)
+
+    # Prompt Assembly Cache Configuration (조립 함수별 LRU 크기)
+    prompt_cache_max_size: int = int(os.getenv("PROMPT_CACHE_MAX_SIZE", "1024"))
+
+    # VTO Job Worker Configuration (0: 이 프로세스에서는 워커를 띄우지 않음)
+    vto_job_worker_count: int = int(os.getenv("VTO_JOB_WORKER_COUNT", "2"))
+    vto_job_poll_interval: float = float(os.getenv("VTO_JOB_POLL_INTERVAL", "1.0"))
+    vto_job_stale_seconds: int = int(os.getenv("VTO_JOB_STALE_SECONDS", "600"))  # 하트비트(updated_at)가 이 시간 동안 없으면 재시도
+    vto_job_heartbeat_seconds: float = float(os.getenv("VTO_JOB_HEARTBEAT_SECONDS", "30"))  # 처리 중 updated_at 갱신 주기
+    vto_job_max_attempts: int = int(os.getenv("VTO_JOB_MAX_ATTEMPTS", "3"))
+
     # Server Configuration
     server_host: str = os.getenv("SERVER_HOST", "0.0.0.0")
     server_port: int = int(os.getenv("SERVER_PORT", "9199"))
@@ -38,6 +102,15 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_access_token_expire_minutes: int = 60 * 24 * 7  # 7 days
 
+    # Auth Cache Configuration (get_current_user)
+    auth_user_cache_ttl_seconds: float = float(os.getenv("AUTH_USER_CACHE_TTL_SECONDS", "30"))  # 0: 사용자 캐시 사용 안 함
+    auth_user_cache_max_size: int = int(os.getenv("AUTH_USER_CACHE_MAX_SIZE", "10000"))
+    auth_token_cache_max_size: int = int(os.getenv("AUTH_TOKEN_CACHE_MAX_SIZE", "10000"))
+
+    # List Pagination Configuration (collections/projects/organizations 목록)
+    list_page_default_limit: int = int(os.getenv("LIST_PAGE_DEFAULT_LIMIT", "50"))  # cursor만 있고 limit이 없을 때 페이지 크기 (둘 다 없으면 전체 목록)
+    list_page_max_limit: int = int(os.getenv("LIST_PAGE_MAX_LIMIT", "200"))
+
     # OAuth Configuration
     google_client_id: str = os.getenv("GOOGLE_CLIENT_ID", "")
     google_client_secret: str = os.getenv("GOOGLE_CLIENT_SECRET", "")
@@ -51,6 +124,9 @@ class Settings(BaseSettings):
 class LocalSettings(Settings):
     env: str = "local"
     local_db_port: int = 54322
+    db_echo: bool = os.getenv("DB_ECHO", "true").lower() == "true"
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "5"))
     
     @property
     def database_url(self) -> str:
@@ -1,35 +1,96 @@
+import copy
 from typing import AsyncGenerator
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import make_transient_to_detached
 from db.session import get_db
 from models.user import User
-from core.security import verify_token
-from core.exceptions import UnauthorizedException
+from schemas.auth import TokenClaims
+from core.exceptions import ForbiddenException, UnauthorizedException
+from core.user_cache import get_token_cache, get_user_cache
 from uuid import UUID
 
 security = HTTPBearer()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db)
-) -> User:
-    token = credentials.credentials
-    payload = verify_token(token)
-    
+def _decode_claims(token: str) -> TokenClaims:
+    payload = get_token_cache().decode(token)
+
     if payload is None:
         raise UnauthorizedException()
-    
+
     user_id: str = payload.get("sub")
     if user_id is None:
         raise UnauthorizedException()
-    
-    result = await db.execute(select(User).where(User.id == UUID(user_id), User.deleted_at.is_(None)))
+
+    try:
+        return TokenClaims(
+            user_id=UUID(user_id),
+            jti=payload.get("jti"),
+            iat=payload.get("iat"),
+        )
+    except ValueError:
+        raise UnauthorizedException()
+
+
+def _user_snapshot(user: User) -> dict:
+    return {column.key: getattr(user, column.key) for column in User.__table__.columns}
+
+
+async def get_current_claims(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> TokenClaims:
+    """
+    토큰 claims만으로 인증 (DB 조회 없음)
+    - user_id만 필요한 읽기 전용 엔드포인트용 (목록/단건 조회)
+    - 이 프로세스에서 삭제된 사용자는 거부, 다른 프로세스에서 삭제된 사용자는 토큰 만료까지 통과
+    """
+    claims = _decode_claims(credentials.credentials)
+    if get_user_cache().is_deleted(claims.user_id):
+        raise UnauthorizedException()
+    return claims
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    claims = _decode_claims(credentials.credentials)
+    user_cache = get_user_cache()
+    if user_cache.is_deleted(claims.user_id):
+        raise UnauthorizedException()
+
+    # 토큰 단위 캐시 키 (jti 없는 이전 토큰은 iat, 둘 다 없으면 캐시하지 않음)
+    token_key = claims.jti or claims.iat
+    snapshot = user_cache.get(claims.user_id, token_key) if token_key is not None else None
+    if snapshot is not None:
+        # 스냅샷으로 만든 객체를 조회된 것처럼 세션에 붙임 (SELECT 없이 수정/커밋 가능)
+        user = User(**copy.deepcopy(snapshot))
+        make_transient_to_detached(user)
+        db.add(user)
+        return user
+
+    result = await db.execute(select(User).where(User.id == claims.user_id, User.deleted_at.is_(None)))
     user = result.scalar_one_or_none()
-    
+
     if user is None:
         raise UnauthorizedException()
-    
+
+    if token_key is not None:
+        user_cache.set(claims.user_id, token_key, _user_snapshot(user))
     return user
+
+
+async def get_current_admin_user(
+    current_user: User = Depends(get_current_user),
+) -> User:
+    """
+    관리자(user_type=admin)만 허용
+    - 토큰 claims가 아니라 get_current_user가 불러온 사용자 행(캐시 스냅샷 또는 DB)의 user_type으로 판단
+      (권한이 회수되면 토큰 만료를 기다리지 않고 사용자 캐시 TTL 안에 반영)
+    """
+    if current_user.user_type != "admin":
+        raise ForbiddenException("Admin privileges required")
+    return current_user
@@ -0,0 +1,195 @@
+import asyncio
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+from PIL import Image
+from configs import settings
+from custom_logger import get_logger
+from core.litellm_hander.schema import ClothesImageAnalysis
+from core.vto_service.image_executor import run_image_op
+
+logger = get_logger(__name__)
+
+# dHash 64bit를 8bit씩 8개 밴드로 나누어 인덱싱
+# (해밍 거리가 밴드 수보다 작으면 최소 1개 밴드는 반드시 일치 → 후보 검색 누락 없음)
+PHASH_BANDS = 8
+PHASH_BAND_BITS = 8
+
+# 색상 시그니처: 2x2 격자별 평균 RGB (dHash는 밝기만 보므로 같은 디자인의 다른 색상을 구분하지 못함)
+COLOR_GRID = 2
+
+
+def exact_hash(image_bytes: bytes) -> str:
+    return hashlib.sha256(image_bytes).hexdigest()
+
+
+def perceptual_hash(image_bytes: bytes) -> int:
+    """
+    dHash(difference hash) 64bit 계산
+
+    - 흑백 9x8로 축소 후 가로로 인접한 픽셀 밝기 비교
+    - 재촬영/재인코딩/리사이즈된 같은 상품 사진은 해밍 거리가 작게 나옴
+    """
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        image.draft("L", (64, 64))
+        pixels = list(image.convert("L").resize((9, 8), Image.Resampling.LANCZOS).getdata())
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            value = (value << 1) | int(left > right)
+    return value
+
+
+def color_signature(image_bytes: bytes) -> bytes:
+    """2x2 격자별 평균 RGB 12바이트 (재인코딩/리사이즈에는 거의 변하지 않고 색상이 다르면 크게 달라짐)"""
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        image.draft("RGB", (64, 64))
+        pixels = image.convert("RGB").resize((COLOR_GRID, COLOR_GRID), Image.Resampling.BOX).getdata()
+        return bytes(channel for pixel in pixels for channel in pixel)
+
+
+def image_signature(image_bytes: bytes) -> Tuple[int, bytes]:
+    """근접 중복 조회용 (dHash, 색상 시그니처)"""
+    return perceptual_hash(image_bytes), color_signature(image_bytes)
+
+
+def color_distance(left: bytes, right: bytes) -> int:
+    """색상 시그니처 간 채널별 최대 차이 (0~255)"""
+    return max(abs(a - b) for a, b in zip(left, right))
+
+
+def _bands(phash: int) -> Tuple[int, ...]:
+    mask = (1 << PHASH_BAND_BITS) - 1
+    return tuple((phash >> (i * PHASH_BAND_BITS)) & mask for i in range(PHASH_BANDS))
+
+
+class ClothesAnalysisCache:
+    """
+    의류 이미지 분석 결과 영구 캐시 (SQLite)
+
+    - 정확 일치: 이미지 bytes SHA-256 + 프롬프트 버전
+    - 근접 중복: dHash 해밍 거리 max_distance 이하 + 색상 시그니처 차이 max_color_distance 이하 + 프롬프트 버전
+      (색상 시그니처가 없는 이전 행은 정확 일치로만 조회)
+    - 프롬프트 버전이 바뀌면 이전 버전 결과는 조회되지 않으며 purge_stale()로 삭제
+    """
+
+    def __init__(self, db_path: str, max_distance: int = 4, max_color_distance: int = 16):
+        if not 0 <= max_distance < PHASH_BANDS:
+            raise ValueError(f"max_distance must be between 0 and {PHASH_BANDS - 1}, got {max_distance}")
+        if not 0 <= max_color_distance <= 255:
+            raise ValueError(f"max_color_distance must be between 0 and 255, got {max_color_distance}")
+        self.db_path = db_path
+        self.max_distance = max_distance
+        self.max_color_distance = max_color_distance
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        band_columns = ", ".join(f"band{i} INTEGER NOT NULL" for i in range(PHASH_BANDS))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS clothes_analysis ("
+            "exact_hash TEXT NOT NULL, prompt_version TEXT NOT NULL, "
+            f"phash TEXT NOT NULL, {band_columns}, "
+            "result TEXT NOT NULL, created_at REAL NOT NULL, color BLOB, "
+            "PRIMARY KEY (exact_hash, prompt_version))"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(clothes_analysis)")}
+        if "color" not in columns:
+            self._conn.execute("ALTER TABLE clothes_analysis ADD COLUMN color BLOB")
+        for i in range(PHASH_BANDS):
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_clothes_analysis_band{i} "
+                f"ON clothes_analysis (prompt_version, band{i})"
+            )
+        self._conn.commit()
+
+    def _get_exact(self, exact: str, prompt_version: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM clothes_analysis WHERE exact_hash = ? AND prompt_version = ?",
+                (exact, prompt_version),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _get_near(self, phash: int, color: bytes, prompt_version: str) -> Optional[str]:
+        bands = _bands(phash)
+        band_filter = " OR ".join(f"band{i} = ?" for i in range(PHASH_BANDS))
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT phash, color, result FROM clothes_analysis "
+                f"WHERE prompt_version = ? AND color IS NOT NULL AND ({band_filter})",
+                (prompt_version, *bands),
+            ).fetchall()
+
+        best = None
+        for candidate_phash, candidate_color, result in rows:
+            distance = bin(int(candidate_phash, 16) ^ phash).count("1")
+            if distance > self.max_distance or color_distance(candidate_color, color) > self.max_color_distance:
+                continue
+            if best is None or distance < best[0]:
+                best = (distance, result)
+        return best[1] if best else None
+
+    def _set(self, exact: str, phash: int, color: bytes, prompt_version: str, result: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO clothes_analysis "
+                f"(exact_hash, prompt_version, phash, {', '.join(f'band{i}' for i in range(PHASH_BANDS))}, color, result, created_at) "
+                f"VALUES (?, ?, ?, {', '.join('?' * PHASH_BANDS)}, ?, ?, ?)",
+                (exact, prompt_version, f"{phash:016x}", *_bands(phash), color, result, time.time()),
+            )
+            self._conn.commit()
+
+    def purge_stale(self, prompt_version: str) -> int:
+        """현재 프롬프트 버전이 아닌 분석 결과 삭제"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM clothes_analysis WHERE prompt_version != ?", (prompt_version,)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    async def get(self, image_bytes: bytes, prompt_version: str) -> Optional[ClothesImageAnalysis]:
+        """정확 일치 → 근접 중복 순서로 조회"""
+        exact = exact_hash(image_bytes)
+        result = await asyncio.to_thread(self._get_exact, exact, prompt_version)
+        if result is None:
+            phash, color = await run_image_op(image_signature, image_bytes)
+            result = await asyncio.to_thread(self._get_near, phash, color, prompt_version)
+            if result is not None:
+                logger.info(f"Clothes analysis near-duplicate hit: {exact[:12]}")
+        return ClothesImageAnalysis(**json.loads(result)) if result is not None else None
+
+    async def set(self, image_bytes: bytes, prompt_version: str, analysis: ClothesImageAnalysis) -> None:
+        exact = exact_hash(image_bytes)
+        phash, color = await run_image_op(image_signature, image_bytes)
+        await asyncio.to_thread(self._set, exact, phash, color, prompt_version, analysis.model_dump_json())
+
+
+_analysis_cache: Optional[ClothesAnalysisCache] = None
+_analysis_cache_lock = threading.Lock()
+
+
+def get_analysis_cache(prompt_version: str) -> ClothesAnalysisCache:
+    """프로세스 전역 ClothesAnalysisCache 반환 (최초 생성 시 이전 프롬프트 버전 결과 정리)"""
+    global _analysis_cache
+    if _analysis_cache is None:
+        with _analysis_cache_lock:
+            if _analysis_cache is None:
+                analysis_cache = ClothesAnalysisCache(
+                    db_path=settings.clothes_analysis_cache_path,
+                    max_distance=settings.clothes_analysis_cache_max_distance,
+                    max_color_distance=settings.clothes_analysis_cache_max_color_distance,
+                )
+                purged = analysis_cache.purge_stale(prompt_version)
+                if purged:
+                    logger.info(f"Purged {purged} stale clothes analysis results")
+                _analysis_cache = analysis_cache
+    return _analysis_cache
@@ -1,35 +1,64 @@
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import functools
 import os
+import json
+import hashlib
+import threading
 import aiofiles
 from litellm import Router
 from litellm.router import RetryPolicy
 from custom_logger import get_logger
 from configs import settings
 from prompts.analyze_prompts import (
-    analyze_clothes_image_prompt, valid_generated_vto_prompt)
+    analyze_clothes_image_prompt, analyze_clothes_image_prompt_version, valid_generated_vto_prompt)
 from core.litellm_hander.schema import (
     LiteLLMUsageData,
     TotalUsageData,
     ClothesImageAnalysis,
     ValidGeneratedVTO,
 )
+from core.vto_service.image_normalizer import ImageBuffer, as_image_bytes, sniff_mime_type
 import base64
 
 logger = get_logger(__name__)
 
+_model_router: Optional[Router] = None
+_model_router_lock = threading.Lock()
+
+
+def get_model_router() -> Router:
+    """
+    프로세스 전역 LiteLLM Router 반환 (최초 호출 시 생성)
+    - 배포별 cooldown/헬스 상태를 요청 간에 공유하여 fallback이 실제로 동작하도록 함
+    """
+    global _model_router
+    if _model_router is None:
+        with _model_router_lock:
+            if _model_router is None:
+                _model_router = LiteLLMHandler._create_model_router()
+    return _model_router
+
 
 class LiteLLMHandler:
-    def __init__(self):
-        self.router = self._create_model_router()
+    """
+    LiteLLM 요청 핸들러
+    - Router는 프로세스 전역으로 공유하고, usage_data는 핸들러(요청) 단위로 기록
+    """
+
+    ANALYZE_CLOTHES_MODEL_NAME = "gemini/gemini-2.5-flash"
+
+    def __init__(self, router: Optional[Router] = None):
+        self.router = router or get_model_router()
         self.usage_data = []
 
+    @classmethod
     def _model_format(
-        self, model: str, reasoning_effort: str = None, budget: int = None
+        cls, model: str, reasoning_effort: str = None, budget: int = None
     ) -> dict:
         """모델 설정 포맷"""
         format = {
             "model_name": model,
-            "litellm_params": {"model": model, "api_key": self._get_api_key(model)},
+            "litellm_params": {"model": model, "api_key": cls._get_api_key(model)},
         }
         if reasoning_effort:
             format["litellm_params"]["reasoning_effort"] = reasoning_effort
@@ -46,7 +75,8 @@ class LiteLLMHandler:
                 del format["litellm_params"]["reasoning_effort"]
         return format
 
-    def _get_api_key(self, model: str) -> str:
+    @staticmethod
+    def _get_api_key(model: str) -> str:
         """모델에 따른 API 키 반환"""
         openai_key: str = settings.openai_api_key
         gemini_api_key: str = settings.gemini_api_key
@@ -60,7 +90,8 @@ class LiteLLMHandler:
         else:
             raise ValueError(f"지원하지 않는 모델입니다: {model}")
 
-    def _create_model_router(self) -> Router:
+    @classmethod
+    def _create_model_router(cls) -> Router:
         """LiteLLM Router 생성"""
 
         retry_policy = RetryPolicy(  # run 0 retries for AuthenticationErrorRetries
@@ -69,14 +100,14 @@ class LiteLLMHandler:
         )
 
         model_list = [
-            self._model_format("gemini/gemini-2.5-flash", budget=1024),
-            self._model_format("gemini/gemini-2.5-flash-image"),
-            self._model_format("gemini/gemini-2.0-flash"),
-            self._model_format("openai/gpt-4.1-mini"),
-            self._model_format("xai/grok-3-mini", reasoning_effort="low"),
-            self._model_format("gemini/gemini-2.5-pro", budget=1024),
-            self._model_format("openai/gpt-5-mini"),
-            self._model_format("gemini/gemini-2.5-flash-lite", budget=0),
+            cls._model_format("gemini/gemini-2.5-flash", budget=1024),
+            cls._model_format("gemini/gemini-2.5-flash-image"),
+            cls._model_format("gemini/gemini-2.0-flash"),
+            cls._model_format("openai/gpt-4.1-mini"),
+            cls._model_format("xai/grok-3-mini", reasoning_effort="low"),
+            cls._model_format("gemini/gemini-2.5-pro", budget=1024),
+            cls._model_format("openai/gpt-5-mini"),
+            cls._model_format("gemini/gemini-2.5-flash-lite", budget=0),
         ]
         fallback_model = [
             {"gemini/gemini-2.0-flash": ["openai/gpt-4.1-mini"]},
@@ -95,14 +126,17 @@ class LiteLLMHandler:
     def _get_model_pricing(self, model_name: str) -> Dict[str, float]:
         """
         모델별 토큰 가격 정보 반환 (USD per 1M tokens)
+        - cached_input: 프롬프트 캐시 적중 입력 토큰 가격 (없으면 input 가격 적용)
         """
         pricing = {
             "gemini/gemini-2.5-pro": {
                 "input": 1.25,
+                "cached_input": 0.31,
                 "output": 10,
             },
             "gemini/gemini-2.5-flash": {
                 "input": 0.3,
+                "cached_input": 0.075,
                 "output": 2.5,
             },
             "gemini/gemini-2.5-flash-image": {
@@ -111,13 +145,14 @@ class LiteLLMHandler:
             },
             "gemini/gemini-2.5-flash-lite": {
                 "input": 0.1,
+                "cached_input": 0.025,
                 "output": 0.4,
             },
-            "gemini/gemini-2.0-flash": {"input": 0.1, "output": 0.4},
-            "openai/gpt-4.1-mini": {"input": 0.4, "output": 1.6},
+            "gemini/gemini-2.0-flash": {"input": 0.1, "cached_input": 0.025, "output": 0.4},
+            "openai/gpt-4.1-mini": {"input": 0.4, "cached_input": 0.1, "output": 1.6},
             "claude-3-5-sonnet": {"input": 3.00, "output": 15.00},
             "xai/grok-3-mini": {"input": 0.3, "output": 0.5},
-            "openai/gpt-5-mini": {"input": 0.2, "output": 2},
+            "openai/gpt-5-mini": {"input": 0.2, "cached_input": 0.025, "output": 2},
         }
 
         # 모델명 정규화
@@ -138,6 +173,7 @@ class LiteLLMHandler:
             prompt_token_count = usage.get("prompt_tokens", 0)
             completion_tokens = usage.get("completion_tokens", 0)
             reasoning_tokens = 0
+            cached_tokens = (usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0
 
             # reasoning 토큰 확인
             if (
@@ -154,6 +190,7 @@ class LiteLLMHandler:
             prompt_token_count = usage.prompt_tokens
             completion_tokens = usage.completion_tokens
             reasoning_tokens = 0
+            cached_tokens = getattr(getattr(usage, "prompt_tokens_details", None), "cached_tokens", None) or 0
 
             # reasoning 토큰 확인
             if (
@@ -164,8 +201,12 @@ class LiteLLMHandler:
                     usage.completion_tokens_details, "reasoning_tokens", 0
                 )
         # 모델별 비용 계산
+        # 캐시 적중 입력 토큰은 할인 가격 적용 (Gemini context caching / OpenAI prompt caching)
         pricing = self._get_model_pricing(model_name)
-        input_cost = (prompt_token_count / 1_000_000) * pricing["input"]
+        input_cost = (
+            (prompt_token_count - cached_tokens) * pricing["input"]
+            + cached_tokens * pricing.get("cached_input", pricing["input"])
+        ) / 1_000_000
         output_cost = (completion_tokens / 1_000_000) * pricing["output"]
 
         total_cost_usd = input_cost + output_cost
@@ -176,7 +217,7 @@ class LiteLLMHandler:
             prompt_token_count=prompt_token_count,
             candidates_token_count=completion_tokens,
             output_token_count=completion_tokens,
-            cached_content_token_count=0,  # LiteLLM에서는 별도 제공 안함
+            cached_content_token_count=cached_tokens,
             thoughts_token_count=reasoning_tokens,
             model_name=model_name,
             cost_usd=round(total_cost_usd, 6),
@@ -185,55 +226,87 @@ class LiteLLMHandler:
         )
         return usage_data
 
-    async def calculate_total_cost(self) -> TotalUsageData:
-        # 전체 합계 계산
-        total_tokens = sum(u.total_token_count for u in self.usage_data)
-        total_prompt_tokens = sum(u.prompt_token_count for u in self.usage_data)
-        total_candidates_tokens = sum(u.candidates_token_count for u in self.usage_data)
-        total_cached_tokens = sum(u.cached_content_token_count for u in self.usage_data)
-        total_output_tokens = sum(u.output_token_count for u in self.usage_data)
-        total_thoughts_tokens = sum(u.thoughts_token_count for u in self.usage_data)
-        total_cost_usd = sum(u.cost_usd for u in self.usage_data)
-        total_cost_krw = sum(u.cost_krw for u in self.usage_data)
-
-        # 전체 합계 객체 생성
-        total_usage = LiteLLMUsageData(
-            total_token_count=total_tokens,
-            prompt_token_count=total_prompt_tokens,
-            candidates_token_count=total_candidates_tokens,
-            cached_content_token_count=total_cached_tokens,
-            output_token_count=total_output_tokens,
-            thoughts_token_count=total_thoughts_tokens,
+    @staticmethod
+    def sum_usage_data(usage_data_list: List[LiteLLMUsageData], task_name: str = "total_cost") -> LiteLLMUsageData:
+        """여러 LiteLLMUsageData를 합산 (캐시/사고 토큰 포함)"""
+        return LiteLLMUsageData(
+            total_token_count=sum(u.total_token_count for u in usage_data_list),
+            prompt_token_count=sum(u.prompt_token_count for u in usage_data_list),
+            candidates_token_count=sum(u.candidates_token_count for u in usage_data_list),
+            cached_content_token_count=sum(u.cached_content_token_count for u in usage_data_list),
+            output_token_count=sum(u.output_token_count for u in usage_data_list),
+            thoughts_token_count=sum(u.thoughts_token_count for u in usage_data_list),
             model_name="total",
-            cost_usd=round(total_cost_usd, 6),
-            cost_krw=round(total_cost_krw, 2),
-            task_name="total_cost",
+            cost_usd=round(sum(u.cost_usd for u in usage_data_list), 6),
+            cost_krw=round(sum(u.cost_krw for u in usage_data_list), 2),
+            task_name=task_name,
         )
 
+    async def calculate_total_cost(self) -> TotalUsageData:
+        # 전체 합계 계산
+        total_usage = self.sum_usage_data(self.usage_data)
         return TotalUsageData(total=total_usage, details=self.usage_data)
 
     async def analyze_clothes_image(
         self, image_content: Dict[str, str]
-    ) -> LiteLLMUsageData:
+    ) -> Tuple[Any, LiteLLMUsageData]:
         """
         옷 이미지 분석
+
+        - 고정 프롬프트(카테고리 카탈로그 포함)는 system 메시지, 이미지는 user 메시지로 분리
+        - system 메시지는 요청마다 같은 prefix이므로 프롬프트 캐싱 대상
+          (Gemini: cache_control → context caching, OpenAI: 자동 prefix 캐싱, cache_control은 LiteLLM이 제거)
+        - 캐시 적중 토큰은 cached_content_token_count로 기록
+
+        Returns:
+            Tuple: (LiteLLM 응답, 이번 호출의 비용 정보 - usage_data에도 누적)
         """
-        model_name = "gemini/gemini-2.5-flash"
-        prompt_text = analyze_clothes_image_prompt()
+        model_name = self.ANALYZE_CLOTHES_MODEL_NAME
         response = await self.router.acompletion(
             model=model_name,
             messages=[
-                {
-                    "role": "user",
-                    "content": [{"type": "text", "text": prompt_text}, image_content],
-                }
+                self._analyze_clothes_system_message(),
+                {"role": "user", "content": [image_content]},
             ],
             response_format=ClothesImageAnalysis,
         )
-        self.usage_data.append(
-            self.calculate_cost(response, model_name, "analyze_clothes_image")
+        usage = self.calculate_cost(response, model_name, "analyze_clothes_image")
+        self.usage_data.append(usage)
+        return response, usage
+
+    @staticmethod
+    def _analyze_clothes_system_message() -> Dict:
+        # 프롬프트 문자열은 캐시된 것을 사용하고, 메시지 dict는 매번 새로 생성
+        # (fallback 모델 변환 과정에서 cache_control이 제거되어도 다음 요청에 영향 없도록)
+        return {
+            "role": "system",
+            "content": [
+                {
+                    "type": "text",
+                    "text": analyze_clothes_image_prompt(),
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+        }
+
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def analyze_clothes_image_version(cls) -> str:
+        """
+        옷 이미지 분석 버전 해시 (프롬프트, 응답 스키마, 모델이 바뀌면 달라짐)
+        - 분석 결과 캐시 무효화 기준으로 사용
+        """
+        version_source = json.dumps(
+            [
+                cls.ANALYZE_CLOTHES_MODEL_NAME,
+                analyze_clothes_image_prompt_version(),
+                "system_message",
+                ClothesImageAnalysis.model_json_schema(),
+            ],
+            ensure_ascii=False,
+            sort_keys=True,
         )
-        return response
+        return hashlib.sha256(version_source.encode("utf-8")).hexdigest()
 
     async def valid_generated_vto(
         self,
@@ -268,7 +341,7 @@ class LiteLLMHandler:
     async def convert_litellm_image_object(
         self,
         image_path: Optional[str] = None,
-        image_bytes: Optional[bytes] = None,
+        image_bytes: Optional[ImageBuffer] = None,
         image_url: Optional[str] = None,
     ) -> Dict[str, str]:
         """
@@ -276,7 +349,7 @@ class LiteLLMHandler:
 
         Args:
             image_path: 로컬 이미지 파일 경로
-            image_bytes: 이미지 바이트 데이터
+            image_bytes: 이미지 바이트 데이터 (bytes/bytearray/memoryview/BytesIO, 형식은 매직 넘버로 판별)
             image_url: 이미지 URL
 
         Returns:
@@ -314,8 +387,10 @@ class LiteLLMHandler:
             image_content = {"type": "image_url", "image_url": {"url": f"{image_url}"}}
             return image_content
 
-        elif image_bytes:
-            # 바이트 데이터를 base64로 인코딩 (PNG로 가정)
+        elif image_bytes is not None:
+            # 바이트 데이터를 base64로 인코딩 (판별 불가 시 PNG로 가정)
+            image_bytes = as_image_bytes(image_bytes)
+            mime_type = sniff_mime_type(image_bytes) or mime_type
             base64_image = base64.b64encode(image_bytes).decode("utf-8")
             image_content = {
                 "type": "image_url",
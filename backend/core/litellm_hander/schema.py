@@ -12,6 +12,7 @@ class LiteLLMUsageData(BaseModel):
     cost_usd: float = Field(..., description="USD 비용")
     cost_krw: float = Field(..., description="KRW 비용")
     task_name: Optional[str] = Field(None, description="작업 이름")
+    hedge_request_count: int = Field(0, description="헤지(중복) 요청 수 (비용에 포함)")
 
 class TotalUsageData(BaseModel):
     total: LiteLLMUsageData = Field(..., description="전체 비용 합계")
@@ -27,6 +28,31 @@ class ClothesImageAnalysis(BaseModel):
     overall_desc: str = Field(..., description="전체 설명")
 
 
+class ClothesAnalysisBatchItem(BaseModel):
+    index: int = Field(..., description="입력 순서 인덱스")
+    source: Optional[str] = Field(None, description="이미지 경로 또는 URL (bytes 입력이면 None)")
+    analysis: Optional[ClothesImageAnalysis] = Field(None, description="분석 결과 (실패 시 None)")
+    error: Optional[str] = Field(None, description="실패 사유")
+    cached: bool = Field(False, description="캐시 적중 여부")
+    usage: Optional[LiteLLMUsageData] = Field(None, description="항목별 비용 정보 (캐시 적중/실패 시 None)")
+
+
+class ProductImageBatchItem(BaseModel):
+    index: int = Field(..., description="입력 순서 인덱스 (의류 단위)")
+    images: List[bytes] = Field(default_factory=list, description="생성된 상품 이미지 리스트")
+    usage: Optional[LiteLLMUsageData] = Field(None, description="해당 의류의 사용량")
+    error: Optional[str] = Field(None, description="실패 사유")
+
+
+class VtoStageReport(BaseModel):
+    stage: str = Field(..., description="단계 이름 (front / selection / left / right / back)")
+    started_at: float = Field(..., description="파이프라인 시작 기준 단계 시작 시각(초)")
+    latency: float = Field(..., description="단계 소요 시간(초)")
+    total_count: int = Field(0, description="요청한 이미지/검수 수")
+    success_count: int = Field(0, description="성공한 이미지/검수 수")
+    usage: Optional[LiteLLMUsageData] = Field(None, description="단계 사용량")
+
+
 class Detection(BaseModel):
     label: str = Field(..., description="불일치 항목 설명")
     box_2d: List[int] = Field(..., description="불일치 항목 박스 좌표")
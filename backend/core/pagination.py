@@ -0,0 +1,146 @@
+"""
+목록 API 키셋 페이지네이션 / 필드 프로젝션 / ETag
+- 정렬: (created_at desc, id desc), 커서는 페이지 마지막 행의 (created_at, id)를 base64url로 인코딩
+- 응답 본문은 기존과 같은 리스트, 다음 페이지 커서는 X-Next-Cursor 헤더로 전달 (마지막 페이지면 없음)
+- limit/cursor를 모두 생략하면 기존처럼 전체 목록 반환 (cursor만 있으면 LIST_PAGE_DEFAULT_LIMIT개씩)
+- created_at이 NULL인 행은 커서로 위치를 표현할 수 없으므로 페이지 조회에서 제외
+- fields=id,name 처럼 요청한 컬럼만 SELECT (ORM 객체 생성 없이 행을 바로 JSON 직렬화)
+- 본문 해시로 weak ETag 생성, If-None-Match가 같으면 304 (본문 전송 생략)
+"""
+import base64
+import binascii
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple, Type
+from uuid import UUID
+from fastapi import Header, Query, Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from configs import settings
+from core.exceptions import BadRequestException
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass(frozen=True)
+class ListPageParams:
+    limit: Optional[int]  # None: 페이지네이션 없이 전체 목록
+    cursor: Optional[str]
+    fields: Optional[str]
+    if_none_match: Optional[str]
+
+
+def get_list_page_params(
+    limit: Optional[int] = Query(None, ge=1, le=settings.list_page_max_limit),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분, 예: id,name)"),
+    if_none_match: Optional[str] = Header(None),
+) -> ListPageParams:
+    if limit is None and cursor:
+        limit = settings.list_page_default_limit
+    return ListPageParams(
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
+        if_none_match=if_none_match,
+    )
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    raw = json.dumps([created_at.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """encode_cursor의 역변환 (잘못된 커서는 400)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (ValueError, TypeError, UnicodeError, binascii.Error):
+        raise BadRequestException("Invalid cursor")
+
+
+def resolve_fields(fields: Optional[str], response_model: Type[BaseModel]) -> List[str]:
+    """
+    fields 파라미터를 응답 모델 필드 순서의 컬럼 이름 목록으로 변환
+    - 없으면 응답 모델 전체 필드, 모르는 필드가 있으면 400
+    """
+    allowed = list(response_model.model_fields)
+    if not fields:
+        return allowed
+
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise BadRequestException(f"Unknown fields: {', '.join(sorted(unknown))}")
+    if not requested:
+        return allowed
+    return [name for name in allowed if name in requested]
+
+
+def make_etag(body: bytes, next_cursor: Optional[str]) -> str:
+    digest = hashlib.sha256(body)
+    if next_cursor:
+        digest.update(next_cursor.encode("ascii"))
+    return f'W/"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 비교 (weak 비교, 여러 값/`*` 지원)"""
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(value.removeprefix("W/") == opaque for value in candidates)
+
+
+async def list_page_response(
+    db: AsyncSession,
+    model: Any,
+    response_model: Type[BaseModel],
+    conditions: Sequence[Any],
+    page: ListPageParams,
+) -> Response:
+    """
+    model 테이블에서 conditions를 만족하는 행의 한 페이지를 JSON 리스트 응답으로 반환
+
+    - 커서 계산용 created_at/id는 fields에 없어도 SELECT하고 응답에서는 제외
+    - limit + 1개를 조회해 다음 페이지 유무 판단 (limit이 없으면 전체 목록, 커서 없음)
+    """
+    fields = resolve_fields(page.fields, response_model)
+    columns = fields + [name for name in ("created_at", "id") if name not in fields]
+
+    query = select(*(getattr(model, name) for name in columns)).where(*conditions)
+    if page.limit is not None:
+        query = query.where(model.created_at.is_not(None))
+    if page.cursor:
+        created_at, row_id = decode_cursor(page.cursor)
+        query = query.where(tuple_(model.created_at, model.id) < tuple_(created_at, row_id))
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+    if page.limit is not None:
+        query = query.limit(page.limit + 1)
+
+    result = await db.execute(query)
+    rows = result.mappings().all()
+
+    next_cursor = None
+    if page.limit is not None and len(rows) > page.limit:
+        rows = rows[: page.limit]
+        next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+
+    body = to_json([{name: row[name] for name in fields} for row in rows])
+    etag = make_etag(body, next_cursor)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    if etag_matches(page.if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -3,23 +3,34 @@ from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from configs import settings
-from uuid import UUID
+from uuid import UUID, uuid4
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
+    issued_at = datetime.utcnow()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = issued_at + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.jwt_access_token_expire_minutes)
+        expire = issued_at + timedelta(minutes=settings.jwt_access_token_expire_minutes)
     
-    to_encode.update({"exp": expire})
+    # jti/iat: 토큰 단위 사용자 캐시 키
+    to_encode.update({"exp": expire, "iat": issued_at, "jti": uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
     return encoded_jwt
 
 
+def user_token_claims(user) -> dict:
+    """
+    액세스 토큰에 넣을 사용자 claims
+    - 읽기 전용 엔드포인트(get_current_claims)는 sub(user_id)만 사용
+    - 변경될 수 있는 사용자 정보(email, user_type 등)는 넣지 않고 사용자 행에서 확인 (get_current_user)
+    """
+    return {"sub": str(user.id)}
+
+
 def verify_token(token: str) -> Optional[dict]:
     try:
         payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
@@ -1,8 +1,6 @@
 import asyncio
 import streamlit as st
 from PIL import Image
-import tempfile
-import os
 from core.vto_service.service import analyze_clothes_image
 
 
@@ -51,25 +49,15 @@ def analyze_page():
             st.error("❌ 이미지를 업로드해주세요.")
         else:
             with st.spinner("이미지를 분석 중입니다..."):
-                # 임시 파일로 저장
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp_file:
-                    uploaded_file.seek(0)
-                    tmp_file.write(uploaded_file.read())
-                    tmp_path = tmp_file.name
-                
                 try:
-                    # 비동기 함수 실행
-                    result = asyncio.run(analyze_clothes_image(tmp_path))
+                    # 업로드 bytes를 임시 파일 없이 바로 전달
+                    result = asyncio.run(analyze_clothes_image(uploaded_file.getvalue()))
                     st.session_state.analyze_result = result
                     st.success("✅ 분석 완료!")
                 except Exception as e:
                     st.error(f"❌ 분석 중 오류 발생: {str(e)}")
                     import traceback
                     st.code(traceback.format_exc())
-                finally:
-                    # 임시 파일 삭제
-                    if os.path.exists(tmp_path):
-                        os.unlink(tmp_path)
     
     # 분석 결과 출력
     if st.session_state.analyze_result:
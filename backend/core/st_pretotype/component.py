@@ -2,12 +2,10 @@ import asyncio
 from typing import Dict, Tuple, Optional, List, Tuple
 import streamlit as st
 from PIL import Image
-import tempfile
-import os
-from io import BytesIO
 from core.litellm_hander.utils import ModelOptions as ModelOptionsUtils, ClothesOptions as ClothesOptionsUtils
 from core.litellm_hander.schema import ModelOptions, ClothesOptions
-from core.vto_service.service import image_inference_with_prompt
+from core.vto_service.gemini_handler import GeminiProcesser
+from core.vto_service.service import stream_image_inference_with_prompt
 from prompts.vto_model_prompts import assemble_model_prompt
 from core.st_pretotype.side_view_component import side_view_component
 
@@ -60,43 +58,6 @@ def render_image_uploaders(key_prefix: str, num_uploads: int) -> Tuple[Optional[
     return front_image_file, together_front_image_file
 
 
-def save_images_to_temp_files(
-    front_image, 
-    together_front_image, 
-) -> Tuple[Optional[str], Optional[str]]:
-    """
-    업로드된 이미지들을 임시 파일로 저장합니다.
-    
-    Returns:
-        Tuple: (tmp_front_path, tmp_together_front_path)
-    """
-    tmp_front_path = None
-    tmp_together_front_path = None
-    
-    # 앞면 이미지 저장
-    if front_image is not None:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp_file:
-            front_image.seek(0)
-            tmp_file.write(front_image.read())
-            tmp_front_path = tmp_file.name
-    
-    # 함께 입을 옷 앞면 이미지 저장
-    if together_front_image is not None:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp_file:
-            together_front_image.seek(0)
-            tmp_file.write(together_front_image.read())
-            tmp_together_front_path = tmp_file.name
-    
-    return tmp_front_path, tmp_together_front_path
-
-
-def cleanup_temp_files(*file_paths):
-    """임시 파일들을 삭제합니다."""
-    for file_path in file_paths:
-        if file_path and os.path.exists(file_path):
-            os.unlink(file_path)
-
-
 def render_vto_results(result: Dict, image_count: int):
     """
     VTO 결과를 표시하고 측면 이미지 생성을 위한 이미지 선택 기능을 제공합니다.
@@ -139,8 +100,7 @@ def render_vto_results(result: Dict, image_count: int):
                 for idx, image_bytes in enumerate(front_images):
                     with cols[idx % num_cols]:
                         if isinstance(image_bytes, bytes):
-                            image = Image.open(BytesIO(image_bytes))
-                            st.image(image, caption=f"정면 #{idx+1}", width='stretch')
+                            st.image(image_bytes, caption=f"정면 #{idx+1}", width='stretch')
                             
                             # 선택 버튼 추가
                             global_idx = idx  # 정면 이미지의 글로벌 인덱스
@@ -166,6 +126,70 @@ def render_vto_results(result: Dict, image_count: int):
         st.code(traceback.format_exc())
 
 
+async def stream_vto_results(
+    prompt: str,
+    images: List[bytes],
+    temperature: float,
+    image_count: int,
+    top_p: float,
+    use_cache: bool,
+) -> Dict:
+    """
+    이미지가 완성되는 순서대로 미리보기를 표시하고, 모두 끝나면 render_vto_results용 결과를 반환합니다.
+    
+    Returns:
+        Dict: image_inference_with_prompt와 같은 형식 (response / usage / debug_info)
+    """
+    preview = st.empty()
+    with preview.container():
+        progress = st.progress(0.0, text=f"0/{image_count}개 완료")
+        cols = st.columns(image_count)
+        placeholders = [col.empty() for col in cols]
+        for idx, placeholder in enumerate(placeholders):
+            placeholder.info(f"⏳ 정면 #{idx+1} 생성 중...")
+    
+    response: List[Optional[bytes]] = [None] * image_count
+    usage_data_list = []
+    completed_count = cache_hit_count = 0
+    async for result in stream_image_inference_with_prompt(
+        prompt=prompt,
+        image_paths=images,
+        temperature=temperature,
+        image_count=image_count,
+        top_p=top_p,
+        use_cache=use_cache,
+    ):
+        idx = result["index"]
+        completed_count += 1
+        response[idx] = result["image"]
+        if result["usage"] is not None:
+            usage_data_list.append(result["usage"])
+        cache_hit_count += int(result["cache_hit"])
+        
+        if result["image"] is not None:
+            placeholders[idx].image(result["image"], caption=f"정면 #{idx+1}", width='stretch')
+        else:
+            placeholders[idx].warning(f"⚠️ 정면 #{idx+1} 생성 실패")
+        progress.progress(completed_count / image_count, text=f"{completed_count}/{image_count}개 완료")
+    # 완료 후에는 render_vto_results가 선택 버튼과 함께 다시 표시
+    preview.empty()
+    
+    processer = GeminiProcesser(verbose=False)
+    usage = await processer.sum_usage_data(usage_data_list) if usage_data_list else await processer.calculate_vto_cost(None)
+    success_count = sum(1 for image in response if image is not None)
+    return {
+        "response": response,
+        "usage": usage,
+        "debug_info": {
+            "total_count": image_count,
+            "success_count": success_count,
+            "fail_count": image_count - success_count,
+            "cache_hit_count": cache_hit_count,
+            "model_name": processer.MODEL_NAME,
+        },
+    }
+
+
 def render_usage_info(usage):
     """사용량 정보를 표시합니다."""
     st.divider()
@@ -386,6 +410,11 @@ def virtual_model_tab(model_options: ModelOptions, clothes_options: ClothesOptio
         step=1,
         help="동시에 생성할 이미지 개수입니다. 여러 개를 생성하면 다양한 결과를 얻을 수 있습니다."
     )
+    use_cache = st.checkbox(
+        "이전 결과 재사용 (캐시)",
+        value=False,
+        help="같은 프롬프트/이미지/설정으로 생성한 적이 있으면 비용 없이 이전 결과를 바로 보여줍니다."
+    )
         
     if st.button(
         "🚀 가상 모델 피팅 실행", 
@@ -396,30 +425,28 @@ def virtual_model_tab(model_options: ModelOptions, clothes_options: ClothesOptio
         else:
             with st.spinner("가상 모델 피팅을 실행 중입니다..."):
                 try:
-                    # 이미지를 임시 파일로 저장
-                    tmp_main_path, tmp_sub_path = save_images_to_temp_files(
-                        main_image_file, sub_image_file
-                    )
-                    paths = [tmp_main_path, tmp_sub_path] if tmp_sub_path else [tmp_main_path]
+                    # 업로드 bytes를 임시 파일 없이 바로 전달
+                    images = [main_image_file.getvalue()]
+                    if sub_image_file is not None:
+                        images.append(sub_image_file.getvalue())
                     
-                    result = asyncio.run(image_inference_with_prompt(
+                    # 완성된 이미지부터 바로 표시
+                    result = asyncio.run(stream_vto_results(
                         prompt=assemble_model_prompt(
                             type="front",
                             model_options=model_options,
                             clothes_options=clothes_options
                         ),
-                        image_paths=paths,
+                        images=images,
                         temperature=MODEL_TEMPERATURE,
                         image_count=image_count,
-                        top_p=MODEL_TOP_P
+                        top_p=MODEL_TOP_P,
+                        use_cache=use_cache
                     ))
                     st.session_state.vm_result = result
                     st.success("✅ 가상 모델 피팅 완료!")
                 except Exception as e:
                     st.error(f"❌ 가상 모델 피팅 중 오류 발생: {str(e)}")
-                finally:
-                    # 임시 파일 삭제
-                    cleanup_temp_files(tmp_main_path, tmp_sub_path)
     
     # VTO 결과 출력 (헬퍼 함수 사용)
     if st.session_state.vm_result:
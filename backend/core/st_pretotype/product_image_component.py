@@ -2,11 +2,7 @@ import asyncio
 from typing import Dict
 import streamlit as st
 from PIL import Image
-import tempfile
-import os
-from io import BytesIO
-from core.vto_service.service import image_inference_with_prompt
-from prompts.prod_image_prompts import product_image_prompt
+from core.vto_service.service import generate_product_images, sum_product_image_usage
 
 
 def product_image_sidebar():
@@ -99,85 +95,60 @@ def product_image_tab(settings: Dict[str, str]):
             with st.spinner(
                 f"상품 이미지 생성 중입니다... ({len(uploaded_images)}개 이미지)"
             ):
-                all_results = []
-                tmp_paths = []
-
                 try:
-                    # 각 이미지에 대해 처리하는 비동기 함수
-                    async def process_single_image(uploaded_image):
-                        # 임시 파일로 저장
-                        with tempfile.NamedTemporaryFile(
-                            delete=False, suffix=".png"
-                        ) as tmp_file:
-                            uploaded_image.seek(0)
-                            tmp_file.write(uploaded_image.read())
-                            tmp_path = tmp_file.name
-                            tmp_paths.append(tmp_path)
-
-                        # 상품 이미지 생성 실행
-                        result = await image_inference_with_prompt(
-                            prompt=product_image_prompt(type=settings["mode"]),
-                            image_paths=tmp_paths,
-                            temperature=temperature,
-                            image_count=image_count,
-                        )
-                        return result
-
-                    # 모든 이미지를 병렬로 처리하는 비동기 함수
+                    # 의류별로 자기 입력만 사용해 독립적으로 생성 (완료 순서대로 수집)
                     async def process_all_images():
-                        return await asyncio.gather(
-                            *[process_single_image(img) for img in uploaded_images]
-                        )
+                        items = [
+                            item async for item in generate_product_images(
+                                [img.getvalue() for img in uploaded_images],
+                                mode=settings["mode"],
+                                temperature=temperature,
+                                image_count=image_count,
+                            )
+                        ]
+                        items.sort(key=lambda item: item.index)
+                        return items, await sum_product_image_usage(items)
 
                     # 비동기 함수 실행
-                    all_results = asyncio.run(process_all_images())
+                    items, usage = asyncio.run(process_all_images())
 
-                    # 모든 결과 합치기
+                    # 모든 결과 합치기 (입력 순서 유지)
                     combined_result = {
-                        "response": [],
-                        "usage": all_results[0]["usage"],  # 첫 번째 usage 사용
-                        "debug_info": {},
+                        "response": [image for item in items for image in item.images],
+                        "usage": usage,
+                        "debug_info": {
+                            f"이미지 {item.index + 1}": {"generated": len(item.images), "error": item.error}
+                            for item in items
+                        },
                     }
 
-                    # 모든 이미지 합치기
-                    for result in all_results:
-                        combined_result["response"].extend(
-                            result.get("response", [])
-                        )
+                    st.session_state.product_image_result = combined_result
 
-                    # 사용량 합산
-                    if len(all_results) > 1:
-                        total_tokens = sum(
-                            r["usage"].total_token_count for r in all_results
+                    # 실패한 의류는 사유를 그대로 표시 (전부 실패하면 완료 메시지를 띄우지 않음)
+                    failed_items = [item for item in items if item.error]
+                    for item in failed_items:
+                        st.error(f"❌ 이미지 {item.index + 1} 생성 실패: {item.error}")
+                    if not combined_result["response"]:
+                        st.error("❌ 상품 이미지 생성에 실패했습니다.")
+                    elif failed_items:
+                        st.warning(
+                            f"⚠️ 상품 이미지 일부 생성 완료 ({len(uploaded_images)}개 중 {len(failed_items)}개 실패, 총 {len(combined_result['response'])}개 결과)"
+                        )
+                    else:
+                        st.success(
+                            f"✅ 상품 이미지 생성 완료! ({len(uploaded_images)}개 이미지, 총 {len(combined_result['response'])}개 결과)"
                         )
-                        total_cost_usd = sum(r["usage"].cost_usd for r in all_results)
-                        total_cost_krw = sum(r["usage"].cost_krw for r in all_results)
-
-                        # 첫 번째 usage 객체를 복사하고 값 업데이트
-                        combined_result["usage"].total_token_count = total_tokens
-                        combined_result["usage"].cost_usd = total_cost_usd
-                        combined_result["usage"].cost_krw = total_cost_krw
-
-                    st.session_state.product_image_result = combined_result
-                    st.success(
-                        f"✅ 상품 이미지 생성 완료! ({len(uploaded_images)}개 이미지, 총 {len(combined_result['response'])}개 결과)"
-                    )
 
                 except Exception as e:
                     st.error(f"❌ 상품 이미지 생성 중 오류 발생: {str(e)}")
                     import traceback
 
                     st.code(traceback.format_exc())
-                finally:
-                    # 임시 파일 삭제
-                    for tmp_path in tmp_paths:
-                        if os.path.exists(tmp_path):
-                            os.unlink(tmp_path)
 
     st.divider()
 
     # 사용량 정보
-    if st.session_state.product_image_result:
+    if st.session_state.product_image_result and st.session_state.product_image_result["usage"]:
         st.markdown("**사용량 정보:**")
         usage = st.session_state.product_image_result["usage"]
         col1, col2, col3 = st.columns(3)
@@ -218,9 +189,8 @@ def product_image_tab(settings: Dict[str, str]):
                     for idx, image_bytes in enumerate(product_images):
                         with cols[idx % num_cols]:
                             if isinstance(image_bytes, bytes):
-                                image = Image.open(BytesIO(image_bytes))
                                 st.image(
-                                    image, caption=f"이미지 #{idx + 1}", width="stretch"
+                                    image_bytes, caption=f"이미지 #{idx + 1}", width="stretch"
                                 )
                             else:
                                 st.warning(
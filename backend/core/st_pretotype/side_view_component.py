@@ -1,22 +1,11 @@
 import asyncio
-import tempfile
 import streamlit as st
-from PIL import Image
-from io import BytesIO
 from typing import Optional
 from core.litellm_hander.schema import ModelOptions
 from core.vto_service.service import image_inference_with_prompt
 from prompts.side_view_prompts import side_view_prompt
 
 
-def cleanup_temp_files(*file_paths):
-    """임시 파일들을 삭제합니다."""
-    import os
-    for file_path in file_paths:
-        if file_path and os.path.exists(file_path):
-            os.unlink(file_path)
-
-
 def side_view_component(model_options: ModelOptions, front_image_file=None):
     """
     측면 이미지 생성 컴포넌트 (간소화 버전)
@@ -52,8 +41,7 @@ def side_view_component(model_options: ModelOptions, front_image_file=None):
                 selected_image_bytes = all_images[selected_idx][2]
                 # 미리보기 표시
                 st.info(f"선택된 이미지: {all_images[selected_idx][0]} #{all_images[selected_idx][1]}")
-                preview_image = Image.open(BytesIO(selected_image_bytes))
-                st.image(preview_image, caption="측면 생성에 사용될 이미지", width=300)
+                st.image(selected_image_bytes, caption="측면 생성에 사용될 이미지", width=300)
     else:
         st.warning("⚠️ 먼저 위에서 가상 모델 피팅을 실행해주세요.")
     
@@ -88,33 +76,23 @@ def side_view_component(model_options: ModelOptions, front_image_file=None):
                 st.error("❌ 이미지를 선택하거나 업로드해주세요.")
             else:
                 with st.spinner("측면 이미지를 생성 중입니다... (좌측 & 우측)"):
-                    tmp_paths = []
-                    
                     try:
-                        # 선택된 이미지를 임시 파일로 저장
-                        with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp_file:
-                            tmp_file.write(selected_image_bytes)
-                            tmp_paths.append(tmp_file.name)
-                        
-                        # 원본 이미지 사용
+                        # 선택된 이미지 + 원본 이미지를 임시 파일 없이 bytes로 바로 전달
+                        images = [selected_image_bytes]
                         if front_image_file is not None:
-                            front_image_file.seek(0)
-                            original_bytes = front_image_file.read()
-                            with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp_file:
-                                tmp_file.write(original_bytes)
-                                tmp_paths.append(tmp_file.name)
+                            images.append(front_image_file.getvalue())
                         
                         # 좌측/우측 측면 이미지를 동시에 생성
                         async def generate_side_views():
                             left_task = image_inference_with_prompt(
                                 prompt=side_view_prompt("left", model_options.gender),
-                                image_paths=tmp_paths,
+                                image_paths=images,
                                 temperature=SIDE_VIEW_TEMPERATURE,
                                 image_count=image_count
                             )
                             right_task = image_inference_with_prompt(
                                 prompt=side_view_prompt("right", model_options.gender),
-                                image_paths=tmp_paths,
+                                image_paths=images,
                                 temperature=SIDE_VIEW_TEMPERATURE,
                                 image_count=image_count
                             )
@@ -132,7 +110,7 @@ def side_view_component(model_options: ModelOptions, front_image_file=None):
                             "debug_info": {
                                 "left": left_result.get("debug_info", {}),
                                 "right": right_result.get("debug_info", {}),
-                                "image_count": len(tmp_paths)
+                                "image_count": len(images)
                             }
                         }
                         
@@ -140,9 +118,6 @@ def side_view_component(model_options: ModelOptions, front_image_file=None):
                         st.success("✅ 측면 이미지 생성 완료! (좌측 + 우측)")
                     except Exception as e:
                         st.error(f"❌ 측면 이미지 생성 중 오류 발생: {str(e)}")
-                    finally:
-                        # 모든 임시 파일 삭제
-                        cleanup_temp_files(*tmp_paths)
     
     # 결과 표시
     if st.session_state.get(result_key):
@@ -172,8 +147,7 @@ def side_view_component(model_options: ModelOptions, front_image_file=None):
                     for idx, image_bytes in enumerate(left_images):
                         with cols[idx % num_cols]:
                             if isinstance(image_bytes, bytes):
-                                image = Image.open(BytesIO(image_bytes))
-                                st.image(image, caption=f"좌측 #{idx+1}", width='stretch')
+                                st.image(image_bytes, caption=f"좌측 #{idx+1}", width='stretch')
                             else:
                                 st.warning(f"⚠️ 좌측 이미지 #{idx+1}의 형식이 올바르지 않습니다.")
                 
@@ -185,8 +159,7 @@ def side_view_component(model_options: ModelOptions, front_image_file=None):
                     for idx, image_bytes in enumerate(right_images):
                         with cols[idx % num_cols]:
                             if isinstance(image_bytes, bytes):
-                                image = Image.open(BytesIO(image_bytes))
-                                st.image(image, caption=f"우측 #{idx+1}", width='stretch')
+                                st.image(image_bytes, caption=f"우측 #{idx+1}", width='stretch')
                             else:
                                 st.warning(f"⚠️ 우측 이미지 #{idx+1}의 형식이 올바르지 않습니다.")
                 
@@ -0,0 +1,161 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+from uuid import UUID
+from configs import settings
+from core.security import verify_token
+
+
+class DecodedTokenCache:
+    """
+    디코딩된 JWT payload LRU 캐시
+
+    - 같은 토큰의 서명 검증/디코딩을 반복하지 않음
+    - 만료(exp)가 지난 payload는 적중해도 버리고 None 반환
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[str, dict]" = OrderedDict()
+
+    def decode(self, token: str) -> Optional[dict]:
+        """verify_token과 같은 결과 반환 (유효하지 않은 토큰은 캐시하지 않음)"""
+        with self._lock:
+            payload = self._cache.get(token)
+            if payload is not None:
+                if payload.get("exp") is not None and payload["exp"] <= time.time():
+                    del self._cache[token]
+                    return None
+                self._cache.move_to_end(token)
+                return payload
+
+        payload = verify_token(token)
+        if payload is not None:
+            with self._lock:
+                self._cache[token] = payload
+                while len(self._cache) > self.max_size:
+                    self._cache.popitem(last=False)
+        return payload
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+class UserCache:
+    """
+    인증 사용자 TTL 캐시 (프로세스 내)
+
+    - 키: (user_id, 토큰 jti 또는 iat), 값: users 컬럼 스냅샷
+    - 사용자 정보 변경/삭제 시 invalidate(user_id)로 해당 사용자의 모든 항목 제거
+    - 다른 프로세스에서의 변경은 TTL 안에서만 늦게 반영됨
+    - 삭제된 사용자는 토큰 만료 시간 동안 tombstone으로 남겨 claims 전용 인증도 거부
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int, tombstone_ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.tombstone_ttl_seconds = tombstone_ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[UUID, Hashable], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._keys_by_user: Dict[UUID, set] = {}
+        self._deleted: Dict[UUID, float] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _remove_locked(self, key: Tuple[UUID, Hashable]) -> None:
+        self._entries.pop(key, None)
+        keys = self._keys_by_user.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[key[0]]
+
+    def get(self, user_id: UUID, token_key: Hashable) -> Optional[Dict[str, Any]]:
+        key = (user_id, token_key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    self._remove_locked(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, user_id: UUID, token_key: Hashable, snapshot: Dict[str, Any]) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        key = (user_id, token_key)
+        with self._lock:
+            if user_id in self._deleted:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, snapshot)
+            self._entries.move_to_end(key)
+            self._keys_by_user.setdefault(user_id, set()).add(key)
+            while len(self._entries) > self.max_size:
+                oldest = next(iter(self._entries))
+                self._remove_locked(oldest)
+
+    def invalidate(self, user_id: UUID, deleted: bool = False) -> None:
+        """사용자 항목 전체 제거 (deleted=True면 tombstone 기록)"""
+        with self._lock:
+            for key in list(self._keys_by_user.get(user_id, ())):
+                self._remove_locked(key)
+            if deleted:
+                self._deleted[user_id] = time.monotonic() + self.tombstone_ttl_seconds
+
+    def is_deleted(self, user_id: UUID) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            expires_at = self._deleted.get(user_id)
+            if expires_at is None:
+                return False
+            if expires_at <= now:
+                del self._deleted[user_id]
+                return False
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+            self._deleted.clear()
+
+
+_token_cache: Optional[DecodedTokenCache] = None
+_user_cache: Optional[UserCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_token_cache() -> DecodedTokenCache:
+    """프로세스 전역 DecodedTokenCache 반환 (최초 호출 시 생성)"""
+    global _token_cache
+    if _token_cache is None:
+        with _cache_lock:
+            if _token_cache is None:
+                _token_cache = DecodedTokenCache(max_size=settings.auth_token_cache_max_size)
+    return _token_cache
+
+
+def get_user_cache() -> UserCache:
+    """프로세스 전역 UserCache 반환 (최초 호출 시 생성)"""
+    global _user_cache
+    if _user_cache is None:
+        with _cache_lock:
+            if _user_cache is None:
+                _user_cache = UserCache(
+                    ttl_seconds=settings.auth_user_cache_ttl_seconds,
+                    max_size=settings.auth_user_cache_max_size,
+                    tombstone_ttl_seconds=settings.jwt_access_token_expire_minutes * 60,
+                )
+    return _user_cache
+
+
+def invalidate_user(user_id: UUID, deleted: bool = False) -> None:
+    """사용자 정보 변경(update_me, OAuth 갱신)/삭제(delete_me) 후 호출"""
+    get_user_cache().invalidate(user_id, deleted=deleted)
@@ -0,0 +1,276 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Hashable, Optional
+from pydantic import BaseModel, Field
+from configs import settings
+from core.vto_service.rate_limiter import AdaptiveLimiter
+
+
+class AdmissionMetrics(BaseModel):
+    max_in_flight: int = Field(..., description="전역 동시 요청 상한")
+    adaptive_limit: int = Field(..., description="429/503 피드백으로 조정된 현재 동시 요청 한도")
+    blocked_for: float = Field(0.0, description="Retry-After로 승인 보류 중인 남은 시간(초)")
+    in_flight: int = Field(..., description="현재 진행 중인 요청 수")
+    queue_depth: int = Field(..., description="대기 중인 요청 수")
+    waiting_callers: int = Field(..., description="대기 중인 호출자 수")
+    admitted_total: int = Field(..., description="누적 승인 요청 수")
+    wait_time_last: float = Field(..., description="마지막 대기 시간(초)")
+    wait_time_avg: float = Field(..., description="평균 대기 시간(초)")
+    wait_time_max: float = Field(..., description="최대 대기 시간(초)")
+    requests_last_minute: Dict[str, int] = Field(..., description="모델별 최근 1분 요청 수")
+
+
+@dataclass
+class _Waiter:
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    model: str
+    enqueued_at: float = field(default_factory=time.monotonic)
+    granted: bool = False
+
+
+class AdmissionController:
+    """
+    프로세스 전역 Gemini 요청 승인 컨트롤러
+
+    - 전역 동시 요청 상한(max_in_flight)과 모델별 분당 요청 예산(RPM)을 함께 적용
+    - 호출자(caller)별 FIFO 큐를 라운드로빈으로 승인하여 한 사용자가 슬롯을 독점하지 않음
+    - 상태는 threading.Lock으로 보호하고 승인은 call_soon_threadsafe로 전달하므로
+      여러 스레드/이벤트 루프(Streamlit의 asyncio.run 등)에서 함께 사용 가능
+    - limiter가 주어지면 AIMD로 조정된 한도와 Retry-After 보류 시간을 함께 적용
+    """
+
+    WINDOW_SECONDS = 60.0
+
+    def __init__(
+        self,
+        max_in_flight: int = 10,
+        default_requests_per_minute: int = 0,
+        requests_per_minute: Optional[Dict[str, int]] = None,
+        limiter: Optional[AdaptiveLimiter] = None,
+    ):
+        """
+        Args:
+            max_in_flight: 전역 동시 요청 상한
+            default_requests_per_minute: 모델별 분당 요청 예산 기본값 (0이면 무제한)
+            requests_per_minute: 모델별 분당 요청 예산 (기본값보다 우선)
+            limiter: 429/503 피드백 기반 적응형 한도 (없으면 max_in_flight 고정)
+        """
+        self.max_in_flight = max(1, max_in_flight)
+        self.limiter = limiter
+        self.default_requests_per_minute = default_requests_per_minute
+        self.requests_per_minute = dict(requests_per_minute or {})
+
+        self._lock = threading.Lock()
+        self._queues: "OrderedDict[Hashable, Deque[_Waiter]]" = OrderedDict()
+        self._grants: Dict[str, Deque[float]] = {}
+        self._in_flight = 0
+        # RPM 예산/Retry-After로 보류된 대기자를 깨우는 재배분 타이머 (가장 이른 시점 하나만 유지)
+        self._redispatch_timer: Optional[threading.Timer] = None
+        self._redispatch_at = 0.0
+
+        # 메트릭
+        self._admitted_total = 0
+        self._wait_time_total = 0.0
+        self._wait_time_last = 0.0
+        self._wait_time_max = 0.0
+
+    def _capacity(self) -> int:
+        if self.limiter is None:
+            return self.max_in_flight
+        return min(self.max_in_flight, self.limiter.limit)
+
+    def _rpm_limit(self, model: str) -> int:
+        return self.requests_per_minute.get(model, self.default_requests_per_minute)
+
+    def _rpm_delay(self, model: str, now: float) -> float:
+        """모델의 분당 예산이 소진된 경우 다음 승인까지 남은 시간(초)"""
+        limit = self._rpm_limit(model)
+        if limit <= 0:
+            return 0.0
+        grants = self._grants.setdefault(model, deque())
+        while grants and now - grants[0] >= self.WINDOW_SECONDS:
+            grants.popleft()
+        if len(grants) < limit:
+            return 0.0
+        return self.WINDOW_SECONDS - (now - grants[0])
+
+    def _grant(self, waiter: _Waiter, now: float) -> None:
+        waiter.granted = True
+        self._in_flight += 1
+        if self._rpm_limit(waiter.model) > 0:
+            self._grants.setdefault(waiter.model, deque()).append(now)
+
+        wait_time = now - waiter.enqueued_at
+        self._admitted_total += 1
+        self._wait_time_total += wait_time
+        self._wait_time_last = wait_time
+        self._wait_time_max = max(self._wait_time_max, wait_time)
+
+        def _set_result(future: asyncio.Future = waiter.future) -> None:
+            if not future.done():
+                future.set_result(None)
+
+        try:
+            waiter.loop.call_soon_threadsafe(_set_result)
+        except RuntimeError:
+            # 대기자의 이벤트 루프가 이미 닫힌 경우 슬롯 반환
+            self._in_flight -= 1
+
+    def _schedule_redispatch(self, delay: Optional[float]) -> None:
+        """delay초 후 _dispatch 재실행 예약 (lock 보유 상태에서 호출, 이미 더 이른 예약이 있으면 유지)"""
+        if delay is None:
+            return
+        run_at = time.monotonic() + delay
+        if self._redispatch_timer is not None:
+            if self._redispatch_at <= run_at:
+                return
+            self._redispatch_timer.cancel()
+        timer = threading.Timer(delay, self._redispatch)
+        timer.daemon = True
+        self._redispatch_timer = timer
+        self._redispatch_at = run_at
+        timer.start()
+
+    def _redispatch(self) -> None:
+        with self._lock:
+            self._redispatch_timer = None
+            self._dispatch()
+
+    def _dispatch(self) -> Optional[float]:
+        """
+        빈 슬롯을 호출자 라운드로빈으로 배분 (lock 보유 상태에서 호출)
+
+        - 보류된 대기자가 있으면 재배분을 예약하므로 호출자는 반환값을 무시해도 됨
+
+        Returns:
+            Optional[float]: RPM 예산/Retry-After 때문에 대기 중인 요청이 있으면 재시도까지 남은 시간(초)
+        """
+        next_delay = self._dispatch_ready()
+        self._schedule_redispatch(next_delay)
+        return next_delay
+
+    def _dispatch_ready(self) -> Optional[float]:
+        if self.limiter is not None:
+            blocked_for = self.limiter.blocked_for()
+            if blocked_for > 0:
+                return blocked_for if self._queues else None
+
+        next_delay = None
+        now = time.monotonic()
+        progressed = True
+
+        while progressed and self._in_flight < self._capacity():
+            progressed = False
+            for caller, queue in self._queues.items():
+                waiter = queue[0]
+                delay = self._rpm_delay(waiter.model, now)
+                if delay > 0:
+                    next_delay = delay if next_delay is None else min(next_delay, delay)
+                    continue
+
+                queue.popleft()
+                if queue:
+                    self._queues.move_to_end(caller)
+                else:
+                    del self._queues[caller]
+                self._grant(waiter, now)
+                progressed = True
+                break
+
+        return next_delay
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._dispatch()
+
+    async def acquire(self, model: str, caller: Hashable) -> None:
+        """승인될 때까지 대기 (승인 후 반드시 _release 필요)"""
+        waiter = _Waiter(
+            loop=asyncio.get_running_loop(),
+            future=asyncio.get_running_loop().create_future(),
+            model=model,
+        )
+        with self._lock:
+            self._queues.setdefault(caller, deque()).append(waiter)
+            retry_after = self._dispatch()
+
+        try:
+            while not waiter.future.done():
+                await asyncio.wait([waiter.future], timeout=retry_after)
+                if not waiter.future.done():
+                    with self._lock:
+                        retry_after = self._dispatch()
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    self._in_flight -= 1
+                    self._dispatch()
+                else:
+                    queue = self._queues.get(caller)
+                    if queue is not None and waiter in queue:
+                        queue.remove(waiter)
+                        if not queue:
+                            del self._queues[caller]
+            raise
+
+    @asynccontextmanager
+    async def admit(self, model: str, caller: Hashable):
+        """
+        요청 승인 컨텍스트
+
+        Args:
+            model: 요청 대상 모델 이름 (RPM 예산 단위)
+            caller: 공정 큐잉 단위 (요청 묶음/사용자 식별자)
+        """
+        await self.acquire(model, caller)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def metrics(self) -> AdmissionMetrics:
+        with self._lock:
+            now = time.monotonic()
+            requests_last_minute = {}
+            for model, grants in self._grants.items():
+                requests_last_minute[model] = sum(1 for t in grants if now - t < self.WINDOW_SECONDS)
+            return AdmissionMetrics(
+                max_in_flight=self.max_in_flight,
+                adaptive_limit=self._capacity(),
+                blocked_for=round(self.limiter.blocked_for(), 3) if self.limiter is not None else 0.0,
+                in_flight=self._in_flight,
+                queue_depth=sum(len(q) for q in self._queues.values()),
+                waiting_callers=len(self._queues),
+                admitted_total=self._admitted_total,
+                wait_time_last=round(self._wait_time_last, 3),
+                wait_time_avg=round(self._wait_time_total / self._admitted_total, 3) if self._admitted_total else 0.0,
+                wait_time_max=round(self._wait_time_max, 3),
+                requests_last_minute=requests_last_minute,
+            )
+
+
+_admission_controller: Optional[AdmissionController] = None
+_admission_controller_lock = threading.Lock()
+
+
+def get_admission_controller() -> AdmissionController:
+    """프로세스 전역 AdmissionController 반환 (최초 호출 시 생성)"""
+    global _admission_controller
+    if _admission_controller is None:
+        with _admission_controller_lock:
+            if _admission_controller is None:
+                _admission_controller = AdmissionController(
+                    max_in_flight=settings.gemini_max_in_flight_requests,
+                    default_requests_per_minute=settings.gemini_requests_per_minute,
+                    limiter=AdaptiveLimiter(
+                        max_limit=settings.gemini_max_in_flight_requests,
+                        min_limit=settings.gemini_min_in_flight_requests,
+                    ),
+                )
+    return _admission_controller
@@ -0,0 +1,131 @@
+import asyncio
+import itertools
+import threading
+from typing import Dict, List, Optional
+import httpx
+from google import genai
+from google.genai import types
+from configs import settings
+from custom_logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class GeminiClientPool:
+    """
+    프로세스 전역 genai.Client 레지스트리
+
+    - 이벤트 루프별로 keep-alive 커넥션 풀을 가진 Client를 pool_size개 만들어 재사용
+    - httpx.AsyncClient는 생성된 이벤트 루프에 묶이므로 루프 단위로 분리 보관
+    - Streamlit처럼 asyncio.run()을 매번 호출하는 환경에서는 닫힌 루프의 항목을 정리
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        pool_size: int = 2,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 60.0,
+        connect_timeout: float = 10.0,
+    ):
+        self.api_key = api_key
+        self.pool_size = max(1, pool_size)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        # 이미지 생성은 수십 초가 걸리므로 읽기 타임아웃은 두지 않음
+        self.timeout = httpx.Timeout(None, connect=connect_timeout)
+
+        self._lock = threading.Lock()
+        self._sync_http_client: Optional[httpx.Client] = None
+        self._clients: Dict[Optional[asyncio.AbstractEventLoop], List[genai.Client]] = {}
+        self._async_http_clients: Dict[Optional[asyncio.AbstractEventLoop], List[httpx.AsyncClient]] = {}
+        self._cursors: Dict[Optional[asyncio.AbstractEventLoop], itertools.cycle] = {}
+
+    @staticmethod
+    def _current_loop() -> Optional[asyncio.AbstractEventLoop]:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    def _discard_closed_loops(self) -> None:
+        """닫힌 이벤트 루프에 묶인 Client 정리 (참조만 해제하여 GC에 맡김)"""
+        for loop in [loop for loop in self._clients if loop is not None and loop.is_closed()]:
+            del self._clients[loop]
+            del self._async_http_clients[loop]
+            del self._cursors[loop]
+
+    def _create_client(self, async_http_client: httpx.AsyncClient) -> genai.Client:
+        if self._sync_http_client is None:
+            self._sync_http_client = httpx.Client(limits=self.limits, timeout=self.timeout)
+        return genai.Client(
+            api_key=self.api_key,
+            http_options=types.HttpOptions(
+                httpx_client=self._sync_http_client,
+                httpx_async_client=async_http_client,
+            ),
+        )
+
+    def acquire(self) -> genai.Client:
+        """현재 이벤트 루프에 해당하는 Client를 라운드로빈으로 반환"""
+        loop = self._current_loop()
+        with self._lock:
+            if loop not in self._clients:
+                self._discard_closed_loops()
+                async_http_clients = [
+                    httpx.AsyncClient(limits=self.limits, timeout=self.timeout)
+                    for _ in range(self.pool_size)
+                ]
+                self._async_http_clients[loop] = async_http_clients
+                self._clients[loop] = [self._create_client(c) for c in async_http_clients]
+                self._cursors[loop] = itertools.cycle(self._clients[loop])
+            return next(self._cursors[loop])
+
+    async def aclose(self) -> None:
+        """현재 이벤트 루프의 커넥션 및 동기 커넥션 종료"""
+        loop = self._current_loop()
+        with self._lock:
+            async_http_clients = self._async_http_clients.pop(loop, [])
+            self._clients.pop(loop, None)
+            self._cursors.pop(loop, None)
+            self._discard_closed_loops()
+            sync_http_client, self._sync_http_client = self._sync_http_client, None
+
+        for http_client in async_http_clients:
+            await http_client.aclose()
+        if sync_http_client is not None:
+            sync_http_client.close()
+        logger.info(f"Gemini client pool closed ({len(async_http_clients)} async clients)")
+
+
+_client_pool: Optional[GeminiClientPool] = None
+_client_pool_lock = threading.Lock()
+
+
+def get_gemini_client_pool() -> GeminiClientPool:
+    """프로세스 전역 GeminiClientPool 반환 (최초 호출 시 생성)"""
+    global _client_pool
+    if _client_pool is None:
+        with _client_pool_lock:
+            if _client_pool is None:
+                _client_pool = GeminiClientPool(
+                    api_key=settings.gemini_api_key,
+                    pool_size=settings.gemini_client_pool_size,
+                    max_connections=settings.gemini_max_connections,
+                    max_keepalive_connections=settings.gemini_max_keepalive_connections,
+                    keepalive_expiry=settings.gemini_keepalive_expiry,
+                )
+    return _client_pool
+
+
+async def close_gemini_client_pool() -> None:
+    """FastAPI lifespan 종료 시 호출"""
+    global _client_pool
+    with _client_pool_lock:
+        client_pool, _client_pool = _client_pool, None
+    if client_pool is not None:
+        await client_pool.aclose()
@@ -0,0 +1,169 @@
+import asyncio
+import hashlib
+import io
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from google.genai import types
+from configs import settings
+from core.vto_service.client_pool import get_gemini_client_pool
+from custom_logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class UploadedFile:
+    uri: str
+    mime_type: str
+    expires_at: float  # time.time() 기준 만료 시각
+
+
+class GeminiFilesBackend:
+    """Gemini Files API 업로드 백엔드 (업로드 파일은 약 48시간 후 만료)"""
+
+    DEFAULT_TTL_SECONDS = 48 * 60 * 60
+    PROCESSING_POLL_INTERVAL = 0.5
+    PROCESSING_MAX_POLLS = 20
+
+    async def upload(self, data: bytes, mime_type: str) -> UploadedFile:
+        client = get_gemini_client_pool().acquire()
+        file = await client.aio.files.upload(
+            file=io.BytesIO(data),
+            config=types.UploadFileConfig(mime_type=mime_type),
+        )
+        # 이미지는 대부분 바로 ACTIVE지만, 처리 중이면 잠시 대기
+        for _ in range(self.PROCESSING_MAX_POLLS):
+            if file.state is None or file.state == types.FileState.ACTIVE:
+                break
+            if file.state == types.FileState.FAILED:
+                raise RuntimeError(f"File upload failed: {file.name}")
+            await asyncio.sleep(self.PROCESSING_POLL_INTERVAL)
+            file = await client.aio.files.get(name=file.name)
+
+        if file.expiration_time is not None:
+            expires_at = file.expiration_time.replace(tzinfo=file.expiration_time.tzinfo or timezone.utc).timestamp()
+        else:
+            expires_at = time.time() + self.DEFAULT_TTL_SECONDS
+        return UploadedFile(uri=file.uri, mime_type=file.mime_type or mime_type, expires_at=expires_at)
+
+
+class LocalStubBackend:
+    """
+    테스트/로컬 개발용 업로드 백엔드 (네트워크 호출 없이 메모리에 저장)
+    """
+
+    def __init__(self, ttl_seconds: float = 48 * 60 * 60):
+        self.ttl_seconds = ttl_seconds
+        self.files: Dict[str, bytes] = {}
+        self.upload_count = 0
+
+    async def upload(self, data: bytes, mime_type: str) -> UploadedFile:
+        self.upload_count += 1
+        uri = f"stub://files/{hashlib.sha256(data).hexdigest()[:16]}-{self.upload_count}"
+        self.files[uri] = data
+        return UploadedFile(uri=uri, mime_type=mime_type, expires_at=time.time() + self.ttl_seconds)
+
+
+class FileUploadManager:
+    """
+    의류 이미지 업로드 캐시 (Gemini Files API)
+
+    - 같은 이미지가 샘플 수 × 뷰 × 스타일컷만큼 반복 전송되므로 한 번만 업로드하고 파일 참조로 대체
+    - 키: 이미지 bytes SHA-256 + MIME, 만료 expiry_margin 이전까지만 재사용
+    - 같은 이미지의 동시 업로드는 하나로 합침 (이벤트 루프 단위)
+    - min_bytes보다 작은 이미지는 업로드 왕복 비용이 더 크므로 인라인 유지
+    """
+
+    def __init__(self, backend, min_bytes: int = 256 * 1024, expiry_margin: float = 60 * 60):
+        self.backend = backend
+        self.min_bytes = min_bytes
+        self.expiry_margin = expiry_margin
+
+        self._lock = threading.Lock()
+        self._files: Dict[str, UploadedFile] = {}
+        self._inflight: Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Task] = {}
+
+    @staticmethod
+    def _key(data: bytes, mime_type: str) -> str:
+        return f"{hashlib.sha256(data).hexdigest()}:{mime_type}"
+
+    def _get_valid(self, key: str) -> Optional[UploadedFile]:
+        with self._lock:
+            uploaded = self._files.get(key)
+            if uploaded is None:
+                return None
+            if uploaded.expires_at - self.expiry_margin <= time.time():
+                del self._files[key]
+                return None
+            return uploaded
+
+    async def _upload(self, key: str, data: bytes, mime_type: str) -> UploadedFile:
+        uploaded = await self.backend.upload(data, mime_type)
+        with self._lock:
+            self._files[key] = uploaded
+        logger.info(f"Uploaded garment image: {uploaded.uri} ({len(data)} bytes)")
+        return uploaded
+
+    async def get_or_upload(self, data: bytes, mime_type: str) -> UploadedFile:
+        """캐시된 파일 참조 반환 (없거나 만료 임박이면 업로드)"""
+        key = await asyncio.to_thread(self._key, data, mime_type)
+        uploaded = self._get_valid(key)
+        if uploaded is not None:
+            return uploaded
+
+        inflight_key = (asyncio.get_running_loop(), key)
+        task = self._inflight.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(self._upload(key, data, mime_type))
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(inflight_key, None))
+        return await asyncio.shield(task)
+
+    async def to_file_part(self, content):
+        """
+        인라인 이미지 Part를 파일 참조 Part로 대체 (그 외 콘텐츠는 그대로 반환)
+        업로드에 실패하면 인라인 Part를 그대로 사용
+        """
+        if not isinstance(content, types.Part) or content.inline_data is None:
+            return content
+        data = content.inline_data.data or b""
+        mime_type = content.inline_data.mime_type or "application/octet-stream"
+        if len(data) < self.min_bytes:
+            return content
+        try:
+            uploaded = await self.get_or_upload(data, mime_type)
+        except Exception as e:
+            logger.warning(f"File upload failed, sending inline: {e}")
+            return content
+        return types.Part.from_uri(file_uri=uploaded.uri, mime_type=uploaded.mime_type)
+
+    async def substitute(self, contents_list: List) -> List:
+        """contents_list의 인라인 이미지를 파일 참조로 대체 (순서 유지)"""
+        return list(await asyncio.gather(*[self.to_file_part(content) for content in contents_list]))
+
+    def invalidate(self, uri: str) -> None:
+        """만료/삭제된 파일 참조 제거"""
+        with self._lock:
+            for key in [key for key, uploaded in self._files.items() if uploaded.uri == uri]:
+                del self._files[key]
+
+
+_file_upload_manager: Optional[FileUploadManager] = None
+_file_upload_manager_lock = threading.Lock()
+
+
+def get_file_upload_manager() -> FileUploadManager:
+    """프로세스 전역 FileUploadManager 반환 (최초 호출 시 생성)"""
+    global _file_upload_manager
+    if _file_upload_manager is None:
+        with _file_upload_manager_lock:
+            if _file_upload_manager is None:
+                backend = LocalStubBackend() if settings.gemini_file_upload_backend == "stub" else GeminiFilesBackend()
+                _file_upload_manager = FileUploadManager(
+                    backend=backend,
+                    min_bytes=settings.gemini_file_upload_min_bytes,
+                )
+    return _file_upload_manager
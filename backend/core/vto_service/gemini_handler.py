@@ -1,13 +1,24 @@
-from typing import Union, Optional, Tuple, Dict, List
+from typing import Union, Optional, Tuple, Dict, List, Hashable, AsyncIterator, Sequence
 import aiofiles
 import asyncio
 import io
+import time
+import uuid
 from google import genai
 from google.genai import types
+from google.genai import errors as genai_errors
 from PIL import Image
 import numpy as np
-from configs import settings
 from core.litellm_hander.schema import LiteLLMUsageData
+from core.vto_service.client_pool import get_gemini_client_pool
+from core.vto_service.admission import get_admission_controller
+from core.vto_service.rate_limiter import classify_gemini_error
+from core.vto_service.result_cache import ImageResultCache, get_result_cache
+from core.vto_service.hedging import get_latency_tracker, get_hedge_delay
+from core.vto_service.image_normalizer import ImageBuffer, as_image_bytes, get_image_normalizer
+from core.vto_service.image_executor import get_image_executor
+from core.vto_service.file_upload_cache import get_file_upload_manager
+from configs import settings
 
 
 class GeminiProcesser:
@@ -27,9 +38,6 @@ class GeminiProcesser:
     RETRY_DELAY = 2.0  # 초
     RETRY_BACKOFF_MULTIPLIER = 2.0
     
-    # 배치 처리 설정
-    MAX_CONCURRENT_REQUESTS = 10  # 동시 요청 최대 개수
-    
     # Safety settings (클래스 레벨에서 한 번만 생성)
     SAFETY_SETTINGS = [
         types.SafetySetting(
@@ -55,17 +63,17 @@ class GeminiProcesser:
         Args:
             verbose: 로깅 출력 여부 (기본값: True)
         """
-        self.client = genai.Client(api_key=settings.gemini_api_key)
-        self.aio_client = self.client.aio
         self.verbose = verbose
+
+    @property
+    def client(self) -> genai.Client:
+        """프로세스 전역 Client 풀에서 빌려온 Client (keep-alive 커넥션 재사용)"""
+        return get_gemini_client_pool().acquire()
+
+    @property
+    def aio_client(self):
+        return self.client.aio
         
-    @staticmethod
-    def _pil_to_png_bytes(image: Image.Image) -> bytes:
-        """PIL Image를 PNG bytes로 변환"""
-        buffer = io.BytesIO()
-        image.save(buffer, format='PNG')
-        return buffer.getvalue()
-    
     @staticmethod
     def _extract_image_from_response(response) -> Optional[bytes]:
         """응답에서 이미지 데이터 추출"""
@@ -76,19 +84,21 @@ class GeminiProcesser:
     
     def _create_usage_data(self, total_token_count: int = 0, prompt_token_count: int = 0,
                         candidates_token_count: int = 0, cost_usd: float = 0.0,
-                        cost_krw: float = 0.0) -> LiteLLMUsageData:
+                        cost_krw: float = 0.0, hedge_request_count: int = 0,
+                        cached_content_token_count: int = 0, thoughts_token_count: int = 0) -> LiteLLMUsageData:
         """LiteLLMUsageData 생성"""
         return LiteLLMUsageData(
             total_token_count=total_token_count,
             prompt_token_count=prompt_token_count,
             candidates_token_count=candidates_token_count,
             output_token_count=candidates_token_count,
-            cached_content_token_count=0,
-            thoughts_token_count=0,
+            cached_content_token_count=cached_content_token_count,
+            thoughts_token_count=thoughts_token_count,
             model_name=self.MODEL_NAME,
             cost_usd=round(cost_usd, 6),
             cost_krw=round(cost_krw, 2),
-            task_name=self.TASK_NAME
+            task_name=self.TASK_NAME,
+            hedge_request_count=hedge_request_count
         )
     
     @staticmethod
@@ -105,32 +115,36 @@ class GeminiProcesser:
         
         return text_tokens, image_tokens
 
-    async def create_image_content(self, image: Union[Image.Image, bytes, str, np.ndarray], 
+    async def create_image_content(self, image: Union[Image.Image, ImageBuffer, str, np.ndarray], 
                                 use_resize: bool = False) -> types.Part:
-        """이미지를 Gemini API 형식으로 변환"""
+        """
+        이미지를 Gemini API 형식으로 변환
+        
+        - 모든 입력을 정규화 단계(MIME 판별, EXIF 회전, 긴 변 축소, 재인코딩)에 통과시킴
+        - 경로/bytes 입력은 원본 해시로 정규화 결과를 캐시하여 같은 의류 이미지는 한 번만 인코딩
+        
+        Args:
+            image: 이미지 경로, bytes/bytearray/memoryview/BytesIO, PIL Image 또는 numpy array
+            use_resize: 하위 호환용 (축소는 항상 VTO_IMAGE_MAX_EDGE 기준으로 적용)
+        """
+        normalizer = get_image_normalizer()
         
         # 문자열 경로인 경우: 파일 읽기
         if isinstance(image, str):
             async with aiofiles.open(image, "rb") as f:
-                image_bytes = await f.read()
-            return types.Part.from_bytes(data=image_bytes, mime_type="image/png")
+                image = await f.read()
         
-        # bytes인 경우: 그대로 사용
-        if isinstance(image, bytes):
-            return types.Part.from_bytes(data=image, mime_type="image/png")
+        # bytes/버퍼인 경우: 정규화 (캐시 우선, 원본 그대로 전달 가능하면 복사 없이 사용)
+        if isinstance(image, (bytes, bytearray, memoryview, io.BytesIO)):
+            normalized = await normalizer.normalize_bytes(as_image_bytes(image))
+            return types.Part.from_bytes(data=normalized.data, mime_type=normalized.mime_type)
         
         # numpy array인 경우: PIL Image로 변환
         if isinstance(image, np.ndarray):
             image = Image.fromarray(image)
         
-        # PIL Image 처리 (resize 옵션 적용)
-        if use_resize and (image.width > 1024 or image.height > 1024):
-            image.thumbnail([1024, 1024], Image.Resampling.LANCZOS)
-        
-        return types.Part.from_bytes(
-            data=self._pil_to_png_bytes(image),
-            mime_type="image/png"
-        )
+        normalized = await normalizer.normalize_pil(image)
+        return types.Part.from_bytes(data=normalized.data, mime_type=normalized.mime_type)
     
     async def calculate_vto_cost(self, usage_metadata) -> LiteLLMUsageData:
         """
@@ -178,7 +192,7 @@ class GeminiProcesser:
         
     async def sum_usage_data(self, usage_data_list: List[LiteLLMUsageData]) -> LiteLLMUsageData:
         """
-        여러 LiteLLMUsageData를 합산
+        여러 LiteLLMUsageData를 합산 (검수 등 LiteLLM 사용량의 캐시/사고 토큰 포함)
         
         Args:
             usage_data_list: LiteLLMUsageData 리스트
@@ -191,76 +205,250 @@ class GeminiProcesser:
             prompt_token_count=sum(u.prompt_token_count for u in usage_data_list),
             candidates_token_count=sum(u.candidates_token_count for u in usage_data_list),
             cost_usd=sum(u.cost_usd for u in usage_data_list),
-            cost_krw=sum(u.cost_krw for u in usage_data_list)
+            cost_krw=sum(u.cost_krw for u in usage_data_list),
+            hedge_request_count=sum(u.hedge_request_count for u in usage_data_list),
+            cached_content_token_count=sum(u.cached_content_token_count for u in usage_data_list),
+            thoughts_token_count=sum(u.thoughts_token_count for u in usage_data_list),
         )
     
     async def load_clothes_images(
         self,
         image_path: Optional[str],
-    ) -> Optional[Image.Image]:
+    ) -> Optional[bytes]:
         """
-        의류 이미지를 로드하는 헬퍼 함수
+        의류 이미지 파일을 bytes로 로드하는 헬퍼 함수 (디코딩하지 않음)
         
         Args:
             image_path: 의류 이미지 경로
         
         Returns:
-            Optional[Image.Image]: 의류 이미지
+            Optional[bytes]: 원본 인코딩 그대로의 이미지 bytes
+        """
+        if not image_path:
+            return None
+        async with aiofiles.open(image_path, "rb") as f:
+            return await f.read()
+
+    async def load_image_contents(self, images: Sequence[Union[str, ImageBuffer]]) -> List[types.Part]:
+        """
+        여러 이미지를 동시에 Gemini API 형식으로 변환 (입력 순서 유지)
+        
+        - 경로는 파일을 읽고, bytes/bytearray/memoryview/BytesIO는 디스크를 거치지 않고 바로 정규화
+        - 파일 읽기와 정규화를 이미지별로 병렬 실행
+        - 허용 형식(PNG/JPEG/WebP)이고 크기가 적당하면 디코딩/재인코딩 없이 원본 bytes 그대로 전달
+        """
+        async def load_one(image: Union[str, ImageBuffer]) -> types.Part:
+            if isinstance(image, str):
+                image = await self.load_clothes_images(image)
+            return await self.create_image_content(image)
+        
+        return list(await asyncio.gather(*[load_one(image) for image in images]))
+
+    def _estimate_input_usage(self, prompt_token_count: int) -> LiteLLMUsageData:
+        """
+        응답을 받기 전에 취소된 헤지 요청의 비용 추정 (입력 토큰 비용만 반영)
+        """
+        cost_usd = (prompt_token_count / 1_000_000) * self.INPUT_PRICE_PER_1M_TOKENS
+        return self._create_usage_data(
+            total_token_count=prompt_token_count,
+            prompt_token_count=prompt_token_count,
+            cost_usd=cost_usd,
+            cost_krw=cost_usd * self.USD_TO_KRW_RATE,
+            hedge_request_count=1
+        )
+
+    async def _generate_content(self, contents, config: types.GenerateContentConfig,
+                                caller_id: Hashable, attempt_timeout: Optional[float],
+                                admitted: Optional[asyncio.Event] = None):
+        """
+        승인 슬롯을 받아 generate_content 1회 호출
+        (attempt_timeout 초과 시 TimeoutError, 성공 시 지연 시간 기록)
+        
+        Args:
+            admitted: 승인 직후(요청 전송 직전) set되는 이벤트 (헤지 시점 계산용)
+        """
+        admission_controller = get_admission_controller()
+        limiter = admission_controller.limiter
+        async with admission_controller.admit(self.MODEL_NAME, caller_id):
+            if admitted is not None:
+                admitted.set()
+            started_at = time.monotonic()
+            response = await asyncio.wait_for(
+                self.aio_client.models.generate_content(
+                    model=self.MODEL_NAME,
+                    contents=contents,
+                    config=config
+                ),
+                timeout=attempt_timeout
+            )
+            get_latency_tracker().record(time.monotonic() - started_at)
+            if limiter is not None:
+                limiter.on_success()
+        return response
+
+    async def _generate_content_hedged(self, contents, config: types.GenerateContentConfig,
+                                       caller_id: Hashable, attempt_timeout: Optional[float]):
+        """
+        헤지 요청을 포함한 1회 시도
+        
+        - 첫 요청이 최근 지연 시간 백분위(p95 등)를 넘기면 같은 요청을 하나 더 보내 먼저 성공한 응답 사용
+        - 헤지 시점은 첫 요청이 승인된 후부터 계산 (지연 시간 표본도 승인 이후 기준이므로 승인 대기 시간은 제외)
+        - 헤지 요청도 같은 승인 컨트롤러를 거치므로 전역 동시 요청/RPM 한도를 넘지 않음
+        - 진 요청은 취소하고, 비용은 헤지 사용량으로 반환 (완료된 경우 실제 사용량, 취소된 경우 입력 비용 추정)
+        - 429/503으로 한도가 줄어든 상태에서는 헤지하지 않음
+        
+        Returns:
+            tuple: (응답, 헤지 사용량 리스트)
         """
-        clothes_img = Image.open(image_path) if image_path else None
-        return clothes_img
+        hedge_delay = get_hedge_delay()
+        limiter = get_admission_controller().limiter
+        
+        def is_throttled() -> bool:
+            return limiter is not None and (limiter.limit < limiter.max_limit or limiter.blocked_for() > 0)
+        
+        if hedge_delay is None or is_throttled():
+            return await self._generate_content(contents, config, caller_id, attempt_timeout), []
+        
+        admitted = asyncio.Event()
+        primary = asyncio.create_task(
+            self._generate_content(contents, config, caller_id, attempt_timeout, admitted=admitted)
+        )
+        admitted_wait = asyncio.create_task(admitted.wait())
+        tasks = {primary}
+        try:
+            # 승인 대기 중에는 헤지 시계를 시작하지 않음
+            await asyncio.wait({primary, admitted_wait}, return_when=asyncio.FIRST_COMPLETED)
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            if done:
+                return primary.result(), []
+            if is_throttled():
+                # 기다리는 동안 한도가 줄었으면 헤지하지 않고 첫 요청만 기다림
+                return await primary, []
+            
+            if self.verbose:
+                print(f"⏱️  {hedge_delay:.1f}초 초과 → 헤지 요청 전송")
+            tasks.add(asyncio.create_task(self._generate_content(contents, config, caller_id, attempt_timeout)))
+            
+            winner = error = None
+            pending = set(tasks)
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        winner = task
+                        break
+                    error = task.exception()
+            if winner is None:
+                raise error
+            
+            # 진 요청 정리 및 비용 반영
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            
+            hedge_usages = []
+            prompt_token_count = getattr(winner.result().usage_metadata, "prompt_token_count", None) or 0
+            for task in tasks - {winner}:
+                if task.cancelled():
+                    hedge_usages.append(self._estimate_input_usage(prompt_token_count))
+                elif task.exception() is None:
+                    usage_data = await self.calculate_vto_cost(task.result().usage_metadata)
+                    usage_data.hedge_request_count = 1
+                    hedge_usages.append(usage_data)
+            return winner.result(), hedge_usages
+        finally:
+            admitted_wait.cancel()
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(admitted_wait, *tasks, return_exceptions=True)
 
-    async def gemini_image_inference(self, contents, temperature: float = 1.0, top_p: float = 0.95, aspect_ratio: str = "1:1"):
+    async def gemini_image_inference(self, contents, temperature: float = 1.0, top_p: float = 0.95, aspect_ratio: str = "1:1",
+                                     caller_id: Optional[Hashable] = None, deadline: Optional[float] = None):
         """
         단일 이미지 추론 (재시도 로직 포함)
         
+        - 시도마다 전역 승인 컨트롤러의 슬롯을 받아 호출하고, 백오프 대기 중에는 슬롯을 반납
+        - 429/503 발생 시 전역 적응형 한도를 축소하고 성공 시 다시 늘림
+        - Retry-After를 우선 적용하고 full jitter로 재시도 시점을 분산
+        - 시도당 제한 시간(GEMINI_ATTEMPT_TIMEOUT)을 넘기면 재시도, deadline이 지나면 중단
+        
         Args:
             contents: 입력 콘텐츠 리스트 (텍스트 + 이미지들)
             temperature: 결과의 다양성
             top_p: Top-p (nucleus) 샘플링 값 (기본값: 0.95)
+            caller_id: 공정 큐잉 단위 (기본값: 호출마다 새로 생성)
+            deadline: 재시도를 포함한 전체 마감 시각 (time.monotonic() 기준, 기본값: 무제한)
         
         Returns:
             tuple: (이미지 바이너리 데이터, 비용 정보)
         """
-        delay = self.RETRY_DELAY
+        limiter = get_admission_controller().limiter
+        caller_id = caller_id if caller_id is not None else uuid.uuid4().hex
+        config = types.GenerateContentConfig(
+            response_modalities=[types.Modality.IMAGE],  # 이미지만 생성하도록 설정
+            temperature=temperature,
+            top_p=top_p,
+            image_config=types.ImageConfig(aspect_ratio=aspect_ratio),
+            safety_settings=self.SAFETY_SETTINGS
+        )
         
         for attempt in range(self.MAX_RETRIES):
+            remaining = deadline - time.monotonic() if deadline is not None else None
+            if remaining is not None and remaining <= 0:
+                if self.verbose:
+                    print(f"❌ 전체 제한 시간 초과 (시도 {attempt}/{self.MAX_RETRIES})")
+                break
+            attempt_timeout = settings.gemini_attempt_timeout or None
+            if remaining is not None:
+                attempt_timeout = min(attempt_timeout or remaining, remaining)
+            
             try:
-                # Gemini API 호출 (이미지만 생성하도록 설정)
-                response = await self.aio_client.models.generate_content(
-                    model=self.MODEL_NAME,
-                    contents=contents,
-                    config=types.GenerateContentConfig(
-                        response_modalities=[types.Modality.IMAGE],
-                        temperature=temperature,
-                        top_p=top_p,
-                        image_config=types.ImageConfig(aspect_ratio=aspect_ratio),
-                        safety_settings=self.SAFETY_SETTINGS
-                    )
+                # 승인 대기 시간까지 전체 마감 시각 안에서 처리
+                response, hedge_usages = await asyncio.wait_for(
+                    self._generate_content_hedged(contents, config, caller_id, attempt_timeout),
+                    timeout=remaining
                 )
                 
-                # 비용 계산
+                # 비용 계산 (헤지 요청 비용 포함)
                 usage_data = await self.calculate_vto_cost(
                     response.usage_metadata if hasattr(response, 'usage_metadata') else None
                 )
+                if hedge_usages:
+                    usage_data = await self.sum_usage_data([usage_data] + hedge_usages)
                 
                 # 응답에서 이미지 데이터 추출
                 image_data = self._extract_image_from_response(response)
                 return image_data, usage_data
                 
             except Exception as e:
-                error_str = str(e)
+                error_str = str(e) or type(e).__name__
                 
-                # 502, 503, 429 등 재시도 가능한 에러인지 확인
-                is_retryable = any(code in error_str for code in ['502', '503', '429', 'Bad Gateway', 'Service Unavailable', 'Too Many Requests'])
+                # 502, 503, 429, 시간 초과 등 재시도 가능한 에러인지 확인
+                is_retryable, is_throttle, retry_after = classify_gemini_error(e)
+                if is_throttle and limiter is not None:
+                    limiter.on_throttle(retry_after)
+                
+                # 만료/삭제된 업로드 파일 참조는 다음 요청부터 다시 업로드
+                if isinstance(e, genai_errors.APIError) and e.code in (403, 404):
+                    for content in contents:
+                        if isinstance(content, types.Part) and content.file_data is not None:
+                            get_file_upload_manager().invalidate(content.file_data.file_uri)
                 
                 if is_retryable and attempt < self.MAX_RETRIES - 1:
+                    if limiter is not None:
+                        delay = limiter.backoff_delay(attempt, self.RETRY_DELAY, self.RETRY_BACKOFF_MULTIPLIER, retry_after)
+                    else:
+                        delay = self.RETRY_DELAY * (self.RETRY_BACKOFF_MULTIPLIER ** attempt)
+                    if deadline is not None and time.monotonic() + delay >= deadline:
+                        if self.verbose:
+                            print(f"❌ 재시도 대기 시간이 전체 제한 시간을 넘어 중단: {error_str[:100]}")
+                        break
                     if self.verbose:
                         print(f"⚠️  재시도 가능한 에러 발생 (시도 {attempt + 1}/{self.MAX_RETRIES}): {error_str[:100]}")
-                        print(f"   {delay}초 후 재시도...")
+                        print(f"   {delay:.2f}초 후 재시도...")
                     
                     await asyncio.sleep(delay)
-                    delay *= self.RETRY_BACKOFF_MULTIPLIER
                 else:
                     if self.verbose:
                         print(f"❌ Inference Error (시도 {attempt + 1}/{self.MAX_RETRIES}): {error_str[:200]}")
@@ -268,10 +456,89 @@ class GeminiProcesser:
         
         return None, None
     
-    async def _run_with_semaphore(self, semaphore: asyncio.Semaphore, contents, temperature: float, top_p: float, aspect_ratio: str):
-        """세마포어를 사용하여 동시 요청 수를 제한하는 헬퍼 메소드"""
-        async with semaphore:
-            return await self.gemini_image_inference(contents, temperature, top_p, aspect_ratio)
+    async def _run_sample(self, contents, temperature: float, top_p: float, aspect_ratio: str,
+                          caller_id: Hashable, cache_key: Optional[str] = None,
+                          deadline: Optional[float] = None):
+        """
+        샘플 1개 생성 (cache_key가 있으면 결과 캐시 우선 조회)
+        
+        Returns:
+            tuple: (이미지 바이너리 데이터, 비용 정보, 캐시 적중 여부)
+        """
+        if cache_key is not None:
+            cached_image = await get_result_cache().get(cache_key)
+            if cached_image is not None:
+                return cached_image, self._create_usage_data(), True
+        
+        image_data, usage_data = await self.gemini_image_inference(
+            contents, temperature, top_p, aspect_ratio, caller_id=caller_id, deadline=deadline
+        )
+        if cache_key is not None and image_data is not None:
+            await get_result_cache().set(cache_key, image_data)
+        return image_data, usage_data, False
+        
+    async def stream_image_inference(
+        self,
+        contents_list: List,
+        image_count: int,
+        temperature: float,
+        top_p: float = 0.95,
+        aspect_ratio: str = "1:1",
+        caller_id: Optional[Hashable] = None,
+        use_cache: bool = False,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[Dict]:
+        """
+        샘플이 끝나는 순서대로 결과를 하나씩 반환하는 async generator
+        (느린 재시도 하나가 이미 끝난 이미지들을 붙잡지 않음)
+        
+        - 소비자가 중간에 멈추면(aclose/break) 남은 샘플 요청은 취소
+        
+        Args:
+            contents_list: Gemini API에 전달할 콘텐츠 리스트
+            image_count: 생성할 이미지 개수
+            temperature: 결과의 다양성
+            top_p: Top-p (nucleus) 샘플링 값 (기본값: 0.95)
+            caller_id: 공정 큐잉 단위 (기본값: 호출마다 새로 생성)
+            use_cache: 결과 캐시 사용 여부
+            timeout: 재시도를 포함한 전체 제한 시간(초) (기본값: GEMINI_REQUEST_TIMEOUT)
+        
+        Yields:
+            Dict: {"index": 샘플 인덱스, "image": 이미지 bytes 또는 None,
+                   "usage": LiteLLMUsageData 또는 None, "cache_hit": 캐시 적중 여부}
+        """
+        caller_id = caller_id if caller_id is not None else uuid.uuid4().hex
+        timeout = timeout if timeout is not None else (settings.gemini_request_timeout or None)
+        deadline = time.monotonic() + timeout if timeout else None
+        
+        # 결과 캐시 키 (샘플 인덱스별)
+        cache_keys = [None] * image_count
+        if use_cache:
+            base_key = await asyncio.to_thread(
+                ImageResultCache.make_base_key, self.MODEL_NAME, contents_list, temperature, top_p, aspect_ratio
+            )
+            cache_keys = [ImageResultCache.sample_key(base_key, idx) for idx in range(image_count)]
+        
+        # 반복 전송되는 입력 이미지는 Files API 참조로 대체 (결과 캐시 키는 원본 bytes 기준으로 먼저 계산)
+        if settings.gemini_file_upload_enabled:
+            contents_list = await get_file_upload_manager().substitute(contents_list)
+        
+        async def run_indexed_sample(index: int) -> Dict:
+            image_data, usage_data, cache_hit = await self._run_sample(
+                contents_list, temperature, top_p, aspect_ratio, caller_id, cache_keys[index], deadline
+            )
+            return {"index": index, "image": image_data, "usage": usage_data, "cache_hit": cache_hit}
+        
+        # 모든 샘플 병렬 호출 (전역 동시 요청 수 제한)
+        tasks = [asyncio.create_task(run_indexed_sample(idx)) for idx in range(image_count)]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
         
     async def execute_image_inference(
         self,
@@ -279,46 +546,51 @@ class GeminiProcesser:
         image_count: int,
         temperature: float,
         top_p: float = 0.95,
-        aspect_ratio: str = "1:1"
+        aspect_ratio: str = "1:1",
+        caller_id: Optional[Hashable] = None,
+        use_cache: bool = False,
+        timeout: Optional[float] = None
     ) -> Dict:
         """
         단일 이미지 추론을 실행하고 결과를 반환하는 공통 로직
-        (동시 요청 수 제한 및 재시도 로직 포함)
+        (전역 동시 요청 수 제한 및 재시도 로직 포함)
         
         Args:
             contents_list: Gemini API에 전달할 콘텐츠 리스트
             temperature: 결과의 다양성
             top_p: Top-p (nucleus) 샘플링 값 (기본값: 0.95)
+            caller_id: 공정 큐잉 단위 (기본값: 호출마다 새로 생성)
+            use_cache: 결과 캐시 사용 여부 (같은 프롬프트/이미지/파라미터/샘플 인덱스면 비용 없이 반환)
+            timeout: 재시도를 포함한 전체 제한 시간(초) (기본값: GEMINI_REQUEST_TIMEOUT)
         
         Returns:
             Dict: 응답 결과 (이미지 리스트 및 비용 정보)
         """
+        admission_controller = get_admission_controller()
+        
         if self.verbose:
             print(f"\n{'='*50}")
             print(f"📸 총 생성할 이미지 수: {image_count}")
-            print(f"⚙️  동시 요청 제한: 최대 {self.MAX_CONCURRENT_REQUESTS}개")
-            print(f"🔄 재시도 설정: 최대 {self.MAX_RETRIES}회, 초기 대기 {self.RETRY_DELAY}초")
+            print(f"⚙️  전역 동시 요청 제한: 최대 {admission_controller.max_in_flight}개")
+            print(f"🔄 재시도 설정: 최대 {self.MAX_RETRIES}회, 초기 대기 최대 {self.RETRY_DELAY}초 (full jitter)")
             print(f"🔄 Top-p: {top_p}")
             print(f"🔄 Temperature: {temperature}")
             print(f"{'='*50}\n")
         
-        # 세마포어를 사용하여 동시 요청 수 제한
-        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
-        
-        recursive_contents_list = []
-        for _ in range(image_count):
-            recursive_contents_list.append(contents_list)
-        
-        # 모든 조합에 대해 병렬 호출 (동시 요청 수 제한)
-        tasks = [self._run_with_semaphore(semaphore, contents, temperature, top_p, aspect_ratio) for contents in recursive_contents_list]
-        responses = await asyncio.gather(*tasks)
-        
-        # 결과 분리
-        result_image_list, usage_data_list = zip(*responses) if responses else ([], [])
-        
-        # None이 아닌 usage_data만 필터링하여 비용 합산
-        valid_usage_data = [usage for usage in usage_data_list if usage is not None]
-        total_usage = await self.sum_usage_data(valid_usage_data) if valid_usage_data else await self.calculate_vto_cost(None)
+        # 완료 순서대로 받은 결과를 샘플 인덱스 순서로 정렬
+        result_image_list = [None] * image_count
+        usage_data_list = []
+        cache_hit_count = 0
+        async for result in self.stream_image_inference(
+            contents_list, image_count, temperature, top_p, aspect_ratio, caller_id, use_cache, timeout
+        ):
+            result_image_list[result["index"]] = result["image"]
+            if result["usage"] is not None:
+                usage_data_list.append(result["usage"])
+            cache_hit_count += int(result["cache_hit"])
+        
+        # None이 아닌 usage_data만 비용 합산
+        total_usage = await self.sum_usage_data(usage_data_list) if usage_data_list else await self.calculate_vto_cost(None)
         
         all_images = result_image_list
         
@@ -329,6 +601,10 @@ class GeminiProcesser:
         if self.verbose:
             print(f"\n{'='*50}")
             print(f"✅ 성공: {success_count}개")
+            if total_usage.hedge_request_count > 0:
+                print(f"🪁 헤지 요청: {total_usage.hedge_request_count}개 (비용 포함)")
+            if cache_hit_count > 0:
+                print(f"♻️  캐시 적중: {cache_hit_count}개")
             if fail_count > 0:
                 print(f"❌ 실패: {fail_count}개")
             print(f"{'='*50}\n")
@@ -340,6 +616,10 @@ class GeminiProcesser:
                 "total_count": len(all_images),
                 "success_count": success_count,
                 "fail_count": fail_count,
+                "cache_hit_count": cache_hit_count,
+                "hedge_request_count": total_usage.hedge_request_count,
                 "model_name": self.MODEL_NAME,
+                "admission": admission_controller.metrics().model_dump(),
+                "image_ops": get_image_executor().metrics().model_dump(),
             }
         }
\ No newline at end of file
@@ -0,0 +1,52 @@
+import threading
+from collections import deque
+from typing import Deque, Optional
+from configs import settings
+
+
+class LatencyTracker:
+    """
+    최근 Gemini 호출 지연 시간(초) 기록 및 백분위 계산
+
+    - 헤지 요청 지연 시간(p95 등) 산출에 사용
+    - 표본이 min_samples보다 적으면 헤지하지 않음 (콜드 스타트 시 과도한 중복 요청 방지)
+    """
+
+    def __init__(self, window_size: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._latencies: Deque[float] = deque(maxlen=window_size)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """q(0~1) 백분위 지연 시간 (표본 부족 시 None)"""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+        return ordered[index]
+
+
+_latency_tracker: Optional[LatencyTracker] = None
+_latency_tracker_lock = threading.Lock()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """프로세스 전역 LatencyTracker 반환 (최초 호출 시 생성)"""
+    global _latency_tracker
+    if _latency_tracker is None:
+        with _latency_tracker_lock:
+            if _latency_tracker is None:
+                _latency_tracker = LatencyTracker(min_samples=settings.gemini_hedge_min_samples)
+    return _latency_tracker
+
+
+def get_hedge_delay() -> Optional[float]:
+    """헤지 요청을 보낼 시점(초) (헤지 비활성화 또는 표본 부족 시 None)"""
+    if not settings.gemini_hedge_enabled:
+        return None
+    return get_latency_tracker().percentile(settings.gemini_hedge_percentile)
@@ -0,0 +1,220 @@
+import asyncio
+import functools
+import io
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Deque, Optional, TypeVar
+from PIL import Image
+from pydantic import BaseModel, Field
+from configs import settings
+from custom_logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class ImageOpsMetrics(BaseModel):
+    kind: str = Field(..., description="실행기 종류 (thread / process)")
+    max_workers: int = Field(..., description="워커 수")
+    max_pending: int = Field(..., description="동시에 제출 가능한 작업 상한 (back-pressure)")
+    in_flight: int = Field(..., description="제출되어 실행/대기 중인 작업 수")
+    waiting: int = Field(..., description="back-pressure로 제출 대기 중인 작업 수")
+    completed_total: int = Field(..., description="누적 완료 작업 수")
+    failed_total: int = Field(..., description="누적 실패 작업 수")
+    wait_time_avg: float = Field(..., description="평균 제출 대기 시간(초, back-pressure)")
+    queue_time_avg: float = Field(..., description="평균 풀 큐 대기 시간(초, 제출~실행 시작)")
+    queue_time_max: float = Field(..., description="최대 풀 큐 대기 시간(초)")
+    compute_time_avg: float = Field(..., description="평균 실행 시간(초)")
+    compute_time_max: float = Field(..., description="최대 실행 시간(초)")
+
+
+def _timed_call(fn: Callable, args: tuple, kwargs: dict):
+    """워커 안에서 실행 시작 시각과 실행 시간을 함께 반환 (프로세스 간 비교를 위해 벽시계 사용)"""
+    started_at = time.time()
+    result = fn(*args, **kwargs)
+    return result, started_at, time.time() - started_at
+
+
+def decode_image(data: bytes) -> Image.Image:
+    """이미지 bytes 디코딩 (지연 로딩 없이 픽셀까지 읽음)"""
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    return image
+
+
+@dataclass
+class _Waiter:
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    granted: bool = False
+
+
+class ImageOpsExecutor:
+    """
+    CPU 바운드 이미지 작업(디코딩/리사이즈/인코딩/해시) 전용 실행기
+
+    - thread: GIL을 놓는 PIL 연산 위주일 때 / process: 순수 파이썬 연산이 많거나 코어를 모두 쓰고 싶을 때
+    - 제출 가능한 작업 수를 max_pending으로 제한해 대형 이미지가 몰려도 메모리가 무한히 늘지 않음
+    - 대기열은 threading.Lock + call_soon_threadsafe로 관리하므로 여러 이벤트 루프에서 함께 사용 가능
+    - 큐 대기 시간(제출~실행 시작)과 실행 시간을 분리해 기록
+    """
+
+    def __init__(self, kind: str = "thread", max_workers: Optional[int] = None, max_pending: int = 64):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"지원하지 않는 실행기 종류입니다: {kind}")
+        self.kind = kind
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max(1, max_pending)
+
+        self._lock = threading.Lock()
+        self._executor: Optional[Executor] = None
+        self._waiters: Deque[_Waiter] = deque()
+        self._in_flight = 0
+
+        # 메트릭
+        self._completed_total = 0
+        self._failed_total = 0
+        self._wait_time_total = 0.0
+        self._queue_time_total = 0.0
+        self._queue_time_max = 0.0
+        self._compute_time_total = 0.0
+        self._compute_time_max = 0.0
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "process":
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="image-ops")
+            return self._executor
+
+    async def _acquire(self) -> None:
+        with self._lock:
+            if self._in_flight < self.max_pending:
+                self._in_flight += 1
+                return
+            loop = asyncio.get_running_loop()
+            waiter = _Waiter(loop=loop, future=loop.create_future())
+            self._waiters.append(waiter)
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    self._release_locked()
+                else:
+                    self._waiters.remove(waiter)
+            raise
+
+    def _release_locked(self) -> None:
+        """슬롯을 다음 대기자에게 넘기거나 반환 (lock 보유 상태에서 호출)"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            waiter.granted = True
+
+            def _set_result(future: asyncio.Future = waiter.future) -> None:
+                if not future.done():
+                    future.set_result(None)
+
+            try:
+                waiter.loop.call_soon_threadsafe(_set_result)
+                return
+            except RuntimeError:
+                # 대기자의 이벤트 루프가 이미 닫힌 경우 다음 대기자에게
+                continue
+        self._in_flight -= 1
+
+    async def run(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """
+        이미지 작업을 실행기에서 실행하고 결과 반환
+
+        - process 실행기에서는 fn/인자/결과가 pickle 가능해야 함 (모듈 최상위 함수 사용)
+        """
+        enqueued_at = time.time()
+        await self._acquire()
+        submitted_at = time.time()
+        try:
+            result, started_at, compute_time = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), functools.partial(_timed_call, fn, args, kwargs)
+            )
+        except Exception:
+            with self._lock:
+                self._failed_total += 1
+            raise
+        finally:
+            with self._lock:
+                self._release_locked()
+
+        queue_time = max(0.0, started_at - submitted_at)
+        with self._lock:
+            self._completed_total += 1
+            self._wait_time_total += submitted_at - enqueued_at
+            self._queue_time_total += queue_time
+            self._queue_time_max = max(self._queue_time_max, queue_time)
+            self._compute_time_total += compute_time
+            self._compute_time_max = max(self._compute_time_max, compute_time)
+        return result
+
+    def metrics(self) -> ImageOpsMetrics:
+        with self._lock:
+            completed = self._completed_total
+            return ImageOpsMetrics(
+                kind=self.kind,
+                max_workers=self.max_workers,
+                max_pending=self.max_pending,
+                in_flight=self._in_flight,
+                waiting=len(self._waiters),
+                completed_total=completed,
+                failed_total=self._failed_total,
+                wait_time_avg=round(self._wait_time_total / completed, 4) if completed else 0.0,
+                queue_time_avg=round(self._queue_time_total / completed, 4) if completed else 0.0,
+                queue_time_max=round(self._queue_time_max, 4),
+                compute_time_avg=round(self._compute_time_total / completed, 4) if completed else 0.0,
+                compute_time_max=round(self._compute_time_max, 4),
+            )
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_image_executor: Optional[ImageOpsExecutor] = None
+_image_executor_lock = threading.Lock()
+
+
+def get_image_executor() -> ImageOpsExecutor:
+    """프로세스 전역 ImageOpsExecutor 반환 (최초 호출 시 생성)"""
+    global _image_executor
+    if _image_executor is None:
+        with _image_executor_lock:
+            if _image_executor is None:
+                _image_executor = ImageOpsExecutor(
+                    kind=settings.vto_image_executor_kind,
+                    max_workers=settings.vto_image_executor_workers or None,
+                    max_pending=settings.vto_image_executor_max_pending,
+                )
+    return _image_executor
+
+
+async def run_image_op(fn: Callable[..., T], *args, **kwargs) -> T:
+    """전역 이미지 실행기에서 fn 실행"""
+    return await get_image_executor().run(fn, *args, **kwargs)
+
+
+async def close_image_executor() -> None:
+    """FastAPI lifespan 종료 시 호출"""
+    global _image_executor
+    with _image_executor_lock:
+        image_executor, _image_executor = _image_executor, None
+    if image_executor is not None:
+        await asyncio.to_thread(image_executor.shutdown)
+        logger.info("Image ops executor closed")
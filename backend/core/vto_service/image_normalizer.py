@@ -0,0 +1,235 @@
+import asyncio
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+from PIL import Image, ImageOps
+from configs import settings
+from core.vto_service.image_executor import run_image_op
+from custom_logger import get_logger
+
+logger = get_logger(__name__)
+
+# 매직 넘버 기반 MIME 판별 (확장자/업로드 MIME은 신뢰하지 않음)
+_SIGNATURES = [
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+]
+_HEIF_BRANDS = {b"heic": "image/heic", b"heix": "image/heic", b"heif": "image/heif", b"mif1": "image/heif"}
+
+# 재인코딩 없이 그대로 보내도 되는 형식
+PASSTHROUGH_MIME_TYPES = {"image/png", "image/jpeg", "image/webp"}
+
+OUTPUT_FORMATS = {
+    "jpeg": ("JPEG", "image/jpeg"),
+    "webp": ("WEBP", "image/webp"),
+    "lossless": ("PNG", "image/png"),
+}
+
+_EXIF_ORIENTATION_TAG = 0x0112
+
+# 경로 없이 바로 넘길 수 있는 이미지 버퍼 (업로드 파일 객체는 getvalue()로 bytes 제공)
+ImageBuffer = Union[bytes, bytearray, memoryview, io.BytesIO]
+
+
+def as_image_bytes(data: ImageBuffer) -> bytes:
+    """
+    이미지 버퍼를 bytes로 변환
+
+    - bytes, bytes 전체를 가리키는 memoryview는 복사 없이 원본 객체 그대로 반환
+    - bytearray 등 변경 가능한 버퍼는 해시/캐시 키가 바뀌지 않도록 한 번만 복사
+    - BytesIO(스트림릿 UploadedFile 포함)는 getvalue() 사용 (읽기 위치와 무관)
+    """
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, memoryview) and isinstance(data.obj, bytes) and data.nbytes == len(data.obj):
+        return data.obj
+    if isinstance(data, io.BytesIO):
+        return data.getvalue()
+    return bytes(data)
+
+
+def sniff_mime_type(data: bytes) -> Optional[str]:
+    """이미지 bytes의 MIME 타입 판별 (알 수 없으면 None)"""
+    for signature, mime_type in _SIGNATURES:
+        if data.startswith(signature):
+            return mime_type
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    if data[4:8] == b"ftyp" and data[8:12] in _HEIF_BRANDS:
+        return _HEIF_BRANDS[data[8:12]]
+    return None
+
+
+def source_digest(data: bytes) -> str:
+    """원본 이미지 bytes의 SHA-256 (정규화 캐시 키)"""
+    return hashlib.sha256(data).hexdigest()
+
+
+@dataclass(frozen=True)
+class NormalizedImage:
+    data: bytes
+    mime_type: str
+    width: int
+    height: int
+    reencoded: bool
+
+
+def _has_alpha(image: Image.Image) -> bool:
+    return image.mode in ("RGBA", "LA", "PA") or (image.mode == "P" and "transparency" in image.info)
+
+
+def encode_image(image: Image.Image, output_format: str = "jpeg", quality: int = 90) -> Tuple[bytes, str]:
+    """
+    PIL Image 인코딩
+
+    - jpeg/webp: 손실 압축 (jpeg는 투명도가 있으면 무손실 PNG로 대체)
+    - lossless: PNG
+    """
+    pil_format, mime_type = OUTPUT_FORMATS[output_format]
+    if pil_format == "JPEG" and _has_alpha(image):
+        pil_format, mime_type = OUTPUT_FORMATS["lossless"]
+
+    if pil_format == "JPEG" and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    elif image.mode not in ("RGB", "RGBA", "L", "LA"):
+        image = image.convert("RGBA" if _has_alpha(image) else "RGB")
+
+    buffer = io.BytesIO()
+    if pil_format == "PNG":
+        image.save(buffer, format="PNG")
+    else:
+        image.save(buffer, format=pil_format, quality=quality)
+    return buffer.getvalue(), mime_type
+
+
+def normalize_pil_image(image: Image.Image, max_edge: int, output_format: str = "jpeg",
+                        quality: int = 90) -> NormalizedImage:
+    """PIL Image 정규화 (EXIF 회전 반영, 긴 변 max_edge 이하로 축소, 재인코딩)"""
+    image = ImageOps.exif_transpose(image)
+    if max_edge and max(image.size) > max_edge:
+        image = ImageOps.contain(image, (max_edge, max_edge), Image.Resampling.LANCZOS)
+    data, mime_type = encode_image(image, output_format, quality)
+    return NormalizedImage(data=data, mime_type=mime_type, width=image.width, height=image.height, reencoded=True)
+
+
+def normalize_image_bytes(data: bytes, max_edge: int, output_format: str = "jpeg",
+                          quality: int = 90) -> NormalizedImage:
+    """
+    이미지 bytes 정규화
+
+    - 이미 허용 형식이고 max_edge 이하이며 EXIF 회전이 없으면 원본 bytes를 그대로 사용
+    - 그 외에는 디코딩 후 EXIF 회전 → 축소 → 재인코딩
+    - PIL이 디코딩하지 못하는 형식(HEIC 등)은 판별한 MIME으로 원본 전달
+    """
+    sniffed_mime_type = sniff_mime_type(data)
+    try:
+        image = Image.open(io.BytesIO(data))
+    except Exception:
+        if sniffed_mime_type is None:
+            raise ValueError("지원하지 않는 이미지 형식입니다")
+        logger.warning(f"Cannot decode {sniffed_mime_type}, sending original bytes")
+        return NormalizedImage(data=data, mime_type=sniffed_mime_type, width=0, height=0, reencoded=False)
+
+    with image:
+        orientation = image.getexif().get(_EXIF_ORIENTATION_TAG, 1)
+        if (
+            sniffed_mime_type in PASSTHROUGH_MIME_TYPES
+            and orientation == 1
+            and (not max_edge or max(image.size) <= max_edge)
+        ):
+            return NormalizedImage(
+                data=data, mime_type=sniffed_mime_type, width=image.width, height=image.height, reencoded=False
+            )
+
+        # JPEG는 디코딩 단계에서 미리 1/2^n로 축소 (대형 원본 디코딩 비용 절감)
+        if max_edge and image.format == "JPEG":
+            image.draft("RGB", (max_edge, max_edge))
+        image.load()
+        return normalize_pil_image(image, max_edge, output_format, quality)
+
+
+class ImageNormalizer:
+    """
+    입력 이미지 정규화 + 원본 해시 기반 메모리 캐시
+
+    - 같은 의류 이미지가 여러 샘플/뷰/스타일컷에 반복 사용되므로 정규화 결과를 재사용
+    - 키: 원본 bytes SHA-256 + 정규화 옵션, 전체 크기가 max_bytes를 넘으면 LRU 순으로 제거
+    """
+
+    def __init__(self, max_edge: int = 1536, output_format: str = "jpeg", quality: int = 90,
+                 cache_max_bytes: int = 256 * 1024 * 1024):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"지원하지 않는 출력 형식입니다: {output_format}")
+        self.max_edge = max_edge
+        self.output_format = output_format
+        self.quality = quality
+        self.cache_max_bytes = cache_max_bytes
+
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[str, NormalizedImage]" = OrderedDict()
+        self._cache_bytes = 0
+
+    def _cache_key(self, digest: str) -> str:
+        return f"{digest}:{self.max_edge}:{self.output_format}:{self.quality}"
+
+    def _get(self, key: str) -> Optional[NormalizedImage]:
+        with self._lock:
+            normalized = self._cache.get(key)
+            if normalized is not None:
+                self._cache.move_to_end(key)
+            return normalized
+
+    def _set(self, key: str, normalized: NormalizedImage) -> None:
+        size = len(normalized.data)
+        if size > self.cache_max_bytes:
+            return
+        with self._lock:
+            if key in self._cache:
+                return
+            self._cache[key] = normalized
+            self._cache_bytes += size
+            while self._cache_bytes > self.cache_max_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted.data)
+
+    async def normalize_bytes(self, data: bytes) -> NormalizedImage:
+        """이미지 bytes 정규화 (캐시 우선)"""
+        # 해시는 GIL을 놓으므로 기본 스레드 풀에서 계산 (process 실행기로 bytes를 복사하지 않음)
+        key = self._cache_key(await asyncio.to_thread(source_digest, data))
+        normalized = self._get(key)
+        if normalized is None:
+            normalized = await run_image_op(
+                normalize_image_bytes, data, self.max_edge, self.output_format, self.quality
+            )
+            self._set(key, normalized)
+        return normalized
+
+    async def normalize_pil(self, image: Image.Image) -> NormalizedImage:
+        """PIL Image 정규화 (이미 디코딩된 이미지는 캐시하지 않음)"""
+        return await run_image_op(
+            normalize_pil_image, image, self.max_edge, self.output_format, self.quality
+        )
+
+
+_image_normalizer: Optional[ImageNormalizer] = None
+_image_normalizer_lock = threading.Lock()
+
+
+def get_image_normalizer() -> ImageNormalizer:
+    """프로세스 전역 ImageNormalizer 반환 (최초 호출 시 생성)"""
+    global _image_normalizer
+    if _image_normalizer is None:
+        with _image_normalizer_lock:
+            if _image_normalizer is None:
+                _image_normalizer = ImageNormalizer(
+                    max_edge=settings.vto_image_max_edge,
+                    output_format=settings.vto_image_format,
+                    quality=settings.vto_image_quality,
+                    cache_max_bytes=settings.vto_image_cache_max_bytes,
+                )
+    return _image_normalizer
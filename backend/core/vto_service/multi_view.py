@@ -0,0 +1,209 @@
+import asyncio
+import json
+import time
+import uuid
+from typing import Dict, List, Optional, Sequence, Union
+from core.litellm_hander.schema import (
+    ClothesOptions,
+    LiteLLMUsageData,
+    ModelOptions,
+    TotalUsageData,
+    ValidGeneratedVTO,
+    VtoStageReport,
+)
+from core.litellm_hander.process import LiteLLMHandler
+from core.vto_service.gemini_handler import GeminiProcesser
+from custom_logger import get_logger
+from prompts.side_view_prompts import side_view_prompt
+from prompts.vto_model_prompts import assemble_model_prompt
+
+logger = get_logger(__name__)
+
+ImageInput = Union[str, bytes]
+
+# 기존 UI 탭과 같은 생성 파라미터
+FRONT_TEMPERATURE = 0.5
+FRONT_TOP_P = 0.97
+VIEW_TEMPERATURE = 0.5
+VIEWS = ("left", "right", "back")
+
+
+class _StageTimer:
+    def __init__(self, stage: str, pipeline_started_at: float):
+        self.stage = stage
+        self.pipeline_started_at = pipeline_started_at
+        self.started_at = time.monotonic()
+
+    def report(self, total_count: int, success_count: int,
+               usage: Optional[LiteLLMUsageData]) -> VtoStageReport:
+        return VtoStageReport(
+            stage=self.stage,
+            started_at=round(self.started_at - self.pipeline_started_at, 3),
+            latency=round(time.monotonic() - self.started_at, 3),
+            total_count=total_count,
+            success_count=success_count,
+            usage=usage,
+        )
+
+
+async def generate_multi_view(
+    model_options: ModelOptions,
+    clothes_options: ClothesOptions,
+    garment_images: Sequence[ImageInput],
+    back_garment_image: Optional[ImageInput] = None,
+    image_count: int = 3,
+    view_image_count: int = 1,
+    views: Sequence[str] = VIEWS,
+    use_validation: bool = True,
+    use_cache: bool = False,
+) -> Dict:
+    """
+    정면 → 대표 후보 선택 → 측면/후면을 하나의 파이프라인으로 생성
+    
+    - 입력 의류 이미지는 한 번만 정규화하여 모든 단계가 공유 (같은 공정 큐잉 단위 사용)
+    - 정면 후보가 하나씩 완성될 때마다 바로 검수하고, 처음 통과한 후보가 나오는 즉시 측면/후면 생성 시작
+    - 통과 후보가 없으면 정면 생성/검수가 모두 끝난 뒤 불일치 항목이 가장 적은 후보 선택
+    - use_validation=False면 가장 먼저 완성된 정면 이미지를 바로 사용
+    
+    Args:
+        model_options: 모델 옵션
+        clothes_options: 의상 옵션
+        garment_images: 의류 이미지 (경로 또는 bytes, 첫 번째가 메인 의류)
+        back_garment_image: 후면 생성에 사용할 의류 뒷면 이미지 (없으면 메인 의류 이미지)
+        image_count: 정면 후보 생성 개수
+        view_image_count: 측면/후면 뷰별 생성 개수
+        views: 생성할 뷰 ("left", "right", "back")
+        use_validation: 정면 후보 검수 사용 여부
+        use_cache: 생성 결과 캐시 사용 여부
+    
+    Returns:
+        Dict: 단계별 결과 ("front", "left", "right", "back"), 선택된 정면 인덱스,
+              단계별 사용량/지연 시간("stages"), 전체 사용량("usage")
+    """
+    pipeline_started_at = time.monotonic()
+    processer = GeminiProcesser(verbose=False)
+    llm_handler = LiteLLMHandler()
+    caller_id = uuid.uuid4().hex
+    
+    # 입력 준비 (모든 단계가 공유)
+    prepare_timer = _StageTimer("prepare", pipeline_started_at)
+    garment_parts = list(await asyncio.gather(*[processer.create_image_content(image) for image in garment_images]))
+    back_part = (
+        await processer.create_image_content(back_garment_image)
+        if back_garment_image is not None else garment_parts[0]
+    )
+    stages: List[VtoStageReport] = [prepare_timer.report(len(garment_parts), len(garment_parts), None)]
+    
+    selected: asyncio.Future = asyncio.get_running_loop().create_future()
+    front_images: List[Optional[bytes]] = [None] * image_count
+    validations: Dict[int, Optional[ValidGeneratedVTO]] = {}
+    validation_tasks: List[asyncio.Task] = []
+    
+    def select(index: int) -> None:
+        if not selected.done():
+            logger.info(f"Multi-view: front candidate #{index} selected")
+            selected.set_result(index)
+    
+    async def validate(index: int, image_data: bytes) -> None:
+        try:
+            original = await llm_handler.convert_litellm_image_object(
+                image_bytes=garment_parts[0].inline_data.data
+            )
+            generated = await llm_handler.convert_litellm_image_object(image_bytes=image_data)
+            response = await llm_handler.valid_generated_vto(original, generated)
+            validation = ValidGeneratedVTO(**json.loads(response.choices[0].message.content))
+        except Exception as e:
+            logger.warning(f"Multi-view: validation of candidate #{index} failed: {e}")
+            validation = None
+        validations[index] = validation
+        if validation is not None and validation.result.strip().lower() == "pass":
+            select(index)
+    
+    async def run_front() -> Dict:
+        timer = _StageTimer("front", pipeline_started_at)
+        usage_data_list = []
+        contents = [
+            assemble_model_prompt(type="front", model_options=model_options, clothes_options=clothes_options)
+        ] + garment_parts
+        async for result in processer.stream_image_inference(
+            contents, image_count, FRONT_TEMPERATURE, FRONT_TOP_P,
+            caller_id=caller_id, use_cache=use_cache
+        ):
+            if result["usage"] is not None:
+                usage_data_list.append(result["usage"])
+            if result["image"] is None:
+                continue
+            front_images[result["index"]] = result["image"]
+            if use_validation:
+                validation_tasks.append(asyncio.create_task(validate(result["index"], result["image"])))
+            else:
+                select(result["index"])
+        
+        usage = await processer.sum_usage_data(usage_data_list) if usage_data_list else None
+        stages.append(timer.report(image_count, sum(img is not None for img in front_images), usage))
+        return {"response": front_images, "usage": usage}
+    
+    async def run_selection() -> Optional[int]:
+        timer = _StageTimer("selection", pipeline_started_at)
+        await front_task
+        await asyncio.gather(*validation_tasks)
+        
+        if not selected.done():
+            candidates = [idx for idx, img in enumerate(front_images) if img is not None]
+            if candidates:
+                # 검수 결과가 있으면 불일치 항목이 가장 적은 후보, 없으면 가장 앞 후보
+                select(min(candidates, key=lambda idx: (
+                    validations.get(idx) is None,
+                    len(validations[idx].detections) if validations.get(idx) else 0,
+                    idx,
+                )))
+            else:
+                selected.set_result(None)
+        
+        validation_usage = (await llm_handler.calculate_total_cost()).total if llm_handler.usage_data else None
+        stages.append(timer.report(
+            len(validations), sum(v is not None for v in validations.values()), validation_usage
+        ))
+        return selected.result()
+    
+    async def run_view(view: str) -> Optional[Dict]:
+        index = await asyncio.shield(selected)
+        if index is None:
+            return None
+        timer = _StageTimer(view, pipeline_started_at)
+        front_part = await processer.create_image_content(front_images[index])
+        contents = [
+            side_view_prompt(view, model_options.gender),
+            front_part,
+            back_part if view == "back" else garment_parts[0],
+        ]
+        result = await processer.execute_image_inference(
+            contents, view_image_count, VIEW_TEMPERATURE, caller_id=caller_id, use_cache=use_cache
+        )
+        stages.append(timer.report(view_image_count, result["debug_info"]["success_count"], result["usage"]))
+        return {"response": result["response"], "usage": result["usage"]}
+    
+    front_task = asyncio.create_task(run_front())
+    selection_task = asyncio.create_task(run_selection())
+    view_tasks = {view: asyncio.create_task(run_view(view)) for view in views}
+    try:
+        front_result, selected_index, *view_results = await asyncio.gather(
+            front_task, selection_task, *view_tasks.values()
+        )
+    finally:
+        for task in [front_task, selection_task, *validation_tasks, *view_tasks.values()]:
+            if not task.done():
+                task.cancel()
+    
+    stage_usages = [stage.usage for stage in stages if stage.usage is not None]
+    total_usage = await processer.sum_usage_data(stage_usages)
+    
+    return {
+        "front": front_result,
+        "selected_index": selected_index,
+        "validations": {idx: v.model_dump() if v else None for idx, v in validations.items()},
+        **dict(zip(view_tasks.keys(), view_results)),
+        "stages": sorted(stages, key=lambda stage: stage.started_at),
+        "usage": TotalUsageData(total=total_usage, details=stage_usages),
+        "latency": round(time.monotonic() - pipeline_started_at, 3),
+    }
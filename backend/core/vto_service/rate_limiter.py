@@ -0,0 +1,133 @@
+import random
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional, Tuple
+from google.genai import errors as genai_errors
+
+
+# 스로틀링(한도 축소 대상) / 재시도 가능 상태 코드
+THROTTLE_STATUS_CODES = {429, 503}
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 상태 코드를 알 수 없는 예외(네트워크 오류 등)는 기존처럼 메시지로 판별
+_RETRYABLE_MESSAGES = ['502', '503', '429', 'Bad Gateway', 'Service Unavailable', 'Too Many Requests']
+_THROTTLE_MESSAGES = ['503', '429', 'Service Unavailable', 'Too Many Requests', 'RESOURCE_EXHAUSTED']
+
+
+def _parse_retry_after_header(value: str) -> Optional[float]:
+    """Retry-After 헤더 파싱 (초 또는 HTTP-date)"""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_retry_delay_details(details) -> Optional[float]:
+    """google.rpc.RetryInfo의 retryDelay("12s", "1.5s") 파싱"""
+    error = details.get("error", details) if isinstance(details, dict) else None
+    if not isinstance(error, dict):
+        return None
+    for detail in error.get("details") or []:
+        retry_delay = detail.get("retryDelay") if isinstance(detail, dict) else None
+        if retry_delay:
+            match = re.match(r"^\s*([\d.]+)s\s*$", str(retry_delay))
+            if match:
+                return float(match.group(1))
+    return None
+
+
+def classify_gemini_error(error: Exception) -> Tuple[bool, bool, Optional[float]]:
+    """
+    Gemini 호출 예외 분류
+
+    Returns:
+        Tuple: (재시도 가능 여부, 스로틀링 여부, Retry-After 초)
+    """
+    # 시도당 제한 시간 초과는 스로틀링이 아닌 일시 장애로 보고 재시도
+    if isinstance(error, TimeoutError):
+        return True, False, None
+
+    if isinstance(error, genai_errors.APIError):
+        retry_after = None
+        headers = getattr(error.response, "headers", None)
+        if headers is not None and headers.get("retry-after"):
+            retry_after = _parse_retry_after_header(headers.get("retry-after"))
+        if retry_after is None:
+            retry_after = _parse_retry_delay_details(error.details)
+        return (
+            error.code in RETRYABLE_STATUS_CODES,
+            error.code in THROTTLE_STATUS_CODES,
+            retry_after,
+        )
+
+    error_str = str(error)
+    is_retryable = any(code in error_str for code in _RETRYABLE_MESSAGES)
+    is_throttle = any(code in error_str for code in _THROTTLE_MESSAGES)
+    return is_retryable, is_throttle, None
+
+
+class AdaptiveLimiter:
+    """
+    AIMD(가산 증가/승산 감소) 기반 동시성 한도
+
+    - 성공 시 한도를 1/limit씩 늘려 한도만큼 성공할 때마다 약 1 증가
+    - 429/503 발생 시 한도를 decrease_factor 배로 축소 (cooldown 내 중복 축소 방지)
+    - Retry-After를 받으면 해당 시간 동안 신규 요청 승인을 보류
+    """
+
+    INCREASE_STEP = 1.0
+    DECREASE_FACTOR = 0.5
+    DECREASE_COOLDOWN = 2.0  # 초
+    MAX_BACKOFF = 60.0  # 초
+
+    def __init__(self, max_limit: int, min_limit: int = 1):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self._limit = float(self.max_limit)
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def blocked_for(self) -> float:
+        """Retry-After로 인해 승인을 보류해야 하는 남은 시간(초)"""
+        return max(0.0, self._blocked_until - time.monotonic())
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._limit = min(float(self.max_limit), self._limit + self.INCREASE_STEP / self._limit)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_decrease >= self.DECREASE_COOLDOWN:
+                self._limit = max(float(self.min_limit), self._limit * self.DECREASE_FACTOR)
+                self._last_decrease = now
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def backoff_delay(self, attempt: int, base_delay: float, multiplier: float,
+                      retry_after: Optional[float] = None) -> float:
+        """
+        Full jitter 지수 백오프 대기 시간 (동시 요청들이 같은 시점에 재시도하지 않도록 분산)
+
+        Args:
+            attempt: 0부터 시작하는 시도 횟수
+            base_delay: 초기 대기 시간(초)
+            multiplier: 지수 증가 배수
+            retry_after: 서버가 알려준 최소 대기 시간(초)
+        """
+        cap = min(self.MAX_BACKOFF, base_delay * (multiplier ** attempt))
+        delay = random.uniform(0, cap)
+        if retry_after:
+            delay = max(delay, retry_after + random.uniform(0, base_delay))
+        return delay
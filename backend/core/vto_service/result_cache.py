@@ -0,0 +1,185 @@
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, Optional
+from google.genai import types
+from PIL import Image
+from configs import settings
+from custom_logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _update_digest(digest, content) -> None:
+    """콘텐츠 종류별로 내용을 해시에 반영 (종류 태그를 함께 넣어 충돌 방지)"""
+    if content is None:
+        digest.update(b"none:")
+    elif isinstance(content, str):
+        digest.update(b"text:" + content.encode("utf-8"))
+    elif isinstance(content, (bytes, bytearray, memoryview)):
+        digest.update(b"bytes:" + bytes(content))
+    elif isinstance(content, types.Part):
+        if content.inline_data is not None:
+            digest.update(f"part:{content.inline_data.mime_type}:".encode("utf-8"))
+            digest.update(content.inline_data.data or b"")
+        elif content.file_data is not None:
+            digest.update(f"file:{content.file_data.file_uri}".encode("utf-8"))
+        else:
+            digest.update(b"part-text:" + (content.text or "").encode("utf-8"))
+    elif isinstance(content, Image.Image):
+        digest.update(f"pil:{content.mode}:{content.size}:".encode("utf-8"))
+        digest.update(content.tobytes())
+    else:
+        raise TypeError(f"해시할 수 없는 콘텐츠 타입입니다: {type(content)}")
+    digest.update(b"\x00")
+
+
+def content_digest(*contents) -> str:
+    """프롬프트/이미지/파라미터 등 콘텐츠 목록의 SHA-256 해시"""
+    digest = hashlib.sha256()
+    for content in contents:
+        if isinstance(content, (list, tuple)):
+            for item in content:
+                _update_digest(digest, item)
+        else:
+            _update_digest(digest, content)
+    return digest.hexdigest()
+
+
+class ImageResultCache:
+    """
+    생성 이미지 결과 디스크 캐시 (content-addressed)
+
+    - 키: 모델, 프롬프트, 입력 이미지 bytes, 생성 파라미터, 샘플 인덱스의 해시
+    - 이미지 bytes는 cache_dir/<prefix>/<key> 파일로, 인덱스는 SQLite로 관리
+    - TTL 만료 항목은 조회 시 제거, 전체 크기가 max_bytes를 넘으면 LRU 순으로 제거
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int, ttl_seconds: float):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(cache_dir, "index.sqlite3"), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_entries_accessed_at ON entries (accessed_at)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_base_key(model_name: str, contents: Iterable, temperature: float, top_p: float,
+                      aspect_ratio: str) -> str:
+        """요청 단위 키 (샘플 인덱스 제외)"""
+        return content_digest(
+            model_name,
+            list(contents),
+            f"temperature={temperature}",
+            f"top_p={top_p}",
+            f"aspect_ratio={aspect_ratio}",
+        )
+
+    @staticmethod
+    def sample_key(base_key: str, sample_index: int) -> str:
+        """샘플 단위 키 (같은 요청의 n번째 생성 결과)"""
+        return content_digest(base_key, f"sample_index={sample_index}")
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def _delete_locked(self, key: str) -> None:
+        self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT created_at FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if now - row[0] > self.ttl_seconds:
+                self._delete_locked(key)
+                self._conn.commit()
+                return None
+            try:
+                with open(self._path(key), "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                self._delete_locked(key)
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            return data
+
+    def _evict_locked(self) -> None:
+        expired = self._conn.execute(
+            "SELECT key FROM entries WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+        ).fetchall()
+        for (key,) in expired:
+            self._delete_locked(key)
+
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total > self.max_bytes:
+            for key, size in self._conn.execute(
+                "SELECT key, size FROM entries ORDER BY accessed_at ASC"
+            ).fetchall():
+                if total <= self.max_bytes:
+                    break
+                self._delete_locked(key)
+                total -= size
+
+    def _set(self, key: str, data: bytes) -> None:
+        now = time.time()
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, size, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, len(data), now, now),
+            )
+            self._evict_locked()
+            self._conn.commit()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """캐시된 이미지 bytes 반환 (없거나 만료되면 None)"""
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, data: bytes) -> None:
+        """이미지 bytes 저장 후 TTL/용량 기준으로 정리"""
+        try:
+            await asyncio.to_thread(self._set, key, data)
+        except OSError as e:
+            logger.warning(f"Result cache write failed: {e}")
+
+
+_result_cache: Optional[ImageResultCache] = None
+_result_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ImageResultCache:
+    """프로세스 전역 ImageResultCache 반환 (최초 호출 시 생성)"""
+    global _result_cache
+    if _result_cache is None:
+        with _result_cache_lock:
+            if _result_cache is None:
+                _result_cache = ImageResultCache(
+                    cache_dir=settings.vto_result_cache_dir,
+                    max_bytes=settings.vto_result_cache_max_bytes,
+                    ttl_seconds=settings.vto_result_cache_ttl_seconds,
+                )
+    return _result_cache
@@ -1,44 +1,194 @@
+import asyncio
 import json
-from typing import Dict, List
-from core.litellm_hander.schema import ClothesImageAnalysis
+import uuid
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar, Union,
+)
+import aiofiles
+from core.litellm_hander.schema import (
+    ClothesImageAnalysis,
+    ClothesAnalysisBatchItem,
+    LiteLLMUsageData,
+    ProductImageBatchItem,
+)
 from core.litellm_hander.process import LiteLLMHandler
+from core.litellm_hander.analysis_cache import get_analysis_cache
 from core.vto_service.gemini_handler import GeminiProcesser
+from core.vto_service.image_normalizer import ImageBuffer, as_image_bytes
+from prompts.prod_image_prompts import product_image_prompt
 
+# 이미지 경로/URL 또는 디스크를 거치지 않는 bytes/버퍼
+ImageSource = Union[str, ImageBuffer]
 
-async def analyze_clothes_image(image_path: str) -> ClothesImageAnalysis:
-    llm_handler = LiteLLMHandler()
-    image_content = await llm_handler.convert_litellm_image_object(image_path)
-    response = await llm_handler.analyze_clothes_image(image_content)
+T = TypeVar("T")
+
+# 배치 분석 기본 동시 실행 수
+ANALYZE_BATCH_MAX_CONCURRENCY = 8
+
+# 상품 이미지 배치 기본 동시 실행 의류 수 (샘플 단위 동시 요청 수는 전역 승인 컨트롤러가 제한)
+PRODUCT_IMAGE_BATCH_MAX_CONCURRENCY = 4
+
+
+async def _analyze_clothes_image_source(
+    llm_handler: LiteLLMHandler,
+    source: ImageSource,
+    use_cache: bool,
+) -> Tuple[ClothesImageAnalysis, Optional[LiteLLMUsageData]]:
+    """
+    단일 이미지 소스(경로, URL, bytes/버퍼) 분석
+    - URL은 bytes가 없으므로 캐시를 거치지 않고 그대로 전달
+    
+    Returns:
+        Tuple: (분석 결과, 이번 호출의 비용 정보 - 캐시 적중이면 None)
+    """
+    is_url = isinstance(source, str) and source.startswith(("http://", "https://"))
+    image_bytes = None
+    
+    if not isinstance(source, str):
+        image_bytes = as_image_bytes(source)
+    elif use_cache and not is_url:
+        async with aiofiles.open(source, "rb") as f:
+            image_bytes = await f.read()
+    
+    use_cache = use_cache and image_bytes is not None
+    if use_cache:
+        prompt_version = LiteLLMHandler.analyze_clothes_image_version()
+        analysis_cache = get_analysis_cache(prompt_version)
+        cached_analysis = await analysis_cache.get(image_bytes, prompt_version)
+        if cached_analysis is not None:
+            return cached_analysis, None
+    
+    if is_url:
+        image_content = await llm_handler.convert_litellm_image_object(image_url=source)
+    elif isinstance(source, str):
+        image_content = await llm_handler.convert_litellm_image_object(image_path=source)
+    else:
+        image_content = await llm_handler.convert_litellm_image_object(image_bytes=image_bytes)
+    
+    response, usage = await llm_handler.analyze_clothes_image(image_content)
     contents = json.loads(response.choices[0].message.content)
     clothes_image_analysis = ClothesImageAnalysis(**contents)
+    
+    if use_cache:
+        await analysis_cache.set(image_bytes, prompt_version, clothes_image_analysis)
+    return clothes_image_analysis, usage
+
+
+async def analyze_clothes_image(image_path: ImageSource, use_cache: bool = True) -> ClothesImageAnalysis:
+    """
+    의류 이미지 분석
+    
+    Args:
+        image_path: 의류 이미지 경로 또는 bytes/bytearray/memoryview/BytesIO (업로드 파일을 임시 파일 없이 바로 전달)
+        use_cache: 분석 결과 캐시 사용 여부 (같은 이미지/재촬영된 근접 중복 이미지는 재분석하지 않음)
+    
+    Returns:
+        ClothesImageAnalysis: 분석 결과
+    """
+    clothes_image_analysis, _ = await _analyze_clothes_image_source(LiteLLMHandler(), image_path, use_cache)
     return clothes_image_analysis
 
+
+async def _iterate_sources(sources: Union[Iterable[ImageSource], AsyncIterable[ImageSource]]) -> AsyncIterator[ImageSource]:
+    if hasattr(sources, "__aiter__"):
+        async for source in sources:
+            yield source
+    else:
+        for source in sources:
+            yield source
+
+
+async def _run_bounded(
+    sources: Union[Iterable, AsyncIterable],
+    run_item: Callable[[int, Any], Awaitable[T]],
+    max_concurrency: int,
+) -> AsyncIterator[T]:
+    """
+    입력을 지연 소비하며 동시에 최대 max_concurrency개만 run_item(index, source)으로 실행 (완료되는 순서대로 반환)
+    - 소비자가 중간에 중단하면 남은 작업 취소
+    """
+    pending = set()
+    try:
+        index = 0
+        async for source in _iterate_sources(sources):
+            if len(pending) >= max_concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+            pending.add(asyncio.create_task(run_item(index, source)))
+            index += 1
+        
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def analyze_clothes_images(
+    sources: Union[Iterable[ImageSource], AsyncIterable[ImageSource]],
+    max_concurrency: int = ANALYZE_BATCH_MAX_CONCURRENCY,
+    use_cache: bool = True,
+    llm_handler: Optional[LiteLLMHandler] = None,
+) -> AsyncIterator[ClothesAnalysisBatchItem]:
+    """
+    의류 이미지 배치 분석 (완료되는 순서대로 스트리밍)
+    
+    - 입력은 지연 소비되며 동시에 최대 max_concurrency개만 분석
+    - 항목별 실패는 error에 기록하고 나머지 분석은 계속 진행
+    - 전체 사용량은 항목별 usage를 sum_clothes_analysis_usage()로 합산
+      (전달한 llm_handler의 calculate_total_cost()로도 집계 가능)
+    
+    Args:
+        sources: 이미지 경로/URL/bytes/버퍼의 iterable 또는 async iterable
+        max_concurrency: 동시 분석 개수 (기본값: 8)
+        use_cache: 분석 결과 캐시 사용 여부 (기본값: True)
+        llm_handler: 사용량을 누적할 핸들러 (기본값: 새로 생성)
+    
+    Yields:
+        ClothesAnalysisBatchItem: 입력 인덱스가 포함된 항목별 결과
+    """
+    llm_handler = llm_handler or LiteLLMHandler()
+    
+    async def analyze_item(index: int, source: ImageSource) -> ClothesAnalysisBatchItem:
+        item = ClothesAnalysisBatchItem(index=index, source=source if isinstance(source, str) else None)
+        try:
+            item.analysis, item.usage = await _analyze_clothes_image_source(llm_handler, source, use_cache)
+            item.cached = item.usage is None
+        except Exception as e:
+            item.error = f"{type(e).__name__}: {e}"
+        return item
+    
+    async for item in _run_bounded(sources, analyze_item, max_concurrency):
+        yield item
+
 async def image_inference_with_prompt(
     prompt: str,
-    image_paths : List[str],
+    image_paths : Sequence[ImageSource],
     temperature: float = 1.0,
     image_count: int = 1,
     top_p: float = 0.95,
-    aspect_ratio: str = "1:1"
+    aspect_ratio: str = "1:1",
+    use_cache: bool = False
 ) -> Dict:
     """
     Single Image Inference: 주어진 이미지(단일 또는 여러 개)에 대해 추론 실행
     
     Args:
         prompt: 프롬프트
-        image_paths: 이미지 경로(단일 또는 여러 개)
+        image_paths: 이미지 경로 또는 bytes/bytearray/memoryview/BytesIO (단일 또는 여러 개, 임시 파일 없이 전달 가능)
         temperature: 결과의 다양성 (기본값: 1.0)
         image_count: 생성할 이미지 개수 (기본값: 1)
         top_p: Top-p (nucleus) 샘플링 값 (기본값: 0.95)
+        use_cache: 결과 캐시 사용 여부 (기본값: False)
     
     Returns:
         Dict: 응답 결과 (이미지 리스트 및 비용 정보)
     """
     gemini_processer = GeminiProcesser()
-    image_contents = []
-    
-    for image_path in image_paths:
-        image_contents.append(await gemini_processer.load_clothes_images(image_path))
+    image_contents = await gemini_processer.load_image_contents(image_paths)
     
     print(f"\n{'='*50}")
     print(f"이미지 생성 호출 내용")
@@ -55,5 +205,107 @@ async def image_inference_with_prompt(
         image_count=image_count,
         temperature=temperature,
         top_p=top_p,
-        aspect_ratio=aspect_ratio
+        aspect_ratio=aspect_ratio,
+        use_cache=use_cache
     )
+
+
+async def stream_image_inference_with_prompt(
+    prompt: str,
+    image_paths : Sequence[ImageSource],
+    temperature: float = 1.0,
+    image_count: int = 1,
+    top_p: float = 0.95,
+    aspect_ratio: str = "1:1",
+    use_cache: bool = False
+) -> AsyncIterator[Dict]:
+    """
+    image_inference_with_prompt의 스트리밍 버전: 이미지가 완성되는 순서대로 하나씩 반환
+    
+    Yields:
+        Dict: {"index", "image", "usage", "cache_hit"} (GeminiProcesser.stream_image_inference 참고)
+    """
+    gemini_processer = GeminiProcesser()
+    image_contents = await gemini_processer.load_image_contents(image_paths)
+    
+    async for result in gemini_processer.stream_image_inference(
+        contents_list=[prompt] + image_contents,
+        image_count=image_count,
+        temperature=temperature,
+        top_p=top_p,
+        aspect_ratio=aspect_ratio,
+        use_cache=use_cache
+    ):
+        yield result
+
+
+async def generate_product_images(
+    garments: Union[Iterable[Union[ImageSource, Sequence[ImageSource]]],
+                    AsyncIterable[Union[ImageSource, Sequence[ImageSource]]]],
+    mode: str = "default",
+    temperature: float = 1.0,
+    image_count: int = 1,
+    max_concurrency: int = PRODUCT_IMAGE_BATCH_MAX_CONCURRENCY,
+    use_cache: bool = False,
+) -> AsyncIterator[ProductImageBatchItem]:
+    """
+    상품 이미지(누끼) 배치 생성 (의류별로 독립 실행, 완료되는 순서대로 스트리밍)
+    
+    - 의류마다 자신의 입력 이미지만 전달 (다른 의류 이미지가 섞이지 않음)
+    - 입력은 지연 소비되며 동시에 최대 max_concurrency개 의류만 처리
+    - 항목별 실패는 error에 기록하고 나머지 의류는 계속 진행
+    - 배치 전체가 하나의 공정 큐잉 단위를 사용하므로 다른 사용자 요청을 밀어내지 않음
+    - 전체 사용량은 항목별 usage를 sum_product_image_usage()로 합산
+    
+    Args:
+        garments: 의류별 입력의 iterable 또는 async iterable
+                  (이미지 경로/bytes/버퍼 하나, 또는 같은 의류의 이미지 리스트)
+        mode: 프롬프트 모드 ("default", "mannequin", "person")
+        temperature: 결과의 다양성 (기본값: 1.0)
+        image_count: 의류당 생성할 이미지 개수 (기본값: 1)
+        max_concurrency: 동시 처리 의류 수 (기본값: 4)
+        use_cache: 결과 캐시 사용 여부 (기본값: False)
+    
+    Yields:
+        ProductImageBatchItem: 입력 인덱스가 포함된 의류별 결과
+    """
+    gemini_processer = GeminiProcesser(verbose=False)
+    prompt = product_image_prompt(type=mode)
+    caller_id = uuid.uuid4().hex
+    
+    async def generate_item(index: int, garment) -> ProductImageBatchItem:
+        item = ProductImageBatchItem(index=index)
+        images = list(garment) if isinstance(garment, (list, tuple)) else [garment]
+        try:
+            image_contents = await gemini_processer.load_image_contents(images)
+            result = await gemini_processer.execute_image_inference(
+                contents_list=[prompt] + image_contents,
+                image_count=image_count,
+                temperature=temperature,
+                caller_id=caller_id,
+                use_cache=use_cache,
+            )
+            item.images = [image for image in result["response"] if image is not None]
+            item.usage = result["usage"]
+        except Exception as e:
+            item.error = f"{type(e).__name__}: {e}"
+        return item
+    
+    async for item in _run_bounded(garments, generate_item, max_concurrency):
+        yield item
+
+
+def sum_clothes_analysis_usage(items: List[ClothesAnalysisBatchItem]) -> Optional[LiteLLMUsageData]:
+    """의류 분석 배치 결과의 사용량 합산 (캐시 적중/실패만 있어 사용량이 없으면 None)"""
+    usage_data_list = [item.usage for item in items if item.usage is not None]
+    if not usage_data_list:
+        return None
+    return LiteLLMHandler.sum_usage_data(usage_data_list, task_name="analyze_clothes_images")
+
+
+async def sum_product_image_usage(items: List[ProductImageBatchItem]) -> Optional[LiteLLMUsageData]:
+    """상품 이미지 배치 결과의 사용량 합산 (사용량이 없으면 None)"""
+    usage_data_list = [item.usage for item in items if item.usage is not None]
+    if not usage_data_list:
+        return None
+    return await GeminiProcesser(verbose=False).sum_usage_data(usage_data_list)
@@ -0,0 +1,94 @@
+"""
+DB 커넥션 풀 사용량 지표
+- InstrumentedAsyncQueuePool: 커넥션 체크아웃 대기 시간/타임아웃/최대 동시 사용 수 기록
+- 대기 시간은 pool.connect() 전체 시간 (여유 커넥션이 없을 때의 대기 + overflow 커넥션 생성 포함)
+- 워커 수 / pool_size / max_overflow 산정용 (관리자 API: GET /api/v1/admin/db-pool)
+"""
+import threading
+import time
+from collections import deque
+from typing import Deque
+from pydantic import BaseModel, Field
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class PoolWaitTracker:
+    """
+    커넥션 체크아웃 대기 시간 누적 및 최근 window_size개 백분위 계산
+    """
+
+    def __init__(self, window_size: int = 1024):
+        self._lock = threading.Lock()
+        self._recent: Deque[float] = deque(maxlen=window_size)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.peak_checked_out = 0
+
+    def record(self, wait: float, checked_out: int, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+                self.total_wait += wait
+                self._recent.append(wait)
+            self.max_wait = max(self.max_wait, wait)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+
+    def percentile(self, q: float) -> float:
+        with self._lock:
+            ordered = sorted(self._recent)
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._recent.clear()
+            self.checkouts = 0
+            self.timeouts = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+            self.peak_checked_out = 0
+
+
+# 풀은 dispose()/recreate() 시 새 인스턴스로 바뀌므로 지표는 프로세스 전역으로 유지
+pool_wait_tracker = PoolWaitTracker()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """체크아웃마다 대기 시간을 pool_wait_tracker에 기록하는 AsyncAdaptedQueuePool"""
+
+    def connect(self):
+        started_at = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            pool_wait_tracker.record(time.perf_counter() - started_at, self.checkedout(), timed_out=True)
+            raise
+        pool_wait_tracker.record(time.perf_counter() - started_at, self.checkedout())
+        return connection
+
+
+class DbPoolStats(BaseModel):
+    env: str = Field(..., description="엔진 프로필 (local/dev/prod)")
+    pool_size: int = Field(..., description="상시 유지 커넥션 수")
+    max_overflow: int = Field(..., description="pool_size 초과 허용 커넥션 수")
+    pool_timeout: float = Field(..., description="체크아웃 최대 대기 시간(초)")
+    pool_recycle: int = Field(..., description="커넥션 재생성 주기(초), -1: 사용 안 함")
+    pool_pre_ping: bool = Field(..., description="체크아웃 시 ping 여부")
+    statement_timeout_ms: int = Field(..., description="PostgreSQL statement_timeout(ms), 0: 무제한")
+    prepared_statement_cache_size: int = Field(..., description="asyncpg prepared statement 캐시 크기")
+    checked_out: int = Field(..., description="현재 사용 중인 커넥션 수")
+    checked_in: int = Field(..., description="현재 풀에서 대기 중인 커넥션 수")
+    overflow: int = Field(..., description="현재 overflow 커넥션 수 (음수: 아직 만들지 않은 pool_size 여유분)")
+    utilization: float = Field(..., description="checked_out / (pool_size + max_overflow)")
+    peak_checked_out: int = Field(..., description="누적 최대 동시 사용 커넥션 수")
+    checkouts: int = Field(..., description="누적 체크아웃 수")
+    checkout_timeouts: int = Field(..., description="누적 체크아웃 타임아웃 수")
+    wait_avg_ms: float = Field(..., description="평균 체크아웃 대기 시간(ms)")
+    wait_p95_ms: float = Field(..., description="최근 체크아웃 대기 시간 p95(ms)")
+    wait_max_ms: float = Field(..., description="누적 최대 체크아웃 대기 시간(ms)")
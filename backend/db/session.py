@@ -1,12 +1,29 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from configs import settings
+from db.pool_metrics import DbPoolStats, InstrumentedAsyncQueuePool, pool_wait_tracker
 
+
+def _connect_args() -> dict:
+    """asyncpg 연결 인자 (statement_timeout, prepared statement 캐시)"""
+    connect_args = {"prepared_statement_cache_size": settings.db_prepared_statement_cache_size}
+    if settings.db_statement_timeout_ms > 0:
+        connect_args["server_settings"] = {"statement_timeout": str(settings.db_statement_timeout_ms)}
+    return connect_args
+
+
+# 엔진 설정은 ENV 프로필(configs.py)에서 결정 (SQL echo는 local 기본값만 켜짐)
 engine = create_async_engine(
     settings.database_url,
-    echo=True,
+    echo=settings.db_echo,
     future=True,
-    pool_pre_ping=True,
+    poolclass=InstrumentedAsyncQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    connect_args=_connect_args(),
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -26,3 +43,32 @@ async def get_db():
             yield session
         finally:
             await session.close()
+
+
+def get_pool_stats() -> DbPoolStats:
+    """현재 엔진 커넥션 풀 사용량 + 누적 체크아웃 대기 지표"""
+    pool = engine.pool
+    capacity = settings.db_pool_size + settings.db_max_overflow
+    checked_out = pool.checkedout()
+    return DbPoolStats(
+        env=settings.env,
+        pool_size=pool.size(),
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        statement_timeout_ms=settings.db_statement_timeout_ms,
+        prepared_statement_cache_size=settings.db_prepared_statement_cache_size,
+        checked_out=checked_out,
+        checked_in=pool.checkedin(),
+        overflow=pool.overflow(),
+        utilization=round(checked_out / capacity, 4) if capacity > 0 else 0.0,
+        peak_checked_out=pool_wait_tracker.peak_checked_out,
+        checkouts=pool_wait_tracker.checkouts,
+        checkout_timeouts=pool_wait_tracker.timeouts,
+        wait_avg_ms=round(pool_wait_tracker.total_wait / pool_wait_tracker.checkouts * 1000, 3)
+        if pool_wait_tracker.checkouts
+        else 0.0,
+        wait_p95_ms=round(pool_wait_tracker.percentile(0.95) * 1000, 3),
+        wait_max_ms=round(pool_wait_tracker.max_wait * 1000, 3),
+    )
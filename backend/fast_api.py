@@ -1,12 +1,40 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
-from api.v1 import auth, users, collections, projects, organizations
+from api.v1 import auth, users, collections, projects, organizations, vto_jobs, admin
+from configs import settings
+from db.session import engine
+from core.vto_service.client_pool import close_gemini_client_pool
+from core.vto_service.image_executor import close_image_executor
+from services.vto_job_service import VtoJobWorkerPool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 생성 작업 워커 시작 (VTO_JOB_WORKER_COUNT=0이면 API만 실행)
+    worker_pool = None
+    if settings.vto_job_worker_count > 0:
+        worker_pool = VtoJobWorkerPool(
+            worker_count=settings.vto_job_worker_count,
+            poll_interval=settings.vto_job_poll_interval,
+        )
+        worker_pool.start()
+    yield
+    if worker_pool is not None:
+        await worker_pool.stop()
+    # 종료 시 Gemini keep-alive 커넥션 및 이미지 작업 풀 정리
+    await close_gemini_client_pool()
+    await close_image_executor()
+    # DB 커넥션 풀 정리
+    await engine.dispose()
+
 
 app = FastAPI(
     title="Virtual Try-On API",
     description="Virtual Try-On Backend API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -15,6 +43,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 목록 API 페이지네이션/조건부 요청 헤더를 브라우저에서 읽을 수 있도록 노출
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
 app.include_router(auth.router, prefix="/api/v1")
@@ -22,6 +52,8 @@ app.include_router(users.router, prefix="/api/v1")
 app.include_router(collections.router, prefix="/api/v1")
 app.include_router(projects.router, prefix="/api/v1")
 app.include_router(organizations.router, prefix="/api/v1")
+app.include_router(vto_jobs.router, prefix="/api/v1")
+app.include_router(admin.router, prefix="/api/v1")
 
 
 @app.get("/")
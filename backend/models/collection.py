@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Text, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, Text, TIMESTAMP, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
@@ -14,3 +14,18 @@ class Collection(Base):
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
     updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now())
     deleted_at = Column(TIMESTAMP(timezone=True), nullable=True)
+
+    # 삭제되지 않은 행만 대상으로 하는 부분 인덱스 (목록 키셋 정렬 / 사용자별 이름 유니크)
+    __table_args__ = (
+        Index(
+            "ix_collections_user_id_created_at",
+            user_id, created_at.desc(), id.desc(),
+            postgresql_where=deleted_at.is_(None),
+        ),
+        Index(
+            "uq_collections_user_id_name",
+            user_id, name,
+            unique=True,
+            postgresql_where=deleted_at.is_(None),
+        ),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Text, TIMESTAMP
+from sqlalchemy import Column, Text, TIMESTAMP, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
@@ -13,3 +13,13 @@ class Organization(Base):
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
     updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now())
     deleted_at = Column(TIMESTAMP(timezone=True), nullable=True)
+
+    # 삭제되지 않은 행만 대상으로 하는 부분 인덱스 (목록 키셋 정렬 / 이름 유니크)
+    __table_args__ = (
+        Index(
+            "ix_organizations_created_at",
+            created_at.desc(), id.desc(),
+            postgresql_where=deleted_at.is_(None),
+        ),
+        Index("uq_organizations_name", name, unique=True, postgresql_where=deleted_at.is_(None)),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Text, TIMESTAMP, ForeignKey, Integer
+from sqlalchemy import Column, Text, TIMESTAMP, ForeignKey, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 import uuid
@@ -20,3 +20,23 @@ class Project(Base):
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
     updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now())
     deleted_at = Column(TIMESTAMP(timezone=True), nullable=True)
+
+    # 삭제되지 않은 행만 대상으로 하는 부분 인덱스 (목록 키셋 정렬 / 컬렉션별 목록 / 사용자별 이름 유니크)
+    __table_args__ = (
+        Index(
+            "ix_projects_user_id_created_at",
+            user_id, created_at.desc(), id.desc(),
+            postgresql_where=deleted_at.is_(None),
+        ),
+        Index(
+            "ix_projects_collection_id_created_at",
+            collection_id, created_at.desc(), id.desc(),
+            postgresql_where=deleted_at.is_(None),
+        ),
+        Index(
+            "uq_projects_user_id_name",
+            user_id, name,
+            unique=True,
+            postgresql_where=deleted_at.is_(None),
+        ),
+    )
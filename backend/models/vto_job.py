@@ -0,0 +1,41 @@
+from sqlalchemy import Column, Text, String, TIMESTAMP, ForeignKey, Integer, Float, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.sql import func
+import uuid
+from db.session import Base
+
+
+class VtoJob(Base):
+    __tablename__ = "vto_jobs"
+    __table_args__ = (
+        Index("ix_vto_jobs_status_queued_at", "status", "queued_at"),
+        Index("ix_vto_jobs_user_id_status", "user_id", "status"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="SET NULL"), nullable=True)
+    status = Column(String(16), nullable=False, default="PENDING", server_default="PENDING")  # PENDING / RUNNING / SUCCEEDED / FAILED
+    worker = Column(Text, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # 생성 요청 (프롬프트, 파라미터, base64 입력 이미지)
+    prompt = Column(Text, nullable=False)
+    input_images = Column(JSONB, nullable=False)
+    image_count = Column(Integer, nullable=False, default=1)
+    temperature = Column(Float, nullable=False, default=1.0)
+    top_p = Column(Float, nullable=False, default=0.95)
+    aspect_ratio = Column(String(16), nullable=False, default="1:1")
+
+    # 진행 상황 및 결과 (base64 결과 이미지, 실패 샘플은 null)
+    completed_count = Column(Integer, nullable=False, default=0, server_default="0")
+    success_count = Column(Integer, nullable=False, default=0, server_default="0")
+    result_images = Column(JSONB, nullable=True)
+    usage = Column(JSONB, nullable=True)
+    fail_reason = Column(Text, nullable=True)
+
+    queued_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    started_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    finished_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now())
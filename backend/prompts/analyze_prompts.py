@@ -1,20 +1,20 @@
 from textwrap import dedent
+import functools
+import hashlib
 import json
 from core.litellm_hander.utils import ClothesOptions as ClothesOptionsUtils
 
 
+@functools.lru_cache(maxsize=1)
 def analyze_clothes_image_prompt():
-    def get_clothes_category_as_text():
-        clothes_dict = {}
-        data = ClothesOptionsUtils.clothes_category()
-        for category_name, category_data in data.items():
-            for sub_category_name, sub_category_data in category_data[
-                "children"
-            ].items():
-                clothes_dict[sub_category_name] = {"desc": sub_category_data["desc"]}
-        return clothes_dict
-
-    clothes_dict = get_clothes_category_as_text()
+    """
+    의류 이미지 분석 시스템 프롬프트
+    - 카테고리 카탈로그는 고정이므로 한 번만 렌더링 (모든 요청이 같은 문자열 → 프롬프트 캐싱 대상)
+    """
+    clothes_dict = {
+        sub_category_name: {"desc": sub_category_data["desc"]}
+        for sub_category_name, sub_category_data in ClothesOptionsUtils.sub_categories().items()
+    }
     json_dict = json.dumps(clothes_dict, ensure_ascii=False, indent=2)
 
     text = dedent(f"""
@@ -110,6 +110,12 @@ is_clothes: false
     return text
 
 
+@functools.lru_cache(maxsize=1)
+def analyze_clothes_image_prompt_version():
+    """의류 이미지 분석 시스템 프롬프트 해시"""
+    return hashlib.sha256(analyze_clothes_image_prompt().encode("utf-8")).hexdigest()
+
+
 def valid_generated_vto_prompt():
     text = dedent("""
 
@@ -0,0 +1,198 @@
+"""
+프롬프트 조립 결과 메모이제이션
+- 옵션 조합이 유한하므로 같은 옵션이면 조립된 프롬프트 문자열을 그대로 재사용
+- 키: 정규화한 인자 (Pydantic 옵션 모델은 필드 값 튜플로 변환)
+- 프롬프트 버전 해시: 대표 옵션(version_samples)으로 조립한 프롬프트 + 옵션 카탈로그 prompt 텍스트 해시
+  (소스가 아니라 실제 렌더링 결과 기준이므로 주석/공백 수정으로는 바뀌지 않음, 하위 결과 캐시 키로 사용 가능)
+"""
+import functools
+import hashlib
+import inspect
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
+from pydantic import BaseModel, Field
+from configs import settings
+import core.litellm_hander.utils as option_catalog
+
+
+class PromptCacheStats(BaseModel):
+    name: str = Field(..., description="프롬프트 조립 함수 이름")
+    version: str = Field(..., description="프롬프트 버전 해시")
+    size: int = Field(..., description="캐시된 프롬프트 수")
+    max_size: int = Field(..., description="최대 캐시 수 (LRU)")
+    hits: int = Field(..., description="누적 적중 수")
+    misses: int = Field(..., description="누적 미적중 수 (조립 실행)")
+    evictions: int = Field(..., description="누적 LRU 제거 수")
+    uncacheable: int = Field(..., description="키를 만들 수 없어 캐시 없이 조립한 횟수")
+
+
+def _normalize(value: Any) -> Hashable:
+    """캐시 키용 값 정규화 (Pydantic 모델은 (클래스 이름, 필드 값 튜플))"""
+    if isinstance(value, BaseModel):
+        return (type(value).__name__,) + tuple((k, _normalize(v)) for k, v in value.model_dump().items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _normalize(v)) for k, v in value.items()))
+    # 해시 불가능한 값(set 등)은 TypeError → 캐시 없이 조립 (_make_key)
+    hash(value)
+    return value
+
+
+@functools.lru_cache(maxsize=1)
+def _option_catalog_text() -> str:
+    """
+    옵션 카탈로그에서 프롬프트에 들어가는 텍스트(key → prompt 테이블)만 직렬화
+    (옵션 이름/설명, 주석 수정은 버전에 영향 없음)
+    """
+    tables = {
+        name: {str(key): prompt for key, prompt in table.items()}
+        for name, table in vars(option_catalog).items()
+        if name.endswith("_PROMPTS") and isinstance(table, Mapping)
+    }
+    return json.dumps(tables, ensure_ascii=False, sort_keys=True)
+
+
+class PromptCache:
+    """
+    프롬프트 조립 함수 하나에 대한 LRU 캐시 (스레드 안전)
+    """
+
+    def __init__(
+        self,
+        builder: Callable[..., str],
+        max_size: int,
+        version_samples: Optional[Sequence[Dict[str, Any]]] = None,
+    ):
+        """
+        Args:
+            builder: 프롬프트 조립 함수
+            max_size: 최대 캐시 수 (LRU)
+            version_samples: 버전 해시 계산용 대표 인자 목록 (분기별로 하나 이상)
+                기본값: 인자 없이 호출 가능하면 기본 인자 1회, 아니면 없음 (이름 + 옵션 카탈로그만 반영)
+        """
+        self.builder = builder
+        self.name = builder.__name__
+        self.max_size = max_size
+        self._signature = inspect.signature(builder)
+        if version_samples is None:
+            try:
+                self._signature.bind()
+                version_samples = [{}]
+            except TypeError:
+                version_samples = []
+        self.version_samples = list(version_samples)
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._version: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.uncacheable = 0
+
+    @property
+    def version(self) -> str:
+        """프롬프트 버전 해시 (대표 옵션으로 조립한 프롬프트 또는 옵션 카탈로그 텍스트가 바뀌면 달라짐)"""
+        if self._version is None:
+            digest = hashlib.sha256()
+            digest.update(self.name.encode("utf-8"))
+            for sample in self.version_samples:
+                digest.update(b"\0")
+                digest.update(self.builder(**sample).encode("utf-8"))
+            digest.update(_option_catalog_text().encode("utf-8"))
+            self._version = digest.hexdigest()
+        return self._version
+
+    def _make_key(self, args: tuple, kwargs: dict) -> Optional[Hashable]:
+        try:
+            bound = self._signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return tuple((name, _normalize(value)) for name, value in bound.arguments.items())
+        except TypeError:
+            return None
+
+    def __call__(self, *args, **kwargs) -> str:
+        key = self._make_key(args, kwargs)
+        if key is None:
+            with self._lock:
+                self.uncacheable += 1
+            return self.builder(*args, **kwargs)
+
+        with self._lock:
+            prompt = self._cache.get(key)
+            if prompt is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return prompt
+            self.misses += 1
+
+        prompt = self.builder(*args, **kwargs)
+        with self._lock:
+            self._cache[key] = prompt
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+        return prompt
+
+    def stats(self) -> PromptCacheStats:
+        with self._lock:
+            return PromptCacheStats(
+                name=self.name,
+                version=self.version,
+                size=len(self._cache),
+                max_size=self.max_size,
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                uncacheable=self.uncacheable,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+_prompt_caches: Dict[str, PromptCache] = {}
+
+
+def memoize_prompt(
+    builder: Optional[Callable[..., str]] = None,
+    *,
+    version_samples: Optional[Sequence[Dict[str, Any]]] = None,
+):
+    """
+    프롬프트 조립 함수 메모이제이션 데코레이터 (@memoize_prompt 또는 @memoize_prompt(version_samples=[...]))
+
+    - 시그니처는 그대로 유지 (functools.wraps)
+    - 래퍼에 prompt_cache(PromptCache), prompt_version(버전 해시 반환 함수) 속성 추가
+    - version_samples: 버전 해시 계산용 대표 인자 목록 (템플릿 분기마다 하나 이상 포함)
+    """
+    def decorate(builder: Callable[..., str]) -> Callable[..., str]:
+        cache = PromptCache(builder, max_size=settings.prompt_cache_max_size, version_samples=version_samples)
+        _prompt_caches[cache.name] = cache
+
+        @functools.wraps(builder)
+        def wrapper(*args, **kwargs) -> str:
+            return cache(*args, **kwargs)
+
+        wrapper.prompt_cache = cache
+        wrapper.prompt_version = lambda: cache.version
+        return wrapper
+
+    if builder is not None:
+        return decorate(builder)
+    return decorate
+
+
+def prompt_cache_stats() -> List[PromptCacheStats]:
+    """등록된 모든 프롬프트 캐시 통계"""
+    return [cache.stats() for cache in _prompt_caches.values()]
+
+
+def prompt_version(name: str) -> str:
+    """프롬프트 조립 함수 이름으로 버전 해시 조회"""
+    return _prompt_caches[name].version
@@ -1,7 +1,27 @@
 from typing import Optional
 from core.litellm_hander.schema import StyleCutOptions, ModelOptions
 from core.litellm_hander.utils import StyleCutOptions as StyleCutOptionsUtils
+from prompts.prompt_cache import memoize_prompt
 
+# 버전 해시용 대표 옵션 (기본값, 모든 옵션 지정, 포즈 없이 일부 옵션만 지정한 분기 포함)
+ASSEMBLE_STYLE_CUT_PROMPT_VERSION_SAMPLES = [
+    dict(),
+    dict(
+        model_options=ModelOptions(gender="man", age="young"),
+        style_cut_options=StyleCutOptions(
+            shot_type="full_body", camera_angle="front", pose="sitting_on_chair", arms_pose="hands_together",
+            gaze="looking_camera", facial_expression="smile", background="custom", lighting_style="natural_indoor",
+            color_tone="warm", camera_specs="high_end", post_processing_keywords="stylish_modern",
+        ),
+    ),
+    dict(
+        model_options=ModelOptions(gender="woman", age="teen"),
+        style_cut_options=StyleCutOptions(camera_angle="side", gaze="closed_eyes", background="same", lighting_style="direct_sunlight"),
+    ),
+]
+
+
+@memoize_prompt(version_samples=ASSEMBLE_STYLE_CUT_PROMPT_VERSION_SAMPLES)
 def assemble_style_cut_prompt(
     model_options: Optional[ModelOptions] = None,
     style_cut_options: Optional[StyleCutOptions] = None
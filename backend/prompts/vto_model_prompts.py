@@ -1,7 +1,27 @@
 from typing import Optional
 from core.litellm_hander.utils import ModelOptions as ModelOptionsUtils, ClothesOptions as ClothesOptionsUtils
 from core.litellm_hander.schema import ModelOptions, ClothesOptions
+from prompts.prompt_cache import memoize_prompt
 
+# 버전 해시용 대표 옵션 (앞/뒤, 성별, 나이, 외형 옵션, 의상 옵션 유무 분기를 모두 포함)
+ASSEMBLE_MODEL_PROMPT_VERSION_SAMPLES = [
+    dict(
+        type="front",
+        model_options=ModelOptions(
+            gender="woman", age="young", skin_tone="fair", ethnicity="asian",
+            hairstyle="long", hair_color="black", height=168, weight=52,
+        ),
+        clothes_options=ClothesOptions(
+            main_category="tops", sub_category="hoodie", sleeve="long", length="hip", fit="oversized", total_length=65,
+        ),
+        wear_together="black slacks",
+    ),
+    dict(type="back", model_options=ModelOptions(gender="man", age="kid")),
+    dict(type="front", model_options=ModelOptions(gender="man", age="teen")),
+]
+
+
+@memoize_prompt(version_samples=ASSEMBLE_MODEL_PROMPT_VERSION_SAMPLES)
 def assemble_model_prompt(
     type: str,
     model_options: Optional[ModelOptions] = None,
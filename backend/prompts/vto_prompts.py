@@ -1,10 +1,22 @@
 from typing import Optional
 from core.litellm_hander.utils import ClothesOptions as ClothesOptionsUtils
+from prompts.prompt_cache import memoize_prompt
 
 """
 Virtual Try-On 프롬프트 모음
 """
 
+# 버전 해시용 대표 옵션 (성별/입히는 방법/이미지 개수/카테고리 분기를 모두 포함)
+ASSEMBLE_PROMPT_VERSION_SAMPLES = [
+    dict(main_category="tops", sub_category="hoodie", replacement="tops", gender="woman", how="remove",
+         sleeve="long", length="hip", fit="oversized"),
+    dict(main_category="bottoms", sub_category="denim_pants", replacement="bottoms", gender="man", how="over",
+         image_count=3),
+    dict(main_category="default", sub_category="none", replacement="clothes"),
+]
+
+
+@memoize_prompt(version_samples=ASSEMBLE_PROMPT_VERSION_SAMPLES)
 def assemble_prompt(
     *, 
     main_category: str,
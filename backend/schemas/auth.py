@@ -35,6 +35,12 @@ class TokenResponse(BaseModel):
     user_id: UUID
 
 
+class TokenClaims(BaseModel):
+    user_id: UUID
+    jti: Optional[str] = None
+    iat: Optional[int] = None
+
+
 class UserResponse(BaseModel):
     id: UUID
     email: Optional[str]
@@ -0,0 +1,39 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any
+from uuid import UUID
+from datetime import datetime
+
+
+class VtoJobCreateRequest(BaseModel):
+    prompt: str
+    images: List[str] = Field(..., min_length=1, description="base64 인코딩된 입력 이미지 목록")
+    image_count: int = Field(1, ge=1, le=10)
+    temperature: float = Field(1.0, ge=0.0, le=2.0)
+    top_p: float = Field(0.95, ge=0.0, le=1.0)
+    aspect_ratio: str = "1:1"
+    project_id: Optional[UUID] = None
+
+
+class VtoJobResponse(BaseModel):
+    id: UUID
+    user_id: UUID
+    project_id: Optional[UUID]
+    status: str
+    image_count: int
+    completed_count: int
+    success_count: int
+    usage: Optional[Dict[str, Any]]
+    fail_reason: Optional[str]
+    queued_at: Optional[datetime]
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+
+class VtoJobResultResponse(BaseModel):
+    id: UUID
+    status: str
+    images: List[Optional[str]] = Field(..., description="base64 인코딩된 결과 이미지 (실패한 샘플은 null)")
+    usage: Optional[Dict[str, Any]]
@@ -5,7 +5,7 @@ from core.litellm_hander.process import LiteLLMHandler
 async def analyze_clothes_image(image_path: str) -> ClothesImageAnalysis:
     llm_handler = LiteLLMHandler()
     image_content = await llm_handler.convert_litellm_image_object(image_path)
-    response = await llm_handler.analyze_clothes_image(image_content)
+    response, _ = await llm_handler.analyze_clothes_image(image_content)
     contents = json.loads(response.choices[0].message.content)
     clothes_image_analysis = ClothesImageAnalysis(**contents)
     return clothes_image_analysis
\ No newline at end of file
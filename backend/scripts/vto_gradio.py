@@ -1,7 +1,7 @@
+import asyncio
 import gradio as gr
-import io
-from PIL import Image
 from core.vto_service.gemini_handler import GeminiProcesser
+from core.vto_service.image_executor import decode_image, run_image_op
 from core.litellm_hander.schema import ModelOptions, ClothesOptions, StyleCutOptions
 from prompts.vto_model_prompts import assemble_model_prompt
 from prompts.vto_prompts import assemble_prompt
@@ -41,11 +41,10 @@ async def process_inputs(text_input, image1, image2, image3, temperature, top_p,
     # response를 bytes 리스트로 가져오기
     response = result.get("response", [])
     
-    # bytes 데이터를 PIL Image로 변환
-    pil_images = []
-    for img_bytes in response:
-        if img_bytes is not None:
-            pil_images.append(Image.open(io.BytesIO(img_bytes)))
+    # bytes 데이터를 PIL Image로 변환 (이미지 작업 풀에서 병렬 디코딩)
+    pil_images = list(await asyncio.gather(*[
+        run_image_op(decode_image, img_bytes) for img_bytes in response if img_bytes is not None
+    ]))
     
     # usage 정보 포맷팅
     usage = result.get("usage")
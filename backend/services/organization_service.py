@@ -3,6 +3,7 @@ from uuid import UUID
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from models.organization import Organization
 from core.exceptions import NotFoundException
 
@@ -18,23 +19,20 @@ async def get_or_create_organization(
     if not normalized:
         return None
 
+    # 조회/생성을 한 문장으로 처리 (동시 요청도 uq_organizations_name 충돌 시 기존 행 반환)
+    # 충돌 시 name을 같은 값으로 갱신해야 RETURNING으로 기존 행을 받을 수 있음 (행 잠금 + 새 행 버전 1개)
     result = await db.execute(
-        select(Organization).where(
-            Organization.name == normalized,
-            Organization.deleted_at.is_(None)
+        insert(Organization)
+        .values(id=uuid.uuid4(), name=normalized)
+        .on_conflict_do_update(
+            index_elements=[Organization.name],
+            index_where=Organization.deleted_at.is_(None),
+            set_={"name": normalized},
         )
+        .returning(Organization)
+        .execution_options(populate_existing=True)
     )
-    organization = result.scalar_one_or_none()
-    if organization:
-        return organization
-
-    organization = Organization(name=normalized)
-    if getattr(organization, "id", None) is None:
-        organization.id = uuid.uuid4()
-    db.add(organization)
-    await db.flush()
-
-    return organization
+    return result.scalar_one()
 
 
 async def get_organization_by_id(
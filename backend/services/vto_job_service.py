@@ -0,0 +1,322 @@
+import asyncio
+import base64
+import os
+import socket
+from contextlib import aclosing
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import select, update, case, func
+from db.session import AsyncSessionLocal
+from models.vto_job import VtoJob
+from models.project import Project
+from configs import settings
+from custom_logger import get_logger
+from core.vto_service.gemini_handler import GeminiProcesser
+
+logger = get_logger(__name__)
+
+JOB_STATUS_PENDING = "PENDING"
+JOB_STATUS_RUNNING = "RUNNING"
+JOB_STATUS_SUCCEEDED = "SUCCEEDED"
+JOB_STATUS_FAILED = "FAILED"
+FINISHED_JOB_STATUSES = {JOB_STATUS_SUCCEEDED, JOB_STATUS_FAILED}
+
+
+async def requeue_stale_jobs(db, stale_seconds: float, max_attempts: int) -> None:
+    """
+    워커가 죽어 RUNNING으로 남은 작업을 대기열로 되돌림
+    (최대 시도 횟수를 넘긴 작업은 FAILED 처리)
+
+    - 처리 중인 워커는 하트비트로 updated_at을 계속 갱신하므로
+      오래 걸리는 작업이 아니라 updated_at이 stale_seconds 동안 멈춘 작업만 대상
+    """
+    stale_before = datetime.now(timezone.utc) - timedelta(seconds=stale_seconds)
+    await db.execute(
+        update(VtoJob)
+        .where(
+            VtoJob.status == JOB_STATUS_RUNNING,
+            func.coalesce(VtoJob.updated_at, VtoJob.started_at) < stale_before,
+        )
+        .values(
+            status=case((VtoJob.attempts >= max_attempts, JOB_STATUS_FAILED), else_=JOB_STATUS_PENDING),
+            fail_reason=case((VtoJob.attempts >= max_attempts, "Worker timed out"), else_=None),
+            finished_at=case((VtoJob.attempts >= max_attempts, datetime.now(timezone.utc)), else_=None),
+        )
+    )
+
+
+async def claim_next_job(worker_name: str) -> Optional[VtoJob]:
+    """
+    대기 중인 작업 1개를 SELECT ... FOR UPDATE SKIP LOCKED로 선점
+    (여러 워커/프로세스가 같은 작업을 중복 처리하지 않음)
+    """
+    async with AsyncSessionLocal() as db:
+        await requeue_stale_jobs(db, settings.vto_job_stale_seconds, settings.vto_job_max_attempts)
+        result = await db.execute(
+            select(VtoJob)
+            .where(VtoJob.status == JOB_STATUS_PENDING)
+            .order_by(VtoJob.queued_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        job = result.scalar_one_or_none()
+        if job is None:
+            await db.commit()
+            return None
+
+        job.status = JOB_STATUS_RUNNING
+        job.worker = worker_name
+        job.attempts = (job.attempts or 0) + 1
+        job.started_at = datetime.now(timezone.utc)
+        job.completed_count = 0
+        job.success_count = 0
+        job.result_images = None
+        job.usage = None
+        await db.commit()
+        return job
+
+
+def _owned_job_update(job: VtoJob):
+    """
+    선점한 워커/시도 회차가 그대로인 RUNNING 작업에만 적용되는 UPDATE
+    (stale 처리 후 다른 워커가 다시 선점한 작업을 이전 워커가 덮어쓰지 않도록 함)
+    """
+    return update(VtoJob).where(
+        VtoJob.id == job.id,
+        VtoJob.worker == job.worker,
+        VtoJob.attempts == job.attempts,
+        VtoJob.status == JOB_STATUS_RUNNING,
+    )
+
+
+async def _update_job(job: VtoJob, **values) -> bool:
+    """
+    작업 진행 상황/상태 갱신 (updated_at도 함께 갱신되어 하트비트 역할)
+
+    Returns:
+        bool: 갱신 여부 (False면 작업 소유권을 잃음)
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(_owned_job_update(job).values(**values))
+        await db.commit()
+        return result.rowcount > 0
+
+
+async def _heartbeat(job: VtoJob, interval: float) -> None:
+    """
+    샘플 완료 사이가 길어도 stale로 판단되지 않도록 updated_at을 주기적으로 갱신
+    (소유권을 잃으면 종료)
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if not await _update_job(job, updated_at=func.now()):
+                return
+        except Exception as e:
+            logger.warning(f"VTO job {job.id} heartbeat failed: {e}")
+
+
+async def _finish_job(job: VtoJob, success_count: int, **values) -> bool:
+    """
+    최종 상태 기록 + 프로젝트 생성 이미지 수 반영 (한 트랜잭션)
+    - 최종 상태 UPDATE가 반영되지 않았으면(소유권 상실) 프로젝트 카운터도 올리지 않음
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(_owned_job_update(job).values(**values))
+        if result.rowcount == 0:
+            await db.rollback()
+            return False
+        if job.project_id is not None and success_count > 0:
+            await db.execute(
+                update(Project)
+                .where(Project.id == job.project_id)
+                .values(total_image_number=func.coalesce(Project.total_image_number, 0) + success_count)
+            )
+        await db.commit()
+        return True
+
+
+async def process_job(job: VtoJob, processer: Optional[GeminiProcesser] = None) -> None:
+    """
+    작업 1개 실행: 샘플이 끝날 때마다 진행 상황을 기록하고 결과/비용을 작업과 프로젝트에 반영
+    """
+    processer = processer or GeminiProcesser(verbose=False)
+    heartbeat = asyncio.create_task(_heartbeat(job, settings.vto_job_heartbeat_seconds))
+    try:
+        image_contents = [
+            await processer.create_image_content(base64.b64decode(image)) for image in job.input_images
+        ]
+        contents = [job.prompt] + image_contents
+
+        # 샘플이 끝날 때마다 부분 결과/누적 비용을 기록 (상태 조회·SSE에서 바로 확인 가능)
+        result_images: List[Optional[str]] = [None] * job.image_count
+        usage_data_list = []
+        completed_count = success_count = 0
+        async with aclosing(
+            processer.stream_image_inference(
+                contents, job.image_count, job.temperature, job.top_p, job.aspect_ratio,
+                caller_id=str(job.user_id),  # 같은 사용자의 작업끼리 공정 큐잉 단위를 공유
+            )
+        ) as results:
+            async for result in results:
+                completed_count += 1
+                if result["image"] is not None:
+                    success_count += 1
+                    result_images[result["index"]] = base64.b64encode(result["image"]).decode("ascii")
+                if result["usage"] is not None:
+                    usage_data_list.append(result["usage"])
+
+                values = {"completed_count": completed_count, "success_count": success_count}
+                if result["image"] is not None:
+                    values["result_images"] = result_images
+                if usage_data_list:
+                    values["usage"] = (await processer.sum_usage_data(usage_data_list)).model_dump()
+                if not await _update_job(job, **values):
+                    # 다른 워커가 다시 선점했거나 stale 처리됨 → 남은 샘플은 취소
+                    logger.warning(f"VTO job {job.id} lost ownership ({job.worker}, attempt {job.attempts})")
+                    return
+
+        total_usage = (
+            await processer.sum_usage_data(usage_data_list) if usage_data_list
+            else await processer.calculate_vto_cost(None)
+        )
+        finished = await _finish_job(
+            job,
+            success_count,
+            status=JOB_STATUS_SUCCEEDED if success_count > 0 else JOB_STATUS_FAILED,
+            result_images=result_images,
+            usage=total_usage.model_dump(),
+            fail_reason=None if success_count > 0 else "All samples failed",
+            finished_at=datetime.now(timezone.utc),
+        )
+        if not finished:
+            logger.warning(f"VTO job {job.id} lost ownership before finishing ({job.worker}, attempt {job.attempts})")
+            return
+        logger.info(f"VTO job {job.id} finished: {success_count}/{job.image_count} images")
+    except Exception as e:
+        logger.exception(f"VTO job {job.id} failed: {e}")
+        try:
+            await _update_job(
+                job,
+                status=JOB_STATUS_FAILED,
+                fail_reason=str(e)[:1000],
+                finished_at=datetime.now(timezone.utc),
+            )
+        except Exception as update_error:
+            # 기록하지 못한 작업은 하트비트가 끊겨 stale 처리 후 재시도됨
+            logger.warning(f"VTO job {job.id} failed to record failure: {update_error}")
+    finally:
+        heartbeat.cancel()
+
+
+
+async def _load_job_progress(job_id: UUID) -> Tuple[Optional[str], int]:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(VtoJob.status, VtoJob.completed_count).where(VtoJob.id == job_id)
+        )
+        row = result.one_or_none()
+        return (row.status, row.completed_count) if row else (None, 0)
+
+
+async def _load_job(job_id: UUID) -> Optional[VtoJob]:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(VtoJob).where(VtoJob.id == job_id))
+        return result.scalar_one_or_none()
+
+
+async def watch_job(job: VtoJob, poll_interval: float = 1.0) -> AsyncIterator[Tuple[str, Dict]]:
+    """
+    작업의 부분 결과를 이벤트로 반환하는 async generator (SSE 엔드포인트용)
+
+    - 워커가 다른 프로세스에 있어도 동작하도록 DB를 폴링
+    - 진행 컬럼만 가볍게 조회하고, 변경이 있을 때만 결과 이미지를 다시 읽음
+
+    Yields:
+        Tuple[str, Dict]: (이벤트 이름, 데이터) - image / progress / done
+    """
+    sent_indexes = set()
+    while True:
+        for index, image in enumerate(job.result_images or []):
+            if image is not None and index not in sent_indexes:
+                sent_indexes.add(index)
+                yield "image", {"index": index, "image": image}
+        yield "progress", {
+            "status": job.status,
+            "completed_count": job.completed_count,
+            "success_count": job.success_count,
+            "image_count": job.image_count,
+            "usage": job.usage,
+        }
+        if job.status in FINISHED_JOB_STATUSES:
+            yield "done", {"status": job.status, "fail_reason": job.fail_reason, "usage": job.usage}
+            return
+
+        # 진행 상황이 바뀔 때까지 대기
+        while True:
+            await asyncio.sleep(poll_interval)
+            status, completed_count = await _load_job_progress(job.id)
+            if status is None:
+                return
+            if status != job.status or completed_count != job.completed_count:
+                break
+        job = await _load_job(job.id)
+        if job is None:
+            return
+
+
+class VtoJobWorkerPool:
+    """
+    vto_jobs 대기열을 비우는 asyncio 워커 풀
+
+    - 워커마다 SKIP LOCKED로 작업을 선점하므로 여러 API 프로세스에서 동시에 실행 가능
+    - Gemini 동시 요청 수는 전역 승인 컨트롤러가 제한하므로 워커 수는 동시 작업 수만 결정
+    """
+
+    def __init__(self, worker_count: int = 2, poll_interval: float = 1.0):
+        self.worker_count = worker_count
+        self.poll_interval = poll_interval
+        self._stopping = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+        self._name_prefix = f"{socket.gethostname()}:{os.getpid()}"
+
+    async def _run(self, worker_name: str) -> None:
+        processer = GeminiProcesser(verbose=False)
+        while not self._stopping.is_set():
+            try:
+                job = await claim_next_job(worker_name)
+            except Exception as e:
+                logger.warning(f"{worker_name} failed to claim job: {e}")
+                job = None
+
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                await process_job(job, processer)
+            except Exception as e:
+                logger.exception(f"{worker_name} failed to process job {job.id}: {e}")
+
+    def start(self) -> None:
+        self._stopping.clear()
+        self._tasks = [
+            asyncio.create_task(self._run(f"{self._name_prefix}:{idx}"))
+            for idx in range(self.worker_count)
+        ]
+        logger.info(f"VTO job worker pool started ({self.worker_count} workers)")
+
+    async def stop(self) -> None:
+        """
+        워커 종료 (진행 중인 작업은 취소되며 stale 처리 후 다른 워커가 다시 실행)
+        """
+        self._stopping.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("VTO job worker pool stopped")
@@ -0,0 +1,104 @@
+"""
+Admin API 테스트
+- DB 연결 없이 동작 (관리자 여부는 사용자 행 기준, 풀 지표는 Mock 커넥션으로 확인)
+"""
+import pytest
+from datetime import datetime
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+from fast_api import app
+from core.deps import get_current_user
+from core.security import create_access_token
+from core.user_cache import get_user_cache
+from db.pool_metrics import InstrumentedAsyncQueuePool, pool_wait_tracker
+from db.session import get_db
+from models.user import User
+
+USER_ID = UUID("123e4567-e89b-12d3-a456-426614174000")
+
+
+def _user(user_type):
+    return User(
+        id=USER_ID,
+        email="admin@example.com",
+        name="Admin",
+        language="ko",
+        user_type=user_type,
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow(),
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_overrides():
+    yield
+    app.dependency_overrides.clear()
+
+
+client = TestClient(app)
+
+
+def test_get_db_pool_stats():
+    """GET /api/v1/admin/db-pool - 관리자 커넥션 풀 지표 조회"""
+    app.dependency_overrides[get_current_user] = lambda: _user("admin")
+
+    response = client.get("/api/v1/admin/db-pool")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["checked_out"] == 0
+    assert {"pool_size", "overflow", "wait_p95_ms", "checkout_timeouts"} <= data.keys()
+
+
+def test_get_db_pool_stats_forbidden():
+    """GET /api/v1/admin/db-pool - 관리자가 아니면 403"""
+    app.dependency_overrides[get_current_user] = lambda: _user("user")
+
+    response = client.get("/api/v1/admin/db-pool")
+
+    assert response.status_code == 403
+
+
+def test_get_db_pool_stats_ignores_admin_claim():
+    """GET /api/v1/admin/db-pool - 토큰 claim이 admin이어도 사용자 행의 권한이 회수됐으면 403"""
+    get_user_cache().clear()
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = _user("user")
+    mock_db = MagicMock()
+    mock_db.execute = AsyncMock(return_value=result)
+
+    async def _get_db_override():
+        yield mock_db
+
+    app.dependency_overrides[get_db] = _get_db_override
+    token = create_access_token(data={"sub": str(USER_ID), "user_type": "admin"})
+
+    response = client.get("/api/v1/admin/db-pool", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 403
+    mock_db.execute.assert_awaited_once()
+    get_user_cache().clear()
+
+
+async def test_pool_records_wait_and_timeout():
+    """InstrumentedAsyncQueuePool - 체크아웃 수/타임아웃/최대 동시 사용 수 기록"""
+    pool_wait_tracker.reset()
+    pool = InstrumentedAsyncQueuePool(creator=MagicMock, pool_size=1, max_overflow=0, timeout=0.05)
+
+    def checkout_twice():
+        connection = pool.connect()
+        with pytest.raises(exc.TimeoutError):
+            pool.connect()
+        connection.close()
+        pool.connect().close()
+
+    await greenlet_spawn(checkout_twice)
+
+    assert pool_wait_tracker.checkouts == 2
+    assert pool_wait_tracker.timeouts == 1
+    assert pool_wait_tracker.peak_checked_out == 1
+    assert pool_wait_tracker.max_wait >= 0.05
+    pool_wait_tracker.reset()
@@ -0,0 +1,55 @@
+"""
+AdmissionController 테스트
+- 엔드포인트가 아닌 Gemini 요청 승인 컨트롤러 테스트 (네트워크 호출 없음)
+- 헤지 요청 시점은 가짜 aio_client로 확인
+"""
+import asyncio
+from types import SimpleNamespace
+from core.vto_service import gemini_handler
+from core.vto_service.admission import AdmissionController
+
+
+async def test_queued_waiter_granted_after_rpm_window():
+    """슬롯 대기 중 RPM 예산이 소진돼도 창이 지나면 재배분 타이머로 승인"""
+    controller = AdmissionController(max_in_flight=1, default_requests_per_minute=1)
+    controller.WINDOW_SECONDS = 0.2
+
+    await controller.acquire("gemini", caller="a")
+    second = asyncio.create_task(controller.acquire("gemini", caller="b"))
+    await asyncio.sleep(0.01)
+    assert not second.done()
+
+    # 슬롯 반환 시점에는 RPM 예산이 없어 보류 → 창이 지난 뒤 승인되어야 함
+    controller._release()
+    await asyncio.wait_for(second, timeout=2)
+    assert controller.metrics().admitted_total == 2
+    controller._release()
+
+
+async def test_hedge_clock_starts_after_admission(monkeypatch):
+    """_generate_content_hedged - 승인 대기 시간은 헤지 지연에 포함하지 않음 (대기열에서 헤지하지 않음)"""
+    controller = AdmissionController(max_in_flight=1)
+    monkeypatch.setattr(gemini_handler, "get_admission_controller", lambda: controller)
+    monkeypatch.setattr(gemini_handler, "get_hedge_delay", lambda: 0.1)
+
+    calls = []
+
+    async def generate_content(model, contents, config):
+        calls.append(model)
+        await asyncio.sleep(0.05)
+        return SimpleNamespace(usage_metadata=SimpleNamespace(prompt_token_count=10))
+
+    class FakeProcesser(gemini_handler.GeminiProcesser):
+        aio_client = SimpleNamespace(models=SimpleNamespace(generate_content=generate_content))
+
+    processer = FakeProcesser(verbose=False)
+
+    # 다른 요청이 슬롯을 헤지 지연보다 오래 점유
+    await controller.acquire(processer.MODEL_NAME, caller="other")
+    request = asyncio.create_task(processer._generate_content_hedged(["prompt"], None, "caller", None))
+    await asyncio.sleep(0.3)
+    controller._release()
+
+    _, hedge_usages = await asyncio.wait_for(request, timeout=2)
+    assert hedge_usages == []
+    assert len(calls) == 1
@@ -0,0 +1,89 @@
+"""
+ClothesAnalysisCache 테스트
+- 엔드포인트가 아닌 의류 분석 결과 캐시 테스트 (임시 SQLite, 네트워크 호출 없음)
+- 배치 분석 사용량 합산은 가짜 LLM 핸들러로 확인
+"""
+import io
+import pytest
+from types import SimpleNamespace
+from PIL import Image, ImageDraw
+from core.litellm_hander.analysis_cache import ClothesAnalysisCache, perceptual_hash
+from core.litellm_hander.schema import ClothesImageAnalysis, LiteLLMUsageData
+from core.vto_service.service import analyze_clothes_images, sum_clothes_analysis_usage
+
+
+def _garment(color, size=256, quality=95):
+    """흰 배경에 같은 모양(티셔츠 실루엣)을 color로 그린 JPEG"""
+    image = Image.new("RGB", (size, size), "white")
+    draw = ImageDraw.Draw(image)
+    scale = size / 256
+    draw.polygon(
+        [(p[0] * scale, p[1] * scale) for p in [(60, 40), (196, 40), (236, 100), (196, 110), (196, 230), (60, 230), (60, 110), (20, 100)]],
+        fill=color,
+    )
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+def _analysis(color_desc):
+    return ClothesImageAnalysis(
+        clothes_type="t-shirt", fit_desc="regular", design_desc="crew neck", material_desc="cotton",
+        color_desc=color_desc, style_desc="casual", overall_desc="basic tee",
+    )
+
+
+async def test_near_duplicate_requires_matching_color(tmp_path):
+    """같은 디자인의 다른 색상은 dHash가 같아도 근접 중복으로 보지 않고, 재인코딩/리사이즈는 적중"""
+    cache = ClothesAnalysisCache(str(tmp_path / "analysis.sqlite3"), max_distance=4)
+    red, blue = _garment((200, 30, 30)), _garment((30, 30, 200))
+    assert bin(perceptual_hash(red) ^ perceptual_hash(blue)).count("1") <= 4
+
+    await cache.set(red, "v1", _analysis("red"))
+
+    assert await cache.get(blue, "v1") is None
+    hit = await cache.get(_garment((200, 30, 30), size=200, quality=70), "v1")
+    assert hit is not None and hit.color_desc == "red"
+
+
+def test_invalid_max_distance_raises(tmp_path):
+    """max_distance가 밴드 수 이상이면 ValueError"""
+    with pytest.raises(ValueError):
+        ClothesAnalysisCache(str(tmp_path / "analysis.sqlite3"), max_distance=8)
+
+
+class _FakeLLMHandler:
+    """analyze_clothes_image 호출마다 응답과 고정 비용을 함께 반환하는 핸들러 (usage_data 없음)"""
+
+    async def convert_litellm_image_object(self, image_bytes=None, **kwargs):
+        if image_bytes == b"broken":
+            raise ValueError("broken image")
+        return {"type": "image_url", "image_url": {"url": "data:image/jpeg;base64,"}}
+
+    async def analyze_clothes_image(self, image_content):
+        usage = LiteLLMUsageData(
+            total_token_count=150, prompt_token_count=100, candidates_token_count=50,
+            output_token_count=50, cached_content_token_count=80, model_name="fake",
+            cost_usd=0.001, cost_krw=1.5, task_name="analyze_clothes_image",
+        )
+        message = SimpleNamespace(content=_analysis("red").model_dump_json())
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)]), usage
+
+
+async def test_batch_usage_is_summed():
+    """analyze_clothes_images - 항목별 usage 기록, sum_clothes_analysis_usage로 배치 합계 (실패 항목 제외)"""
+    items = [
+        item
+        async for item in analyze_clothes_images(
+            [_garment((200, 30, 30)), b"broken", _garment((30, 30, 200))],
+            use_cache=False,
+            llm_handler=_FakeLLMHandler(),
+        )
+    ]
+
+    assert sorted(item.usage is not None for item in items) == [False, True, True]
+    total = sum_clothes_analysis_usage(items)
+    assert total.total_token_count == 300
+    assert total.cached_content_token_count == 160
+    assert total.cost_krw == 3.0
+    assert sum_clothes_analysis_usage([item for item in items if item.error]) is None
@@ -50,6 +50,25 @@ client = TestClient(app)
 
 def test_signup():
     """POST /api/v1/auth/signup - 회원가입"""
+    created_user = User(
+        id=UUID("123e4567-e89b-12d3-a456-426614174000"),
+        email="newtest@example.com",
+        name="John",
+        user_type="user",
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+
+    async def get_signup_db():
+        mock_db = AsyncMock()
+        # INSERT ... ON CONFLICT DO NOTHING RETURNING이 새 사용자를 반환
+        mock_db.execute = AsyncMock(return_value=MockResult(scalar=created_user))
+        mock_db.add = MagicMock()
+        mock_db.commit = AsyncMock()
+        yield mock_db
+
+    app.dependency_overrides[get_db] = get_signup_db
+
     response = client.post(
         "/api/v1/auth/signup",
         json={
@@ -117,17 +136,11 @@ def test_oauth_kakao():
 
 def test_signup_duplicate_email():
     """POST /api/v1/auth/signup - 이메일 중복 시 400"""
-    existing_user = User(
-        id=UUID("123e4567-e89b-12d3-a456-426614174111"),
-        email="newtest@example.com",
-        name="Existing",
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
-    )
 
     async def get_duplicate_db():
         mock_db = AsyncMock()
-        mock_db.execute = AsyncMock(return_value=MockResult(scalar=existing_user))
+        # users.email 유니크 제약 충돌로 RETURNING 행 없음
+        mock_db.execute = AsyncMock(return_value=MockResult(scalar=None))
         mock_db.add = MagicMock()
         mock_db.commit = AsyncMock()
         mock_db.flush = AsyncMock()
@@ -9,15 +9,17 @@ from uuid import UUID
 from datetime import datetime
 from fast_api import app
 from db.session import get_db
-from core.deps import get_current_user
+from core.deps import get_current_claims, get_current_user
+from schemas.auth import TokenClaims
 from models.user import User
 from models.collection import Collection
 
 
 class MockResult:
-    def __init__(self, scalar=None, items=None):
+    def __init__(self, scalar=None, items=None, rows=None):
         self._scalar = scalar
         self._items = items or []
+        self._rows = rows or []
 
     def scalar_one_or_none(self):
         return self._scalar
@@ -27,6 +29,11 @@ class MockResult:
         mock_scalars.all = MagicMock(return_value=self._items)
         return mock_scalars
 
+    def mappings(self):
+        mock_mappings = MagicMock()
+        mock_mappings.all = MagicMock(return_value=self._rows)
+        return mock_mappings
+
 
 @pytest.fixture
 def mock_db():
@@ -72,6 +79,7 @@ def setup_overrides(mock_db, mock_user):
 
     app.dependency_overrides[get_db] = _get_db_override
     app.dependency_overrides[get_current_user] = _get_user_override
+    app.dependency_overrides[get_current_claims] = lambda: TokenClaims(user_id=mock_user.id)
     yield
     app.dependency_overrides.clear()
 
@@ -79,8 +87,18 @@ def setup_overrides(mock_db, mock_user):
 client = TestClient(app)
 
 
-def test_create_collection():
+def test_create_collection(mock_db):
     """POST /api/v1/collections - 컬렉션 생성"""
+    created = Collection(
+        id=UUID("223e4567-e89b-12d3-a456-426614174000"),
+        user_id=UUID("123e4567-e89b-12d3-a456-426614174000"),
+        name="My Collection",
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+    # INSERT ... ON CONFLICT DO NOTHING RETURNING이 새 행을 반환
+    mock_db.execute.return_value = MockResult(scalar=created)
+
     response = client.post(
         "/api/v1/collections",
         json={"name": "My Collection"}
@@ -91,12 +109,14 @@ def test_create_collection():
     assert response.json()["name"] == "My Collection"
 
 
-def test_get_collections():
-    """GET /api/v1/collections - 컬렉션 목록 조회"""
+def test_get_collections(mock_db):
+    """GET /api/v1/collections - 컬렉션 목록 조회 (limit/cursor가 없으면 전체 목록)"""
     response = client.get("/api/v1/collections")
     
     assert response.status_code == 200
     assert isinstance(response.json(), list)
+    sql = str(mock_db.execute.await_args.args[0])
+    assert "LIMIT" not in sql
 
 
 def test_update_collection():
@@ -114,14 +134,8 @@ def test_update_collection():
 
 def test_create_collection_duplicate_name(mock_db):
     """POST /api/v1/collections - 중복 이름이면 400"""
-    existing = Collection(
-        id=UUID("323e4567-e89b-12d3-a456-426614174222"),
-        user_id=UUID("123e4567-e89b-12d3-a456-426614174000"),
-        name="My Collection",
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
-    )
-    mock_db.execute.return_value = MockResult(scalar=existing)
+    # 유니크 인덱스 충돌로 RETURNING 행 없음
+    mock_db.execute.return_value = MockResult(scalar=None)
 
     response = client.post(
         "/api/v1/collections",
@@ -129,3 +143,86 @@ def test_create_collection_duplicate_name(mock_db):
     )
 
     assert response.status_code == 400
+
+
+def _collection_rows(count):
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    return [
+        {
+            "id": UUID(f"00000000-0000-0000-0000-{index:012d}"),
+            "user_id": UUID("123e4567-e89b-12d3-a456-426614174000"),
+            "name": f"Collection {index}",
+            "created_at": base.replace(minute=59 - index),
+            "updated_at": base,
+        }
+        for index in range(count)
+    ]
+
+
+def test_get_collections_keyset_page(mock_db):
+    """GET /api/v1/collections?limit&fields - 요청 컬럼만 조회, 다음 페이지 커서는 헤더로"""
+    rows = _collection_rows(3)
+    mock_db.execute.return_value = MockResult(rows=rows)
+
+    response = client.get("/api/v1/collections?limit=2&fields=id,name")
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"id": str(row["id"]), "name": row["name"]} for row in rows[:2]
+    ]
+    sql = str(mock_db.execute.await_args.args[0])
+    assert "collections.user_id," not in sql and "collections.updated_at" not in sql
+    assert "LIMIT" in sql
+    # created_at이 NULL인 행은 커서로 표현할 수 없으므로 페이지 조회에서 제외
+    assert "collections.created_at IS NOT NULL" in sql
+
+    # 다음 페이지: 마지막 행 (created_at, id) 이후 조건 추가
+    next_cursor = response.headers["X-Next-Cursor"]
+    mock_db.execute.return_value = MockResult(rows=rows[2:])
+    response = client.get(f"/api/v1/collections?limit=2&fields=id,name&cursor={next_cursor}")
+
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()] == ["Collection 2"]
+    assert "X-Next-Cursor" not in response.headers
+    sql = str(mock_db.execute.await_args.args[0])
+    assert "(collections.created_at, collections.id) <" in sql
+
+
+def test_get_collections_etag_not_modified(mock_db):
+    """GET /api/v1/collections - If-None-Match가 현재 페이지 ETag와 같으면 304"""
+    mock_db.execute.return_value = MockResult(rows=_collection_rows(2))
+
+    response = client.get("/api/v1/collections")
+    etag = response.headers["ETag"]
+
+    response = client.get("/api/v1/collections", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    mock_db.execute.return_value = MockResult(rows=_collection_rows(1))
+    response = client.get("/api/v1/collections", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+def test_get_collections_invalid_params():
+    """GET /api/v1/collections - 모르는 필드/잘못된 커서는 400"""
+    assert client.get("/api/v1/collections?fields=id,password").status_code == 400
+    assert client.get("/api/v1/collections?cursor=not-a-cursor").status_code == 400
+
+
+def test_get_collections_claims_only(mock_db):
+    """GET /api/v1/collections - 읽기 전용 목록은 토큰 claims(user_id)만 사용 (사용자 SELECT 없음)"""
+    from core.security import create_access_token
+    from core.user_cache import get_user_cache
+
+    get_user_cache().clear()
+    del app.dependency_overrides[get_current_claims]
+    mock_db.execute.return_value = MockResult(rows=_collection_rows(1))
+    token = create_access_token(data={"sub": "123e4567-e89b-12d3-a456-426614174000"})
+
+    response = client.get("/api/v1/collections", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 200
+    mock_db.execute.assert_awaited_once()
+    sql = str(mock_db.execute.await_args.args[0])
+    assert "FROM collections" in sql and "users" not in sql
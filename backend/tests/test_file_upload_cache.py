@@ -0,0 +1,60 @@
+"""
+Gemini Files API 업로드 캐시 테스트
+- LocalStubBackend를 사용해 네트워크 없이 동작 확인
+"""
+import asyncio
+import time
+import pytest
+from google.genai import types
+from core.vto_service.file_upload_cache import FileUploadManager, LocalStubBackend
+
+
+IMAGE_BYTES = b"\xff\xd8\xff" + b"garment" * 1024
+
+
+@pytest.mark.asyncio
+async def test_substitute_uploads_once():
+    """같은 이미지는 한 번만 업로드하고 파일 참조로 대체"""
+    backend = LocalStubBackend()
+    manager = FileUploadManager(backend, min_bytes=1024)
+    contents = ["prompt", types.Part.from_bytes(data=IMAGE_BYTES, mime_type="image/jpeg")]
+
+    results = await asyncio.gather(*[manager.substitute(contents) for _ in range(5)])
+
+    assert backend.upload_count == 1
+    for substituted in results:
+        assert substituted[0] == "prompt"
+        assert substituted[1].file_data.file_uri in backend.files
+        assert substituted[1].file_data.mime_type == "image/jpeg"
+
+
+@pytest.mark.asyncio
+async def test_small_image_stays_inline():
+    """min_bytes보다 작은 이미지는 인라인 유지"""
+    backend = LocalStubBackend()
+    manager = FileUploadManager(backend, min_bytes=len(IMAGE_BYTES) + 1)
+    part = types.Part.from_bytes(data=IMAGE_BYTES, mime_type="image/jpeg")
+
+    substituted = await manager.substitute([part])
+
+    assert backend.upload_count == 0
+    assert substituted[0] is part
+
+
+@pytest.mark.asyncio
+async def test_expired_file_is_reuploaded():
+    """만료 임박/무효화된 파일 참조는 다시 업로드"""
+    backend = LocalStubBackend(ttl_seconds=10)
+    manager = FileUploadManager(backend, min_bytes=0, expiry_margin=60)
+
+    first = await manager.get_or_upload(IMAGE_BYTES, "image/jpeg")
+    second = await manager.get_or_upload(IMAGE_BYTES, "image/jpeg")
+    assert first.uri != second.uri
+    assert first.expires_at <= time.time() + 10
+
+    backend.ttl_seconds = 3600
+    third = await manager.get_or_upload(IMAGE_BYTES, "image/jpeg")
+    manager.invalidate(third.uri)
+    fourth = await manager.get_or_upload(IMAGE_BYTES, "image/jpeg")
+    assert backend.upload_count == 4
+    assert fourth.uri != third.uri
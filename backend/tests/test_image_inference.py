@@ -0,0 +1,55 @@
+"""
+이미지 추론 스트리밍 테스트
+- gemini_image_inference를 가짜 구현으로 대체하여 stream_image_inference / execute_image_inference를 끝까지 실행
+"""
+import asyncio
+from core.litellm_hander.schema import LiteLLMUsageData
+from core.vto_service.gemini_handler import GeminiProcesser
+
+
+def make_usage() -> LiteLLMUsageData:
+    return LiteLLMUsageData(
+        total_token_count=10, prompt_token_count=10, candidates_token_count=0,
+        output_token_count=0, model_name="mock", cost_usd=0.01, cost_krw=10,
+    )
+
+
+class FakeProcesser(GeminiProcesser):
+    """샘플 순서와 반대로 끝나며, 마지막 샘플은 실패(None)"""
+
+    def __init__(self, image_count: int):
+        super().__init__(verbose=False)
+        self.image_count = image_count
+        self.calls = 0
+
+    async def gemini_image_inference(self, contents, temperature=1.0, top_p=0.95, aspect_ratio="1:1",
+                                     caller_id=None, deadline=None):
+        index = self.calls
+        self.calls += 1
+        await asyncio.sleep(0.01 * (self.image_count - index))
+        if index == self.image_count - 1:
+            return None, None
+        return f"image-{index}".encode(), make_usage()
+
+
+async def test_stream_image_inference_yields_in_completion_order():
+    """stream_image_inference - 끝난 순서대로 반환하고 generator 종료까지 정상 동작"""
+    processer = FakeProcesser(image_count=3)
+
+    results = [result async for result in processer.stream_image_inference(["prompt"], 3, 1.0)]
+
+    assert [result["index"] for result in results] == [2, 1, 0]
+    assert results[0]["image"] is None and results[0]["usage"] is None
+    assert not any(result["cache_hit"] for result in results)
+
+
+async def test_execute_image_inference_collects_results():
+    """execute_image_inference - 샘플 인덱스 순서로 정렬하고 성공 샘플 비용만 합산"""
+    processer = FakeProcesser(image_count=3)
+
+    result = await processer.execute_image_inference(["prompt"], 3, 1.0)
+
+    assert result["response"] == [b"image-0", b"image-1", None]
+    assert result["debug_info"]["success_count"] == 2
+    assert result["debug_info"]["fail_count"] == 1
+    assert result["usage"].cost_usd == 0.02
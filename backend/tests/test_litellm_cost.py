@@ -0,0 +1,55 @@
+"""
+LiteLLMHandler.calculate_cost 테스트
+- 엔드포인트가 아닌 비용 계산 테스트 (가짜 응답, 네트워크 호출 없음)
+"""
+from types import SimpleNamespace
+import pytest
+from core.litellm_hander.process import LiteLLMHandler
+
+MODEL_NAME = "gemini/gemini-2.5-flash"
+
+
+def _usage(cached_tokens):
+    return SimpleNamespace(
+        total_tokens=1_500_000,
+        prompt_tokens=1_000_000,
+        completion_tokens=500_000,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=cached_tokens),
+        completion_tokens_details=SimpleNamespace(reasoning_tokens=100),
+    )
+
+
+def test_cached_tokens_use_discounted_price():
+    """캐시 적중 입력 토큰은 cached_input 가격, 나머지 입력은 input 가격으로 계산"""
+    handler = LiteLLMHandler(router=object())
+    pricing = handler._get_model_pricing(MODEL_NAME)
+
+    usage = handler.calculate_cost(SimpleNamespace(usage=_usage(800_000)), MODEL_NAME, "analyze_clothes_image")
+
+    expected_usd = 0.2 * pricing["input"] + 0.8 * pricing["cached_input"] + 0.5 * pricing["output"]
+    assert usage.cached_content_token_count == 800_000
+    assert usage.thoughts_token_count == 100
+    assert usage.cost_usd == pytest.approx(expected_usd)
+    assert usage.cost_usd < handler.calculate_cost(
+        SimpleNamespace(usage=_usage(None)), MODEL_NAME, "analyze_clothes_image"
+    ).cost_usd
+
+
+def test_dict_response_reads_cached_tokens():
+    """딕셔너리 응답도 prompt_tokens_details.cached_tokens를 동일하게 반영"""
+    handler = LiteLLMHandler(router=object())
+    response = {
+        "usage": {
+            "total_tokens": 1_500_000,
+            "prompt_tokens": 1_000_000,
+            "completion_tokens": 500_000,
+            "prompt_tokens_details": {"cached_tokens": 800_000},
+        }
+    }
+
+    usage = handler.calculate_cost(response, MODEL_NAME, "analyze_clothes_image")
+
+    assert usage.cached_content_token_count == 800_000
+    assert usage.cost_usd == handler.calculate_cost(
+        SimpleNamespace(usage=_usage(800_000)), MODEL_NAME, "analyze_clothes_image"
+    ).cost_usd
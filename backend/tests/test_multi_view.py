@@ -0,0 +1,94 @@
+"""
+멀티뷰 생성 파이프라인 테스트
+- Gemini/LiteLLM 호출은 가짜 구현으로 대체하여 단계 실행 순서와 사용량 집계만 확인
+"""
+import asyncio
+import io
+import json
+from types import SimpleNamespace
+import pytest
+from PIL import Image
+from core.litellm_hander.schema import LiteLLMUsageData, ModelOptions
+from core.vto_service import multi_view
+
+
+def make_png(color) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (32, 32), color).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def make_usage(cached_content_token_count: int = 0, thoughts_token_count: int = 0) -> LiteLLMUsageData:
+    return LiteLLMUsageData(
+        total_token_count=10, prompt_token_count=10, candidates_token_count=0,
+        output_token_count=0, model_name="mock", cost_usd=0.01, cost_krw=10,
+        cached_content_token_count=cached_content_token_count, thoughts_token_count=thoughts_token_count,
+    )
+
+
+@pytest.fixture
+def mock_pipeline(monkeypatch):
+    """정면 후보는 0.05초 간격으로 완성, 두 번째 후보만 검수 통과"""
+    events = []
+
+    class MockProcesser(multi_view.GeminiProcesser):
+        async def stream_image_inference(self, contents_list, image_count, *args, **kwargs):
+            for index in range(image_count):
+                await asyncio.sleep(0.05)
+                events.append(f"front:{index}")
+                yield {"index": index, "image": make_png((index, 0, 0)), "usage": make_usage(), "cache_hit": False}
+
+        async def execute_image_inference(self, contents_list, image_count, *args, **kwargs):
+            events.append(contents_list[0])
+            return {
+                "response": [make_png((255, 255, 255))] * image_count,
+                "usage": make_usage(),
+                "debug_info": {"success_count": image_count},
+            }
+
+    class MockHandler(multi_view.LiteLLMHandler):
+        async def valid_generated_vto(self, original_image, generated_image):
+            self.usage_data.append(make_usage(cached_content_token_count=4, thoughts_token_count=2))
+            result = "pass" if len(self.usage_data) == 2 else "fail"
+            content = json.dumps({"result": result, "detections": []})
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    monkeypatch.setattr(multi_view, "GeminiProcesser", MockProcesser)
+    monkeypatch.setattr(multi_view, "LiteLLMHandler", MockHandler)
+    monkeypatch.setattr(multi_view, "side_view_prompt", lambda side, gender: side)
+    monkeypatch.setattr(multi_view, "assemble_model_prompt", lambda **kwargs: "front")
+    return events
+
+
+@pytest.mark.asyncio
+async def test_views_start_after_first_passed_candidate(mock_pipeline):
+    """검수를 통과한 후보가 나오면 나머지 정면 생성이 끝나기 전에 측면/후면 생성 시작"""
+    result = await multi_view.generate_multi_view(
+        ModelOptions(gender="female"), None, [make_png((1, 1, 1))], image_count=3
+    )
+
+    assert result["selected_index"] == 1
+    assert mock_pipeline.index("left") < mock_pipeline.index("front:2")
+    assert len(result["back"]["response"]) == 1
+
+    stages = {stage.stage: stage for stage in result["stages"]}
+    assert set(stages) == {"prepare", "front", "selection", "left", "right", "back"}
+    assert stages["front"].success_count == 3
+    # 정면 3 + 검수 3 + 측면/후면 3 (검수의 캐시/사고 토큰도 합계에 포함)
+    assert result["usage"].total.cost_usd == pytest.approx(0.09)
+    assert result["usage"].total.total_token_count == 90
+    assert result["usage"].total.cached_content_token_count == 12
+    assert result["usage"].total.thoughts_token_count == 6
+
+
+@pytest.mark.asyncio
+async def test_without_validation_uses_first_candidate(mock_pipeline):
+    """검수를 끄면 가장 먼저 완성된 정면 이미지 사용"""
+    result = await multi_view.generate_multi_view(
+        ModelOptions(gender="male"), None, [make_png((1, 1, 1))],
+        image_count=2, views=("back",), use_validation=False,
+    )
+
+    assert result["selected_index"] == 0
+    assert "left" not in result
+    assert result["usage"].total.cost_usd == pytest.approx(0.03)
@@ -9,14 +9,16 @@ from uuid import UUID
 from datetime import datetime
 from fast_api import app
 from db.session import get_db
-from core.deps import get_current_user
+from core.deps import get_current_claims, get_current_user
+from schemas.auth import TokenClaims
 from models.organization import Organization
 
 
 class MockResult:
-    def __init__(self, scalar=None, items=None):
+    def __init__(self, scalar=None, items=None, rows=None):
         self._scalar = scalar
         self._items = items or []
+        self._rows = rows or []
 
     def scalar_one_or_none(self):
         return self._scalar
@@ -26,6 +28,11 @@ class MockResult:
         mock_scalars.all = MagicMock(return_value=self._items)
         return mock_scalars
 
+    def mappings(self):
+        mock_mappings = MagicMock()
+        mock_mappings.all = MagicMock(return_value=self._rows)
+        return mock_mappings
+
 
 @pytest.fixture
 def mock_db():
@@ -51,6 +58,7 @@ def setup_overrides(mock_db):
 
     app.dependency_overrides[get_db] = _get_db_override
     app.dependency_overrides[get_current_user] = mock_user
+    app.dependency_overrides[get_current_claims] = lambda: TokenClaims(user_id=mock_user().id)
     yield
     app.dependency_overrides.clear()
 
@@ -60,16 +68,14 @@ client = TestClient(app)
 
 def test_create_organization(mock_db):
     """POST /api/v1/organizations - 조직 생성"""
-    # 중복 체크 시 기존 조직이 없음 (None 반환)
-    mock_db.execute.return_value = MockResult(scalar=None)
-
-    def refresh_side_effect(obj):
-        obj.id = UUID("123e4567-e89b-12d3-a456-426614174111")
-        obj.name = "Buzzni"
-        obj.created_at = datetime.utcnow()
-        obj.updated_at = datetime.utcnow()
-
-    mock_db.refresh.side_effect = refresh_side_effect
+    # INSERT ... ON CONFLICT DO NOTHING RETURNING이 새 행을 반환
+    created = Organization(
+        id=UUID("123e4567-e89b-12d3-a456-426614174111"),
+        name="Buzzni",
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow(),
+    )
+    mock_db.execute.return_value = MockResult(scalar=created)
 
     response = client.post("/api/v1/organizations", json={"name": "Buzzni"})
 
@@ -81,13 +87,13 @@ def test_create_organization(mock_db):
 
 def test_list_organizations(mock_db):
     """GET /api/v1/organizations - 조직 목록"""
-    organization = Organization(
-        id=UUID("123e4567-e89b-12d3-a456-426614174111"),
-        name="Buzzni",
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
-    )
-    mock_db.execute.return_value = MockResult(items=[organization])
+    row = {
+        "id": UUID("123e4567-e89b-12d3-a456-426614174111"),
+        "name": "Buzzni",
+        "created_at": datetime.utcnow(),
+        "updated_at": datetime.utcnow(),
+    }
+    mock_db.execute.return_value = MockResult(rows=[row])
 
     response = client.get("/api/v1/organizations")
 
@@ -134,13 +140,8 @@ def test_update_organization(mock_db):
 
 def test_create_organization_duplicate_name(mock_db):
     """POST /api/v1/organizations - 중복 이름이면 400"""
-    existing = Organization(
-        id=UUID("223e4567-e89b-12d3-a456-426614174222"),
-        name="Buzzni",
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
-    )
-    mock_db.execute.return_value = MockResult(scalar=existing)
+    # 유니크 인덱스 충돌로 RETURNING 행 없음
+    mock_db.execute.return_value = MockResult(scalar=None)
 
     response = client.post("/api/v1/organizations", json={"name": "Buzzni"})
 
@@ -163,3 +164,25 @@ def test_delete_organization(mock_db):
 
     assert response.status_code == 200
     assert response.json()["message"] == "Organization deleted"
+
+
+def test_update_organization_duplicate_name(mock_db):
+    """PATCH /api/v1/organizations/{id} - 다른 조직 이름으로 변경하면 400 (uq_organizations_name 충돌)"""
+    from sqlalchemy.exc import IntegrityError
+
+    organization = Organization(
+        id=UUID("123e4567-e89b-12d3-a456-426614174111"),
+        name="Buzzni",
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow(),
+    )
+    mock_db.execute.return_value = MockResult(scalar=organization)
+    mock_db.commit.side_effect = IntegrityError("UPDATE organizations", {}, Exception("duplicate key"))
+
+    response = client.patch(
+        "/api/v1/organizations/123e4567-e89b-12d3-a456-426614174111",
+        json={"name": "Existing"},
+    )
+
+    assert response.status_code == 400
+    mock_db.rollback.assert_awaited_once()
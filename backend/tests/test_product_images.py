@@ -0,0 +1,91 @@
+"""
+상품 이미지 배치 생성 테스트
+- GeminiProcesser를 가짜 구현으로 대체하여 generate_product_images / sum_product_image_usage 검증
+"""
+import asyncio
+import pytest
+from core.litellm_hander.schema import LiteLLMUsageData, ProductImageBatchItem
+from core.vto_service import service
+from core.vto_service.gemini_handler import GeminiProcesser
+
+
+def make_usage(cost_usd: float = 0.01, hedge_request_count: int = 0) -> LiteLLMUsageData:
+    return LiteLLMUsageData(
+        total_token_count=10, prompt_token_count=10, candidates_token_count=0,
+        output_token_count=0, model_name="mock", cost_usd=cost_usd, cost_krw=cost_usd * 1000,
+        hedge_request_count=hedge_request_count,
+    )
+
+
+class FakeProcesser(GeminiProcesser):
+    """호출별 입력을 기록하고, 입력 이미지 파트를 그대로 결과로 반환 (b"fail"이 포함되면 실패)"""
+
+    def __init__(self, verbose: bool = False):
+        super().__init__(verbose=verbose)
+        self.contents_calls = []
+
+    async def load_image_contents(self, images):
+        return [f"part:{image.decode()}" for image in images]
+
+    async def execute_image_inference(self, contents_list, image_count=1, temperature=1.0,
+                                      caller_id=None, use_cache=False, **kwargs):
+        self.contents_calls.append(contents_list)
+        if "part:fail" in contents_list:
+            raise RuntimeError("generation failed")
+        # 나중 입력이 먼저 끝나도록 지연
+        await asyncio.sleep(0.01 / len(self.contents_calls))
+        return {"response": [part.encode() for part in contents_list[1:]] + [None], "usage": make_usage(), "debug_info": {}}
+
+
+@pytest.fixture
+def fake_processer(monkeypatch):
+    processer = FakeProcesser()
+    monkeypatch.setattr(service, "GeminiProcesser", lambda verbose=False: processer)
+    return processer
+
+
+async def test_generate_product_images_keeps_inputs_per_garment(fake_processer):
+    """generate_product_images - 의류마다 자신의 입력 이미지만 전달"""
+    garments = [b"a", [b"b1", b"b2"], (b"c",)]
+
+    items = [item async for item in service.generate_product_images(garments, max_concurrency=2)]
+    items.sort(key=lambda item: item.index)
+
+    prompt = service.product_image_prompt(type="default")
+    assert sorted(map(tuple, fake_processer.contents_calls)) == sorted([
+        (prompt, "part:a"),
+        (prompt, "part:b1", "part:b2"),
+        (prompt, "part:c"),
+    ])
+    assert [item.images for item in items] == [[b"part:a"], [b"part:b1", b"part:b2"], [b"part:c"]]
+    assert all(item.error is None and item.usage is not None for item in items)
+
+
+async def test_generate_product_images_records_item_error(fake_processer):
+    """generate_product_images - 실패한 의류는 error에 기록하고 나머지는 계속 진행"""
+    items = [item async for item in service.generate_product_images([b"fail", b"ok"])]
+    items.sort(key=lambda item: item.index)
+
+    assert items[0].images == []
+    assert items[0].error == "RuntimeError: generation failed"
+    assert items[1].images == [b"part:ok"]
+    assert items[1].error is None
+
+
+async def test_sum_product_image_usage_does_not_mutate_items():
+    """sum_product_image_usage - 사용량 없는 항목은 건너뛰고 합산하며 항목별 usage는 변경하지 않음"""
+    items = [
+        ProductImageBatchItem(index=0, usage=make_usage(cost_usd=0.01, hedge_request_count=1)),
+        ProductImageBatchItem(index=1, error="RuntimeError: generation failed"),
+        ProductImageBatchItem(index=2, usage=make_usage(cost_usd=0.02)),
+    ]
+    before = [item.model_dump() for item in items]
+
+    total = await service.sum_product_image_usage(items)
+
+    assert total.total_token_count == 20
+    assert total.cost_usd == pytest.approx(0.03)
+    assert total.hedge_request_count == 1
+    assert total is not items[0].usage and total is not items[2].usage
+    assert [item.model_dump() for item in items] == before
+    assert await service.sum_product_image_usage([items[1]]) is None
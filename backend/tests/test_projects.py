@@ -9,15 +9,17 @@ from uuid import UUID
 from datetime import datetime
 from fast_api import app
 from db.session import get_db
-from core.deps import get_current_user
+from core.deps import get_current_claims, get_current_user
+from schemas.auth import TokenClaims
 from models.user import User
 from models.project import Project
 
 
 class MockResult:
-    def __init__(self, scalar=None, items=None):
+    def __init__(self, scalar=None, items=None, rows=None):
         self._scalar = scalar
         self._items = items or []
+        self._rows = rows or []
 
     def scalar_one_or_none(self):
         return self._scalar
@@ -27,6 +29,11 @@ class MockResult:
         mock_scalars.all = MagicMock(return_value=self._items)
         return mock_scalars
 
+    def mappings(self):
+        mock_mappings = MagicMock()
+        mock_mappings.all = MagicMock(return_value=self._rows)
+        return mock_mappings
+
 
 @pytest.fixture
 def mock_db():
@@ -75,6 +82,7 @@ def setup_overrides(mock_db, mock_user):
 
     app.dependency_overrides[get_db] = _get_db_override
     app.dependency_overrides[get_current_user] = _get_user_override
+    app.dependency_overrides[get_current_claims] = lambda: TokenClaims(user_id=mock_user.id)
     yield
     app.dependency_overrides.clear()
 
@@ -82,8 +90,22 @@ def setup_overrides(mock_db, mock_user):
 client = TestClient(app)
 
 
-def test_create_project():
+def test_create_project(mock_db):
     """POST /api/v1/projects - 프로젝트 생성"""
+    created = Project(
+        id=UUID("323e4567-e89b-12d3-a456-426614174000"),
+        user_id=UUID("123e4567-e89b-12d3-a456-426614174000"),
+        collection_id=UUID("223e4567-e89b-12d3-a456-426614174000"),
+        name="My Project",
+        selected_image_number=0,
+        total_image_number=0,
+        total_video_number=0,
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+    # INSERT ... ON CONFLICT DO NOTHING RETURNING이 새 행을 반환
+    mock_db.execute.return_value = MockResult(scalar=created)
+
     response = client.post(
         "/api/v1/projects",
         json={
@@ -127,15 +149,8 @@ def test_get_projects_by_collection():
 
 def test_create_project_duplicate_name(mock_db):
     """POST /api/v1/projects - 동일 사용자 내 중복 이름이면 400"""
-    existing = Project(
-        id=UUID("423e4567-e89b-12d3-a456-426614174000"),
-        user_id=UUID("123e4567-e89b-12d3-a456-426614174000"),
-        collection_id=UUID("223e4567-e89b-12d3-a456-426614174000"),
-        name="My Project",
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
-    )
-    mock_db.execute.return_value = MockResult(scalar=existing)
+    # 유니크 인덱스 충돌로 RETURNING 행 없음
+    mock_db.execute.return_value = MockResult(scalar=None)
 
     response = client.post(
         "/api/v1/projects",
@@ -0,0 +1,81 @@
+"""
+프롬프트 조립 캐시 테스트
+"""
+from core.litellm_hander.schema import ClothesOptions, ModelOptions
+from prompts.prompt_cache import PromptCache, prompt_cache_stats
+from prompts.style_cut_prompts import assemble_style_cut_prompt
+from prompts.vto_model_prompts import assemble_model_prompt
+from prompts.vto_prompts import assemble_prompt
+
+
+def test_assemble_model_prompt_is_memoized():
+    """같은 옵션(새로 만든 모델 객체 포함)이면 조립 결과를 재사용"""
+    cache = assemble_model_prompt.prompt_cache
+    cache.clear()
+    hits = cache.hits
+
+    first = assemble_model_prompt(
+        type="front",
+        model_options=ModelOptions(gender="woman", age="young"),
+        clothes_options=ClothesOptions(main_category="tops", sub_category="hoodie"),
+    )
+    second = assemble_model_prompt(
+        "front",
+        ModelOptions(gender="woman", age="young"),
+        ClothesOptions(main_category="tops", sub_category="hoodie"),
+    )
+    other = assemble_model_prompt(type="back", model_options=ModelOptions(gender="woman", age="young"))
+
+    assert first is second
+    assert other != first
+    assert cache.hits == hits + 1
+
+    stats = {s.name: s for s in prompt_cache_stats()}
+    for builder in (assemble_prompt, assemble_model_prompt, assemble_style_cut_prompt):
+        assert builder.__name__ in stats
+    assert stats["assemble_model_prompt"].version == assemble_model_prompt.prompt_version()
+
+
+def test_prompt_cache_lru_eviction():
+    """max_size를 넘으면 가장 오래 사용하지 않은 항목부터 제거"""
+    calls = []
+
+    def build(value: str) -> str:
+        calls.append(value)
+        return f"prompt:{value}"
+
+    cache = PromptCache(build, max_size=2)
+    cache("a")
+    cache("b")
+    cache("a")
+    cache("c")  # b 제거
+    cache("a")
+    cache("b")
+
+    assert calls == ["a", "b", "c", "b"]
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (2, 4, 2, 2)
+
+
+def test_prompt_version_uses_rendered_text():
+    """버전 해시는 조립 결과 기준 - 같은 결과를 내는 조립 함수는 버전이 같고, 결과가 바뀌면 달라짐"""
+    def build(value: str = "a") -> str:
+        # 주석/공백만 다른 함수와 같은 버전
+        return f"prompt:{value}"
+
+    def build_reformatted(value: str = "a") -> str:
+        return   f"prompt:{value}"
+
+    def build_changed(value: str = "a") -> str:
+        return f"prompt v2:{value}"
+
+    # 이름이 버전에 포함되므로 같은 이름으로 비교
+    build_reformatted.__name__ = build_changed.__name__ = "build"
+    versions = [
+        PromptCache(builder, max_size=1, version_samples=[{"value": "a"}, {"value": "b"}]).version
+        for builder in (build, build_reformatted, build_changed)
+    ]
+
+    assert versions[0] == versions[1]
+    assert versions[0] != versions[2]
+    assert len(assemble_prompt.prompt_version()) == 64
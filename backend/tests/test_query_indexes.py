@@ -0,0 +1,213 @@
+"""
+쿼리-인덱스 회귀 테스트
+- API가 실제로 실행하는 SELECT를 Mock DB로 캡처해 모델에 선언된 부분 인덱스로 처리 가능한지 확인
+  (WHERE 등치 컬럼이 인덱스 앞부분, 이어서 ORDER BY 컬럼/방향 일치, 인덱스 WHERE 조건을 쿼리가 포함)
+- 생성 API의 INSERT ... ON CONFLICT 대상이 부분 유니크 인덱스와 일치하는지 확인
+- TEST_DATABASE_URL(마이그레이션이 적용된 PostgreSQL)이 있으면 EXPLAIN 실행 계획에서 인덱스 사용까지 확인
+"""
+import os
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList, ColumnClause, UnaryExpression
+from fast_api import app
+from db.session import Base, get_db
+from core.deps import get_current_claims, get_current_user
+from schemas.auth import TokenClaims
+from services.organization_service import get_or_create_organization
+import models.collection  # noqa: F401 (메타데이터 등록)
+import models.organization  # noqa: F401
+import models.project  # noqa: F401
+
+USER_ID = UUID("123e4567-e89b-12d3-a456-426614174000")
+COLLECTION_ID = "223e4567-e89b-12d3-a456-426614174000"
+
+
+class MockResult:
+    def __init__(self, scalar=None):
+        self._scalar = scalar
+
+    def scalar_one_or_none(self):
+        return self._scalar
+
+    def scalar_one(self):
+        return self._scalar
+
+    def mappings(self):
+        mock_mappings = MagicMock()
+        mock_mappings.all = MagicMock(return_value=[])
+        return mock_mappings
+
+
+@pytest.fixture
+def mock_db():
+    db = AsyncMock()
+    db.add = MagicMock()
+    # INSERT ... ON CONFLICT DO NOTHING이 행을 반환하지 않은 것처럼 응답 (이름 충돌 → 400)
+    db.execute = AsyncMock(return_value=MockResult())
+    return db
+
+
+@pytest.fixture(autouse=True)
+def setup_overrides(mock_db):
+    async def _get_db_override():
+        yield mock_db
+
+    def _get_user_override():
+        user = MagicMock()
+        user.id = USER_ID
+        return user
+
+    app.dependency_overrides[get_db] = _get_db_override
+    app.dependency_overrides[get_current_user] = _get_user_override
+    app.dependency_overrides[get_current_claims] = lambda: TokenClaims(user_id=USER_ID)
+    yield
+    app.dependency_overrides.clear()
+
+
+client = TestClient(app)
+
+
+def _flatten(clause):
+    if clause is None:
+        return []
+    if isinstance(clause, BooleanClauseList) and clause.operator is operators.and_:
+        return [item for child in clause.clauses for item in _flatten(child)]
+    return [clause]
+
+
+def _predicates(clause):
+    """AND로 묶인 조건에서 (등치 컬럼, IS NULL 컬럼) 이름 집합 추출"""
+    equal, is_null = set(), set()
+    for item in _flatten(clause):
+        if isinstance(item, BinaryExpression) and isinstance(item.left, ColumnClause):
+            if item.operator is operators.eq:
+                equal.add(item.left.name)
+            elif item.operator is operators.is_:
+                is_null.add(item.left.name)
+    return equal, is_null
+
+
+def _sort_key(expression):
+    if isinstance(expression, UnaryExpression):
+        return expression.element.name, expression.modifier is operators.desc_op
+    return expression.name, False
+
+
+def _usable_indexes(statement):
+    """statement의 WHERE/ORDER BY를 그대로 처리할 수 있는 인덱스 이름 집합"""
+    table = statement.get_final_froms()[0]
+    equal, is_null = _predicates(statement.whereclause)
+    order_by = [_sort_key(clause) for clause in statement._order_by_clauses]
+    reversed_order = [(name, not desc) for name, desc in order_by]
+
+    usable = set()
+    for index in Base.metadata.tables[table.name].indexes:
+        _, index_is_null = _predicates(index.dialect_options["postgresql"]["where"])
+        if not index_is_null <= is_null:
+            continue
+        keys = [_sort_key(expression) for expression in index.expressions]
+        prefix = 0
+        while prefix < len(keys) and keys[prefix][0] in equal:
+            prefix += 1
+        rest = keys[prefix:]
+        if order_by:
+            if rest[: len(order_by)] in (order_by, reversed_order):
+                usable.add(index.name)
+        elif prefix > 0:
+            usable.add(index.name)
+    return usable
+
+
+def _conflict_indexes(statement):
+    """INSERT ... ON CONFLICT 대상(컬럼 + WHERE)으로 추론되는 유니크 인덱스 이름 집합"""
+    on_conflict = statement._post_values_clause
+    target = {column.name for column in on_conflict.inferred_target_elements}
+    _, is_null = _predicates(on_conflict.inferred_target_whereclause)
+
+    inferred = set()
+    for index in Base.metadata.tables[statement.table.name].indexes:
+        _, index_is_null = _predicates(index.dialect_options["postgresql"]["where"])
+        if index.unique and {column.name for column in index.columns} == target and index_is_null <= is_null:
+            inferred.add(index.name)
+    return inferred
+
+
+def _captured_statement(mock_db):
+    return mock_db.execute.await_args_list[0].args[0]
+
+
+LIST_CASES = [
+    ("/api/v1/collections", "ix_collections_user_id_created_at"),
+    ("/api/v1/projects", "ix_projects_user_id_created_at"),
+    (f"/api/v1/projects?collection_id={COLLECTION_ID}", "ix_projects_collection_id_created_at"),
+    ("/api/v1/organizations", "ix_organizations_created_at"),
+]
+
+CREATE_CASES = [
+    ("/api/v1/collections", {"name": "My Collection"}, "uq_collections_user_id_name"),
+    ("/api/v1/projects", {"collection_id": COLLECTION_ID, "name": "My Project"}, "uq_projects_user_id_name"),
+    ("/api/v1/organizations", {"name": "Buzzni"}, "uq_organizations_name"),
+]
+
+
+@pytest.mark.parametrize("path, index_name", LIST_CASES)
+def test_list_query_uses_partial_index(mock_db, path, index_name):
+    """GET 목록 - (등치 조건, created_at DESC, id DESC) 키셋 정렬이 부분 인덱스 순서와 일치"""
+    mock_db.execute.return_value = MockResult()
+
+    assert client.get(path).status_code == 200
+    assert index_name in _usable_indexes(_captured_statement(mock_db))
+
+
+@pytest.mark.parametrize("path, body, index_name", CREATE_CASES)
+def test_create_conflict_target_matches_unique_index(mock_db, path, body, index_name):
+    """POST 생성 - ON CONFLICT 대상이 부분 유니크 인덱스, 충돌(반환 행 없음)은 400"""
+    assert client.post(path, json=body).status_code == 400
+    assert mock_db.execute.await_count == 1
+    assert _conflict_indexes(_captured_statement(mock_db)) == {index_name}
+
+
+async def test_get_or_create_organization_single_statement(mock_db):
+    """get_or_create_organization - 조회/생성을 ON CONFLICT DO UPDATE 한 문장으로 처리"""
+    mock_db.execute.return_value = MockResult(scalar=MagicMock())
+
+    await get_or_create_organization(mock_db, "Buzzni")
+
+    assert mock_db.execute.await_count == 1
+    assert _conflict_indexes(_captured_statement(mock_db)) == {"uq_organizations_name"}
+
+
+@pytest.mark.skipif(not os.getenv("TEST_DATABASE_URL"), reason="TEST_DATABASE_URL not set")
+async def test_explain_uses_partial_index(mock_db):
+    """실제 PostgreSQL EXPLAIN - 캡처한 쿼리의 실행 계획이 기대한 인덱스를 사용"""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    statements = []
+    mock_db.execute.return_value = MockResult()
+    for path, index_name in LIST_CASES:
+        mock_db.execute.reset_mock()
+        client.get(path)
+        statements.append((_captured_statement(mock_db), index_name))
+    # INSERT는 EXPLAIN에 "Conflict Arbiter Indexes"로 ON CONFLICT 대상 인덱스가 표시됨
+    for path, body, index_name in CREATE_CASES:
+        mock_db.execute.reset_mock()
+        client.post(path, json=body)
+        statements.append((_captured_statement(mock_db), index_name))
+
+    engine = create_async_engine(os.environ["TEST_DATABASE_URL"])
+    try:
+        async with engine.connect() as connection:
+            # 테스트 DB는 행이 적어 순차 스캔이 선택되므로 인덱스 사용 가능 여부만 확인
+            await connection.execute(text("SET enable_seqscan = off"))
+            for statement, index_name in statements:
+                sql = statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+                result = await connection.execute(text(f"EXPLAIN {sql}"))
+                plan = "\n".join(row[0] for row in result)
+                assert index_name in plan, plan
+    finally:
+        await engine.dispose()
@@ -0,0 +1,88 @@
+"""
+ImageResultCache 테스트
+- 엔드포인트가 아닌 생성 이미지 결과 캐시 테스트 (임시 디렉토리, 네트워크 호출 없음)
+- 캐시 적중 시 비용은 gemini_image_inference를 가짜 구현으로 대체해 확인
+"""
+import os
+from types import SimpleNamespace
+import pytest
+from core.litellm_hander.schema import LiteLLMUsageData
+from core.vto_service import gemini_handler, result_cache
+from core.vto_service.gemini_handler import GeminiProcesser
+from core.vto_service.result_cache import ImageResultCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """result_cache 모듈이 보는 time.time()을 수동으로 진행하는 시계"""
+    now = [1000.0]
+    monkeypatch.setattr(result_cache, "time", SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+async def test_expired_entry_is_removed(tmp_path, clock):
+    """TTL이 지난 항목은 조회 시 None을 반환하고 파일도 제거"""
+    cache = ImageResultCache(str(tmp_path), max_bytes=1024, ttl_seconds=60)
+    await cache.set("a" * 64, b"image")
+
+    clock[0] += 59
+    assert await cache.get("a" * 64) == b"image"
+
+    clock[0] += 2
+    assert await cache.get("a" * 64) is None
+    assert not os.path.exists(cache._path("a" * 64))
+
+
+async def test_lru_eviction_by_size(tmp_path, clock):
+    """전체 크기가 max_bytes를 넘으면 가장 오래 조회되지 않은 항목부터 제거"""
+    cache = ImageResultCache(str(tmp_path), max_bytes=10, ttl_seconds=3600)
+    first, second, third = "1" * 64, "2" * 64, "3" * 64
+
+    await cache.set(first, b"aaaa")
+    clock[0] += 1
+    await cache.set(second, b"bbbb")
+    clock[0] += 1
+    assert await cache.get(first) == b"aaaa"
+    clock[0] += 1
+    await cache.set(third, b"cccc")
+
+    assert await cache.get(second) is None
+    assert not os.path.exists(cache._path(second))
+    assert await cache.get(first) == b"aaaa"
+    assert await cache.get(third) == b"cccc"
+
+
+class FakeProcesser(GeminiProcesser):
+    """호출 수를 세고 샘플마다 고정 비용을 반환"""
+
+    def __init__(self):
+        super().__init__(verbose=False)
+        self.calls = 0
+
+    async def gemini_image_inference(self, contents, temperature=1.0, top_p=0.95, aspect_ratio="1:1",
+                                     caller_id=None, deadline=None):
+        self.calls += 1
+        return f"image-{self.calls}".encode(), LiteLLMUsageData(
+            total_token_count=10, prompt_token_count=10, candidates_token_count=0,
+            output_token_count=0, model_name="mock", cost_usd=0.01, cost_krw=10,
+        )
+
+
+async def test_cache_hit_has_zero_cost(tmp_path, monkeypatch):
+    """execute_image_inference - 캐시 적중 샘플은 모델을 호출하지 않고 비용 0으로 같은 이미지를 반환"""
+    cache = ImageResultCache(str(tmp_path), max_bytes=1024, ttl_seconds=3600)
+    monkeypatch.setattr(gemini_handler, "get_result_cache", lambda: cache)
+    monkeypatch.setattr(gemini_handler.settings, "gemini_file_upload_enabled", False)
+    processer = FakeProcesser()
+
+    first = await processer.execute_image_inference(["prompt"], 2, 1.0, use_cache=True)
+    second = await processer.execute_image_inference(["prompt"], 2, 1.0, use_cache=True)
+
+    assert processer.calls == 2
+    assert first["usage"].cost_usd == 0.02
+    assert first["debug_info"]["cache_hit_count"] == 0
+    assert second["response"] == first["response"]
+    assert second["debug_info"]["cache_hit_count"] == 2
+    assert second["usage"].cost_usd == 0
+    assert second["usage"].cost_krw == 0
+    assert second["usage"].total_token_count == 0
@@ -99,3 +99,37 @@ def test_delete_me():
     assert response.status_code == 200
     data = response.json()
     assert data["message"] == "User deleted successfully"
+
+
+class MockUserResult:
+    def __init__(self, user):
+        self._user = user
+
+    def scalar_one_or_none(self):
+        return self._user
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_cache():
+    """get_current_user - 같은 토큰은 DB 조회 없이 캐시 사용, invalidate_user 후 다시 조회"""
+    from fastapi.security import HTTPAuthorizationCredentials
+    from core.security import create_access_token, user_token_claims
+    from core.user_cache import get_user_cache, invalidate_user
+
+    # test_delete_me가 남긴 tombstone 제거
+    get_user_cache().clear()
+    user = get_mock_user()
+    credentials = HTTPAuthorizationCredentials(
+        scheme="Bearer", credentials=create_access_token(data=user_token_claims(user))
+    )
+    mock_db = MagicMock()
+    mock_db.execute = AsyncMock(return_value=MockUserResult(user))
+
+    first = await get_current_user(credentials, mock_db)
+    cached = await get_current_user(credentials, mock_db)
+    assert mock_db.execute.await_count == 1
+    assert cached.id == first.id and cached.email == "test@example.com"
+
+    invalidate_user(user.id)
+    await get_current_user(credentials, mock_db)
+    assert mock_db.execute.await_count == 2
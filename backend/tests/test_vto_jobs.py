@@ -0,0 +1,286 @@
+"""
+VTO Jobs API 테스트
+- Mocking을 사용한 I/O 중심 테스트
+"""
+import asyncio
+import base64
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+from datetime import datetime
+from fast_api import app
+from db.session import get_db
+from core.deps import get_current_user
+from models.user import User
+from models.vto_job import VtoJob
+from services import vto_job_service
+
+
+USER_ID = UUID("123e4567-e89b-12d3-a456-426614174000")
+JOB_ID = "523e4567-e89b-12d3-a456-426614174000"
+IMAGE_B64 = base64.b64encode(b"fake-image-bytes").decode("ascii")
+
+
+class MockResult:
+    def __init__(self, scalar=None, items=None):
+        self._scalar = scalar
+        self._items = items or []
+
+    def scalar_one_or_none(self):
+        return self._scalar
+
+    def scalars(self):
+        mock_scalars = MagicMock()
+        mock_scalars.all = MagicMock(return_value=self._items)
+        return mock_scalars
+
+
+def make_job(status="PENDING", **kwargs):
+    return VtoJob(
+        id=UUID(JOB_ID),
+        user_id=USER_ID,
+        project_id=None,
+        status=status,
+        prompt="prompt",
+        input_images=[IMAGE_B64],
+        image_count=2,
+        temperature=1.0,
+        top_p=0.95,
+        aspect_ratio="1:1",
+        completed_count=kwargs.pop("completed_count", 0),
+        success_count=kwargs.pop("success_count", 0),
+        queued_at=datetime.utcnow(),
+        **kwargs
+    )
+
+
+@pytest.fixture
+def mock_db():
+    mock_db = AsyncMock()
+    mock_db.add = MagicMock()
+    mock_db.commit = AsyncMock()
+    mock_db.execute = AsyncMock(return_value=MockResult())
+
+    def mock_refresh(obj):
+        obj.id = UUID(JOB_ID)
+        obj.queued_at = datetime.utcnow()
+
+    mock_db.refresh = AsyncMock(side_effect=mock_refresh)
+    return mock_db
+
+
+@pytest.fixture
+def mock_user():
+    return User(
+        id=USER_ID,
+        email="test@example.com",
+        name="John",
+        language="ko",
+        user_type="user",
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+
+
+@pytest.fixture(autouse=True)
+def setup_overrides(mock_db, mock_user):
+    async def _get_db_override():
+        yield mock_db
+
+    def _get_user_override():
+        return mock_user
+
+    app.dependency_overrides[get_db] = _get_db_override
+    app.dependency_overrides[get_current_user] = _get_user_override
+    yield
+    app.dependency_overrides.clear()
+
+
+client = TestClient(app)
+
+
+def test_create_vto_job():
+    """POST /api/v1/vto-jobs - 생성 작업 등록 (즉시 job id 반환)"""
+    response = client.post(
+        "/api/v1/vto-jobs",
+        json={"prompt": "wear this", "images": [IMAGE_B64], "image_count": 2}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["id"] == JOB_ID
+    assert response.json()["status"] == "PENDING"
+    assert response.json()["completed_count"] == 0
+
+
+def test_create_vto_job_invalid_image():
+    """POST /api/v1/vto-jobs - base64가 아닌 이미지면 400"""
+    response = client.post(
+        "/api/v1/vto-jobs",
+        json={"prompt": "wear this", "images": ["not base64!"]}
+    )
+
+    assert response.status_code == 400
+
+
+def test_get_vto_job(mock_db):
+    """GET /api/v1/vto-jobs/{id} - 작업 상태/진행 상황 조회"""
+    mock_db.execute.return_value = MockResult(scalar=make_job("RUNNING", completed_count=1, success_count=1))
+
+    response = client.get(f"/api/v1/vto-jobs/{JOB_ID}")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "RUNNING"
+    assert response.json()["completed_count"] == 1
+
+
+def test_get_vto_job_result(mock_db):
+    """GET /api/v1/vto-jobs/{id}/result - 완료된 작업 결과 조회"""
+    mock_db.execute.return_value = MockResult(scalar=make_job(
+        "SUCCEEDED",
+        completed_count=2,
+        success_count=1,
+        result_images=[IMAGE_B64, None],
+        usage={"cost_usd": 0.04},
+    ))
+
+    response = client.get(f"/api/v1/vto-jobs/{JOB_ID}/result")
+
+    assert response.status_code == 200
+    assert response.json()["images"] == [IMAGE_B64, None]
+    assert response.json()["usage"]["cost_usd"] == 0.04
+
+
+def test_get_vto_job_result_not_finished(mock_db):
+    """GET /api/v1/vto-jobs/{id}/result - 아직 실행 중이면 400"""
+    mock_db.execute.return_value = MockResult(scalar=make_job("RUNNING"))
+
+    response = client.get(f"/api/v1/vto-jobs/{JOB_ID}/result")
+
+    assert response.status_code == 400
+
+
+def test_get_vto_jobs():
+    """GET /api/v1/vto-jobs - 작업 목록 조회"""
+    response = client.get("/api/v1/vto-jobs")
+
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
+
+
+def test_stream_vto_job_events(mock_db):
+    """GET /api/v1/vto-jobs/{id}/events - 완료된 이미지를 SSE로 전달"""
+    mock_db.execute.return_value = MockResult(scalar=make_job(
+        "SUCCEEDED",
+        completed_count=2,
+        success_count=1,
+        result_images=[None, IMAGE_B64],
+        usage={"cost_usd": 0.04},
+    ))
+
+    response = client.get(f"/api/v1/vto-jobs/{JOB_ID}/events")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [block for block in response.text.split("\n\n") if block]
+    assert events[0].startswith("event: image")
+    assert '"index": 1' in events[0]
+    assert events[-1].startswith("event: done")
+
+
+class _FakeProcesser:
+    """샘플 2개를 바로 성공으로 반환하는 GeminiProcesser 대체"""
+
+    async def create_image_content(self, image_bytes):
+        return image_bytes
+
+    async def stream_image_inference(self, contents, image_count, *args, **kwargs):
+        for index in range(image_count):
+            yield {"index": index, "image": b"generated", "usage": None}
+
+    async def calculate_vto_cost(self, response):
+        return MagicMock(model_dump=MagicMock(return_value={}))
+
+
+def _worker_session(monkeypatch, rowcounts):
+    """process_job이 여는 세션을 대체 (UPDATE마다 rowcounts 순서대로 반영 행 수 반환)"""
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=[MagicMock(rowcount=count) for count in rowcounts])
+    session.__aenter__.return_value = session
+    monkeypatch.setattr(vto_job_service, "AsyncSessionLocal", MagicMock(return_value=session))
+    return session
+
+
+def _running_job():
+    job = make_job("RUNNING", worker="host:1:0", attempts=2)
+    job.project_id = UUID("623e4567-e89b-12d3-a456-426614174000")
+    return job
+
+
+async def test_process_job_updates_are_owner_guarded(monkeypatch):
+    """process_job - 모든 UPDATE는 worker/attempts/RUNNING 조건, 최종 상태 반영 후 프로젝트 카운터 증가"""
+    session = _worker_session(monkeypatch, [1, 1, 1, 1])
+
+    await vto_job_service.process_job(_running_job(), _FakeProcesser())
+
+    statements = [call.args[0] for call in session.execute.await_args_list]
+    assert [statement.table.name for statement in statements] == ["vto_jobs"] * 3 + ["projects"]
+    for statement in statements[:3]:
+        where = str(statement.whereclause)
+        assert "vto_jobs.worker" in where and "vto_jobs.attempts" in where and "vto_jobs.status" in where
+    assert statements[2].compile().params["status"] == "SUCCEEDED"
+
+
+async def test_process_job_lost_ownership_skips_project(monkeypatch):
+    """process_job - 최종 상태 UPDATE가 반영되지 않으면(다른 워커가 재선점) 프로젝트 카운터를 올리지 않음"""
+    session = _worker_session(monkeypatch, [1, 1, 0])
+
+    await vto_job_service.process_job(_running_job(), _FakeProcesser())
+
+    assert session.execute.await_count == 3
+    session.rollback.assert_awaited_once()
+
+
+async def test_requeue_stale_jobs_uses_heartbeat(mock_db):
+    """requeue_stale_jobs - started_at이 아니라 하트비트(updated_at) 기준으로 stale 판단"""
+    await vto_job_service.requeue_stale_jobs(mock_db, stale_seconds=600, max_attempts=3)
+
+    where = str(mock_db.execute.await_args.args[0].whereclause)
+    assert "vto_jobs.updated_at" in where
+
+
+async def test_process_job_survives_failure_update_error(monkeypatch):
+    """process_job - 실패 기록 UPDATE까지 실패해도 예외를 워커로 전파하지 않음"""
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=RuntimeError("db down"))
+    session.__aenter__.return_value = session
+    monkeypatch.setattr(vto_job_service, "AsyncSessionLocal", MagicMock(return_value=session))
+    processer = _FakeProcesser()
+    processer.create_image_content = AsyncMock(side_effect=ValueError("bad image"))
+
+    await vto_job_service.process_job(_running_job(), processer)
+
+    session.execute.assert_awaited_once()
+
+
+async def test_worker_continues_after_process_error(monkeypatch):
+    """VtoJobWorkerPool - process_job이 예외를 던져도 워커가 다음 작업을 계속 처리"""
+    pool = vto_job_service.VtoJobWorkerPool(worker_count=1, poll_interval=0.01)
+    jobs = [_running_job(), _running_job()]
+    processed = []
+
+    async def claim_next_job(worker_name):
+        return jobs.pop() if jobs else None
+
+    async def process_job(job, processer):
+        processed.append(job)
+        if len(processed) == 1:
+            raise RuntimeError("db down")
+        pool._stopping.set()
+
+    monkeypatch.setattr(vto_job_service, "claim_next_job", claim_next_job)
+    monkeypatch.setattr(vto_job_service, "process_job", process_job)
+
+    await asyncio.wait_for(pool._run("worker"), timeout=2)
+
+    assert len(processed) == 2